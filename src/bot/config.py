@@ -9,14 +9,25 @@ variables using Pydantic Settings. It supports multiple environments
 import logging
 import os
 from datetime import timedelta
-from functools import lru_cache
+from functools import cached_property
 from pathlib import Path
+from typing import Any, NoReturn
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 logger = logging.getLogger(__name__)
 
 
+# Read once at import so every consumer sees the same environment for the whole run
+_BOT_ENV = os.getenv("BOT_ENV", "production")
+
+_ENV_FILES = {
+    "production": ".env",
+    "staging": ".env.staging",
+}
+
+
 def get_env_file() -> str | None:
     """
     Determine which .env file to load based on BOT_ENV environment variable.
@@ -26,21 +37,19 @@ def get_env_file() -> str | None:
             - "production" or default -> ".env" (if exists)
             - "staging" -> ".env.staging" (if exists)
     """
-    env = os.getenv("BOT_ENV", "production")
-    env_files = {
-        "production": ".env",
-        "staging": ".env.staging",
-    }
-    env_file = env_files.get(env, ".env")
-    
+    env_file = _ENV_FILES.get(_BOT_ENV, ".env")
+
     # Return path only if file exists, otherwise return None
     # Pydantic will load from environment variables if no .env file
     if Path(env_file).exists():
-        logger.debug(f"Loading configuration from: {env_file}")
+        logger.debug("Loading configuration from: %s", env_file)
         return env_file
-    else:
-        logger.debug(f"No .env file found at {env_file}, loading from environment variables")
-        return None
+    logger.debug("No .env file found at %s, loading from environment variables", env_file)
+    return None
+
+
+# Resolved once at import so the filesystem is only probed a single time
+_ENV_FILE = get_env_file()
 
 
 class Settings(BaseSettings):
@@ -65,6 +74,12 @@ class Settings(BaseSettings):
         logfire_environment: Environment name (production/staging).
         logfire_enabled: Enable/disable Logfire logging.
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
+        use_webhook: Receive updates via webhook instead of long polling.
+        webhook_url: Public HTTPS base URL Telegram should post updates to.
+        webhook_listen: Address the webhook server binds to.
+        webhook_port: Port the webhook server listens on.
+        webhook_secret_token: Secret Telegram sends with each webhook request
+            (required when use_webhook is enabled).
     """
 
     telegram_bot_token: str
@@ -85,14 +100,58 @@ class Settings(BaseSettings):
     logfire_environment: str = "production"
     logfire_enabled: bool = True
     log_level: str = "INFO"
+    use_webhook: bool = False
+    webhook_url: str | None = None
+    webhook_listen: str = "0.0.0.0"
+    webhook_port: int = 8443
+    webhook_secret_token: str | None = None
 
     model_config = SettingsConfigDict(
-        env_file=get_env_file(),
+        env_file=_ENV_FILE,
         env_file_encoding="utf-8",
+        frozen=True,
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def _resolve_logfire_environment(cls, data: Any) -> Any:
+        """Set logfire_environment based on BOT_ENV if not explicitly set."""
+        if isinstance(data, dict) and _BOT_ENV == "staging":
+            if data.get("logfire_environment", "production") == "production":
+                data["logfire_environment"] = "staging"
+        return data
+
     def model_post_init(self, __context):
         """Validate and log non-sensitive configuration values after initialization."""
+        if (
+            self.group_id >= 0
+            or self.warning_threshold <= 0
+            or self.new_user_probation_hours < 0
+            or not (10 <= self.captcha_timeout_seconds <= 600)
+            or self.warning_time_threshold_minutes <= 0
+            or (self.use_webhook and not (self.webhook_url and self.webhook_secret_token))
+        ):
+            self._raise_validation_error()
+
+        logger.info("Configuration loaded successfully")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"group_id: {self.group_id}")
+            logger.debug(f"warning_topic_id: {self.warning_topic_id}")
+            logger.debug(f"restrict_failed_users: {self.restrict_failed_users}")
+            logger.debug(f"warning_threshold: {self.warning_threshold}")
+            logger.debug(f"warning_time_threshold_minutes: {self.warning_time_threshold_minutes}")
+            logger.debug(f"database_path: {self.database_path}")
+            logger.debug(f"captcha_enabled: {self.captcha_enabled}")
+            logger.debug(f"captcha_timeout_seconds: {self.captcha_timeout_seconds}")
+            logger.debug(f"new_user_probation_hours: {self.new_user_probation_hours}")
+            logger.debug(f"new_user_violation_threshold: {self.new_user_violation_threshold}")
+            logger.debug(f"telegram_bot_token: {'***' + self.telegram_bot_token[-4:]}")  # Mask sensitive token
+            logger.debug(f"logfire_enabled: {self.logfire_enabled}")
+            logger.debug(f"logfire_environment: {self.logfire_environment}")
+            logger.debug(f"use_webhook: {self.use_webhook}")
+
+    def _raise_validation_error(self) -> NoReturn:
+        """Raise a ValueError describing the first invalid field."""
         if self.group_id >= 0:
             raise ValueError("group_id must be negative (Telegram supergroup IDs are negative)")
         if self.warning_threshold <= 0:
@@ -101,51 +160,46 @@ class Settings(BaseSettings):
             raise ValueError("new_user_probation_hours must be >= 0")
         if not (10 <= self.captcha_timeout_seconds <= 600):
             raise ValueError("captcha_timeout_seconds must be between 10 and 600 seconds")
-        if self.warning_time_threshold_minutes <= 0:
-            raise ValueError("warning_time_threshold_minutes must be greater than 0")
-
-        # Set logfire_environment based on BOT_ENV if not explicitly set
-        env = os.getenv("BOT_ENV", "production")
-        if self.logfire_environment == "production" and env == "staging":
-            self.logfire_environment = "staging"
-        
-        logger.info("Configuration loaded successfully")
-        logger.debug(f"group_id: {self.group_id}")
-        logger.debug(f"warning_topic_id: {self.warning_topic_id}")
-        logger.debug(f"restrict_failed_users: {self.restrict_failed_users}")
-        logger.debug(f"warning_threshold: {self.warning_threshold}")
-        logger.debug(f"warning_time_threshold_minutes: {self.warning_time_threshold_minutes}")
-        logger.debug(f"database_path: {self.database_path}")
-        logger.debug(f"captcha_enabled: {self.captcha_enabled}")
-        logger.debug(f"captcha_timeout_seconds: {self.captcha_timeout_seconds}")
-        logger.debug(f"new_user_probation_hours: {self.new_user_probation_hours}")
-        logger.debug(f"new_user_violation_threshold: {self.new_user_violation_threshold}")
-        logger.debug(f"telegram_bot_token: {'***' + self.telegram_bot_token[-4:]}")  # Mask sensitive token
-        logger.debug(f"logfire_enabled: {self.logfire_enabled}")
-        logger.debug(f"logfire_environment: {self.logfire_environment}")
-
-    @property
+        if self.use_webhook and not self.webhook_url:
+            raise ValueError("webhook_url is required when use_webhook is enabled")
+        if self.use_webhook and not self.webhook_secret_token:
+            raise ValueError("webhook_secret_token is required when use_webhook is enabled")
+        raise ValueError("warning_time_threshold_minutes must be greater than 0")
+
+    @cached_property
     def probation_timedelta(self) -> timedelta:
         return timedelta(hours=self.new_user_probation_hours)
 
-    @property
+    @cached_property
     def warning_time_threshold_timedelta(self) -> timedelta:
         return timedelta(minutes=self.warning_time_threshold_minutes)
 
-    @property
+    @cached_property
     def captcha_timeout_timedelta(self) -> timedelta:
         return timedelta(seconds=self.captcha_timeout_seconds)
 
 
-@lru_cache
+# Module-level singleton
+_settings: Settings | None = None
+
+
 def get_settings() -> Settings:
     """
     Get cached application settings.
 
-    Settings are loaded once and cached for subsequent calls.
-    Use lru_cache to avoid re-reading environment on every access.
+    Settings are loaded once on first call and reused for subsequent calls,
+    avoiding re-reading the environment on every access.
 
     Returns:
         Settings: Application configuration instance.
     """
-    return Settings()
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
+
+
+def reset_settings() -> None:
+    """Reset the settings singleton (for testing)."""
+    global _settings
+    _settings = None
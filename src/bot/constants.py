@@ -2,33 +2,27 @@
 Application constants for the PythonID bot.
 
 This module contains shared constants used across multiple bot modules,
-including permissions, message templates, and formatting utilities.
+including message templates, URL whitelists, and formatting utilities.
+It deliberately does not import python-telegram-bot; chat permission
+presets live in bot.permissions.
 """
 
-from telegram import ChatPermissions
-
-# Permissions applied when restricting a user (effectively mutes them)
-RESTRICTED_PERMISSIONS = ChatPermissions(
-    can_send_messages=False,
-    can_send_audios=False,
-    can_send_documents=False,
-    can_send_photos=False,
-    can_send_videos=False,
-    can_send_video_notes=False,
-    can_send_voice_notes=False,
-    can_send_polls=False,
-    can_send_other_messages=False,
-    can_add_web_page_previews=False,
-    can_change_info=False,
-    can_invite_users=False,
-    can_pin_messages=False,
-    can_manage_topics=False,
-)
+from functools import cache, lru_cache
 
 # Missing items separator for Indonesian language
 MISSING_ITEMS_SEPARATOR = " dan "
 
+# Missing profile items text, indexed by ProfileCheckResult.missing_mask
+# (bit 0 = profile photo missing, bit 1 = username missing)
+MISSING_ITEMS_TEXTS = (
+    "",
+    "foto profil publik",
+    "username",
+    MISSING_ITEMS_SEPARATOR.join(("foto profil publik", "username")),
+)
+
 
+@lru_cache(maxsize=64)
 def format_threshold_display(threshold_minutes: int) -> str:
     """
     Format time threshold in minutes to human-readable Indonesian text.
@@ -47,6 +41,7 @@ def format_threshold_display(threshold_minutes: int) -> str:
     return f"{threshold_minutes} menit"
 
 
+@lru_cache(maxsize=64)
 def format_hours_display(hours: int) -> str:
     """
     Format hours to human-readable Indonesian text.
@@ -157,6 +152,26 @@ VERIFICATION_CLEARANCE_MESSAGE = (
     "✅ {user_mention} telah diverifikasi oleh admin. Silakan berdiskusi kembali."
 )
 
+VERIFICATION_SUCCESS_MESSAGE = (
+    "✅ User dengan ID {user_id} telah diverifikasi:\n"
+    "• Ditambahkan ke whitelist foto profil\n"
+    "• Pembatasan dicabut (jika ada)\n"
+    "• Riwayat warning dihapus\n\n"
+    "User ini tidak akan dicek foto profil lagi."
+)
+
+VERIFY_BULK_USAGE_MESSAGE = "❌ Penggunaan: /verify_bulk USER_ID [USER_ID ...]"
+
+VERIFICATION_BULK_SUCCESS_MESSAGE = "✅ {count} user telah diverifikasi."
+
+VERIFICATION_BULK_VERIFIED_IDS = "• {user_ids}"
+
+VERIFICATION_BULK_SKIPPED_MESSAGE = "ℹ️ Sudah ada di whitelist: {user_ids}"
+
+VERIFICATION_BULK_CONFLICT_MESSAGE = (
+    "ℹ️ Sebagian user baru saja diverifikasi oleh admin lain. Silakan coba lagi."
+)
+
 ADMIN_CHECK_PROMPT = (
     "📋 User: {user_mention} (ID: `{user_id}`)\n\n"
     "Status Profil:\n"
@@ -193,336 +208,358 @@ NEW_USER_SPAM_RESTRICTION = (
     "📖 [Baca aturan grup]({rules_link})"
 )
 
-# Whitelisted URL domains for new user probation
-# These domains are allowed even during probation period
-# Matches exact domain or subdomains (e.g., "github.com" matches "www.github.com")
-WHITELISTED_URL_DOMAINS = frozenset([
-    # Documentation & References
-    "docs.python.org",
-    "docs.djangoproject.com",
-    "flask.palletsprojects.com",
-    "fastapi.tiangolo.com",
-    "pydantic-docs.helpmanual.io",
-    "pydantic.dev",
-    "sqlalchemy.org",
-    "docs.sqlalchemy.org",
-    "pandas.pydata.org",
-    "numpy.org",
-    "scipy.org",
-    "matplotlib.org",
-    "scikit-learn.org",
-    "pytorch.org",
-    "tensorflow.org",
-    "keras.io",
-    "huggingface.co",
-    "openai.com",
-    "anthropic.com",
-    "langchain.com",
-    "docs.aws.amazon.com",
-    "cloud.google.com",
-    "docs.microsoft.com",
-    "learn.microsoft.com",
-    
-    # Code Hosting & Collaboration
-    "github.com",
-    "gitlab.com",
-    "bitbucket.org",
-    "gist.github.com",
-    "raw.githubusercontent.com",
-    
-    # Package Repositories
-    "pypi.org",
-    "anaconda.org",
-    "conda.io",
-    "hub.docker.com",
-    
-    # Community & Learning
-    "stackoverflow.com",
-    "stackexchange.com",
-    "reddit.com",
-    "medium.com",
-    "towardsdatascience.com",
-    "dev.to",
-    "realpython.com",
-    "pythonweekly.com",
-    "kaggle.com",
-    "colab.research.google.com",
-    
-    # Data Science & ML Resources
-    "arxiv.org",
-    "paperswithcode.com",
-    "wandb.ai",
-    "mlflow.org",
-    "streamlit.io",
-    "gradio.app",
-    "jupyter.org",
-    "nbviewer.jupyter.org",
-    
-    # API Documentation
-    "developers.google.com",
-    "developer.twitter.com",
-    "developer.github.com",
-    "api.telegram.org",
-    "core.telegram.org",
-    
-    # Indonesian Tech Communities
-    "dicoding.com",
-])
-
-# Whitelisted Telegram paths/usernames for new user probation
-# Only these specific t.me paths are allowed (exact match on first path segment)
-# e.g., "PythonID" allows "t.me/PythonID", "t.me/PythonID/123", but not "t.me/PythonIDSpam"
-# Values should be lowercased for case-insensitive matching
-WHITELISTED_TELEGRAM_PATHS = frozenset([    
-    # Cloud & Platforms
-    "juaragcp",
-    "awsdatausergroupid",
-    "awsusergroupid",
-    "azureindo",
-    "gcpuserid",
-    "gcp_id",
-    
-    # AI & Data Science
-    "artificialintelligence_indonesia",
-    "businessintelligenceid",
-    "dataengineeringid",
-    "datascienceindonesia",
-    "iaiforum",
-    "machinelearningid",
-    "nlp_lounge",
-    "pytorchid",
-    "scrapeid",
-    "tableauprofessionals",
-    "tensorflowid",
-    
-    # Databases
-    "sqlserverid",
-    "mongodb_id",
-    "mongo_db",
-    "mysqlid",
-    "postgresql_id",
-    
-    # General Programming & Developer Groups
-    "bandungdevcom",
-    "belajarcoding",
-    "belajarngodingbareng",
-    "gnurindonesia",
-    "belajargolangmariadb",
-    "belajarhtmlcss",
-    "bogordev",
-    "borneokoding",
-    "tgbotid",
-    "otodidak_ngoding",
-    "crbdev",
-    "codingfess",
-    "cscript",
-    "femalegeek",
-    "freekelasgithub",
-    "frontendid",
-    "gresikdev",
-    "iamindonesia",
-    "idstack",
-    "infotechprogrammer",
-    "itnusantara",
-    "djemberdev",
-    "kabayan_coding",
-    "kelasmobilemalang",
-    "backendid",
-    "komunitasbk",
-    "komunitasrpaindonesia",
-    "kongkowitmedan",
-    "kongkowitpekanbaru",
-    "kotakodebetachat",
-    "kulkultech",
-    "odooindonesia",
-    "pasuruandev",
-    "programersemarangraya",
-    "rantaudev",
-    "santrenkoding",
-    "sarccomuniverse",
-    "sidoarjodev",
-    "sinaudev",
-    "soft_eng_id",
-    "sparkarindonesia",
-    "surabayadev",
-    "lamongandev",
-    "tamankodekode",
-    "tiadevcommunity",
-    "teknologi_umum_v2",
-    "idwordpress",
-    "smk_dev",
-    
-    # DevOps & Infrastructure
-    "ansibleid",
-    "cloudcomputingindonesia",
-    "dockeridn",
-    "iddevops",
-    "kubernetesindonesia",
-    "okdindonesia",
-    "devopsjogja",
-    
-    # Firebase
-    "firebaseindonesia",
-    
-    # FreeBSD
-    "setanmerahid",
-    
-    # Game Development
-    "gamerang",
-    "gdevelopid",
-    "godot_indonesia",
-    "lombokgamedev",
-    
-    # IoT
-    "kelasrobotgrup",
-    "arduinoindonesiancommunity",
-    "edukasielektronika",
-    "raspberrypi_id",
-    
-    # iOS
-    "ikaskus",
-    "initialestore",
-    "libimobiledevice",
-    
-    # Jokes
-    "linux_memes",
-    "programmerjokes",
-    
-    # Linux
-    "archlinuxid",
-    "artixlinux_id",
-    "gnulinuxindonesia",
-    "belajarlinuxbareng",
-    "blankonlinux",
-    "centosid",
-    "debianid",
-    "deepin_indonesia",
-    "dotfiles_id",
-    "elementaryid",
-    "fedoraid",
-    "gnomeid",
-    "gnuweeb",
-    "kalilinuxid",
-    "kdeid",
-    "linuxmalang",
-    "linuxjember",
-    "lfsid",
-    "langitketujuh_id",
-    "mint_id",
-    "linuxgroupid",
-    "manjaroid",
-    "nixosid",
-    "opensuse_id",
-    "linuxsolo",
-    "parrotsecurityindonesia",
-    "rhel_id",
-    "ubuntu_indo",
-    "voidlinux_id",
-    
-    # macOS
-    "macosid",
-    
-    # Office Productivity
-    "excelid",
-    "belajarlibreofficeindonesia",
-    
-    # Open Source & Security
-    "osint_indonesia",
-    "doscomedia",
-    "forensicaid",
-    "itsecurityindonesia",
-    "linuxhackingid",
-    "orangsiber",
-    "reversingid",
-    "cybersecurity_id",
-    "hacktheboxindo",
-    
-    # Programming Languages (Specific)
-    "dotnetusergroup",
-    "dotnetcore_id",
-    "xamarinindonesia",
-    "androiddevbdg",
-    "androiddevelopernasional",
-    "teknorialcom",
-    "android_lombok",
-    "androiddevsurabaya",
-    "jcomposeindonesia",
-    "androidsemarang",
-    "source_code_android",
-    "yacgroup",
-    "agilecirclesid",
-    "agileindonesia",
-    "assemblyid",
-    "bashidorg",
-    "ccpp_indonesia",
-    "idcplc",
-    "crystalid",
-    "dart_web",
-    "flutter_id",
-    "flutter_jkt",
-    "fluttermakassar",
-    "lombokflutter",
-    "elixir_id",
-    "gophers_id",
-    "golangjogja",
-    "golangsurabaya",
-    "rustacean_id",
-    "jvmindonesia",
-    "adonisid",
-    "angularid",
-    "deno_id",
-    "indonesiaionic",
-    "js_id",
-    "jogjajs",
-    "lombokjs",
-    "nativescript_id",
-    "nestjs_indonesia",
-    "nextjs_id",
-    "nodejsid",
-    "bun_id",
-    "react_idn",
-    "reactnativeindo",
-    "surabayajs",
-    "svelte_id",
-    "vuejsindonesia",
-    "kotlin_crb",
-    "kotlinindonesia",
-    "delphiindonesia",
-    "pascalid",
-    "codeigniterindonesia",
-    "laravelindonesia",
-    "phpidforbusiness",
-    "phpidforstudent",
-    "phpjogloraya",
-    "symfonyid",
-    "botphp",
-    "yiiframeworkindonesia",
-    "bandung_py",
-    "djangoid",
-    "fastapiid",
-    "flaskid",
-    "lombok_py",
-    "mkspy",
-    "pyjogja",
-    "pythonid", # Duplicate of "pythonid" but kept for completeness of list
-    "python",
-    "pythonlearnerr",
-    "python_learners_group",
-    "surabayapy",
-    "railsid",
-    "ruby_id",
-    "swiftid",
-    "typescriptindonesia",
-    "sapabapindonesia",
-    "gis_id",
-    "leafletid",
-    "qgisindonesia",
-    
-    # QA
-    "sqa_id",
-    "qamalang",
-    
-    # Text Editors
-    "emacsid",
-    "vimid",
-])
+
+@cache
+def whitelisted_url_domains() -> frozenset[str]:
+    """
+    Get the whitelisted URL domains for new user probation.
+
+    These domains are allowed even during probation period.
+    Matches exact domain or subdomains (e.g., "github.com" matches "www.github.com").
+    The set is built on first access and cached afterwards.
+
+    Returns:
+        frozenset[str]: Whitelisted domain names.
+    """
+    return frozenset([
+        # Documentation & References
+        "docs.python.org",
+        "docs.djangoproject.com",
+        "flask.palletsprojects.com",
+        "fastapi.tiangolo.com",
+        "pydantic-docs.helpmanual.io",
+        "pydantic.dev",
+        "sqlalchemy.org",
+        "docs.sqlalchemy.org",
+        "pandas.pydata.org",
+        "numpy.org",
+        "scipy.org",
+        "matplotlib.org",
+        "scikit-learn.org",
+        "pytorch.org",
+        "tensorflow.org",
+        "keras.io",
+        "huggingface.co",
+        "openai.com",
+        "anthropic.com",
+        "langchain.com",
+        "docs.aws.amazon.com",
+        "cloud.google.com",
+        "docs.microsoft.com",
+        "learn.microsoft.com",
+
+        # Code Hosting & Collaboration
+        "github.com",
+        "gitlab.com",
+        "bitbucket.org",
+        "gist.github.com",
+        "raw.githubusercontent.com",
+
+        # Package Repositories
+        "pypi.org",
+        "anaconda.org",
+        "conda.io",
+        "hub.docker.com",
+
+        # Community & Learning
+        "stackoverflow.com",
+        "stackexchange.com",
+        "reddit.com",
+        "medium.com",
+        "towardsdatascience.com",
+        "dev.to",
+        "realpython.com",
+        "pythonweekly.com",
+        "kaggle.com",
+        "colab.research.google.com",
+
+        # Data Science & ML Resources
+        "arxiv.org",
+        "paperswithcode.com",
+        "wandb.ai",
+        "mlflow.org",
+        "streamlit.io",
+        "gradio.app",
+        "jupyter.org",
+        "nbviewer.jupyter.org",
+
+        # API Documentation
+        "developers.google.com",
+        "developer.twitter.com",
+        "developer.github.com",
+        "api.telegram.org",
+        "core.telegram.org",
+
+        # Indonesian Tech Communities
+        "dicoding.com",
+    ])
+
+
+@cache
+def whitelisted_telegram_paths() -> frozenset[str]:
+    """
+    Get the whitelisted Telegram paths/usernames for new user probation.
+
+    Only these specific t.me paths are allowed (exact match on first path segment)
+    e.g., "PythonID" allows "t.me/PythonID", "t.me/PythonID/123", but not "t.me/PythonIDSpam".
+    Values should be lowercased for case-insensitive matching.
+    The set is built on first access and cached afterwards.
+
+    Returns:
+        frozenset[str]: Whitelisted lowercase Telegram paths.
+    """
+    paths = frozenset([
+        # Cloud & Platforms
+        "juaragcp",
+        "awsdatausergroupid",
+        "awsusergroupid",
+        "azureindo",
+        "gcpuserid",
+        "gcp_id",
+
+        # AI & Data Science
+        "artificialintelligence_indonesia",
+        "businessintelligenceid",
+        "dataengineeringid",
+        "datascienceindonesia",
+        "iaiforum",
+        "machinelearningid",
+        "nlp_lounge",
+        "pytorchid",
+        "scrapeid",
+        "tableauprofessionals",
+        "tensorflowid",
+
+        # Databases
+        "sqlserverid",
+        "mongodb_id",
+        "mongo_db",
+        "mysqlid",
+        "postgresql_id",
+
+        # General Programming & Developer Groups
+        "bandungdevcom",
+        "belajarcoding",
+        "belajarngodingbareng",
+        "gnurindonesia",
+        "belajargolangmariadb",
+        "belajarhtmlcss",
+        "bogordev",
+        "borneokoding",
+        "tgbotid",
+        "otodidak_ngoding",
+        "crbdev",
+        "codingfess",
+        "cscript",
+        "femalegeek",
+        "freekelasgithub",
+        "frontendid",
+        "gresikdev",
+        "iamindonesia",
+        "idstack",
+        "infotechprogrammer",
+        "itnusantara",
+        "djemberdev",
+        "kabayan_coding",
+        "kelasmobilemalang",
+        "backendid",
+        "komunitasbk",
+        "komunitasrpaindonesia",
+        "kongkowitmedan",
+        "kongkowitpekanbaru",
+        "kotakodebetachat",
+        "kulkultech",
+        "odooindonesia",
+        "pasuruandev",
+        "programersemarangraya",
+        "rantaudev",
+        "santrenkoding",
+        "sarccomuniverse",
+        "sidoarjodev",
+        "sinaudev",
+        "soft_eng_id",
+        "sparkarindonesia",
+        "surabayadev",
+        "lamongandev",
+        "tamankodekode",
+        "tiadevcommunity",
+        "teknologi_umum_v2",
+        "idwordpress",
+        "smk_dev",
+
+        # DevOps & Infrastructure
+        "ansibleid",
+        "cloudcomputingindonesia",
+        "dockeridn",
+        "iddevops",
+        "kubernetesindonesia",
+        "okdindonesia",
+        "devopsjogja",
+
+        # Firebase
+        "firebaseindonesia",
+
+        # FreeBSD
+        "setanmerahid",
+
+        # Game Development
+        "gamerang",
+        "gdevelopid",
+        "godot_indonesia",
+        "lombokgamedev",
+
+        # IoT
+        "kelasrobotgrup",
+        "arduinoindonesiancommunity",
+        "edukasielektronika",
+        "raspberrypi_id",
+
+        # iOS
+        "ikaskus",
+        "initialestore",
+        "libimobiledevice",
+
+        # Jokes
+        "linux_memes",
+        "programmerjokes",
+
+        # Linux
+        "archlinuxid",
+        "artixlinux_id",
+        "gnulinuxindonesia",
+        "belajarlinuxbareng",
+        "blankonlinux",
+        "centosid",
+        "debianid",
+        "deepin_indonesia",
+        "dotfiles_id",
+        "elementaryid",
+        "fedoraid",
+        "gnomeid",
+        "gnuweeb",
+        "kalilinuxid",
+        "kdeid",
+        "linuxmalang",
+        "linuxjember",
+        "lfsid",
+        "langitketujuh_id",
+        "mint_id",
+        "linuxgroupid",
+        "manjaroid",
+        "nixosid",
+        "opensuse_id",
+        "linuxsolo",
+        "parrotsecurityindonesia",
+        "rhel_id",
+        "ubuntu_indo",
+        "voidlinux_id",
+
+        # macOS
+        "macosid",
+
+        # Office Productivity
+        "excelid",
+        "belajarlibreofficeindonesia",
+
+        # Open Source & Security
+        "osint_indonesia",
+        "doscomedia",
+        "forensicaid",
+        "itsecurityindonesia",
+        "linuxhackingid",
+        "orangsiber",
+        "reversingid",
+        "cybersecurity_id",
+        "hacktheboxindo",
+
+        # Programming Languages (Specific)
+        "dotnetusergroup",
+        "dotnetcore_id",
+        "xamarinindonesia",
+        "androiddevbdg",
+        "androiddevelopernasional",
+        "teknorialcom",
+        "android_lombok",
+        "androiddevsurabaya",
+        "jcomposeindonesia",
+        "androidsemarang",
+        "source_code_android",
+        "yacgroup",
+        "agilecirclesid",
+        "agileindonesia",
+        "assemblyid",
+        "bashidorg",
+        "ccpp_indonesia",
+        "idcplc",
+        "crystalid",
+        "dart_web",
+        "flutter_id",
+        "flutter_jkt",
+        "fluttermakassar",
+        "lombokflutter",
+        "elixir_id",
+        "gophers_id",
+        "golangjogja",
+        "golangsurabaya",
+        "rustacean_id",
+        "jvmindonesia",
+        "adonisid",
+        "angularid",
+        "deno_id",
+        "indonesiaionic",
+        "js_id",
+        "jogjajs",
+        "lombokjs",
+        "nativescript_id",
+        "nestjs_indonesia",
+        "nextjs_id",
+        "nodejsid",
+        "bun_id",
+        "react_idn",
+        "reactnativeindo",
+        "surabayajs",
+        "svelte_id",
+        "vuejsindonesia",
+        "kotlin_crb",
+        "kotlinindonesia",
+        "delphiindonesia",
+        "pascalid",
+        "codeigniterindonesia",
+        "laravelindonesia",
+        "phpidforbusiness",
+        "phpidforstudent",
+        "phpjogloraya",
+        "symfonyid",
+        "botphp",
+        "yiiframeworkindonesia",
+        "bandung_py",
+        "djangoid",
+        "fastapiid",
+        "flaskid",
+        "lombok_py",
+        "mkspy",
+        "pyjogja",
+        "pythonid",
+        "python",
+        "pythonlearnerr",
+        "python_learners_group",
+        "surabayapy",
+        "railsid",
+        "ruby_id",
+        "swiftid",
+        "typescriptindonesia",
+        "sapabapindonesia",
+        "gis_id",
+        "leafletid",
+        "qgisindonesia",
+
+        # QA
+        "sqa_id",
+        "qamalang",
+
+        # Text Editors
+        "emacsid",
+        "vimid",
+    ])
+    assert all(path == path.lower() for path in paths), "Telegram paths must be lowercase"
+    return paths
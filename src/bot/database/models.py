@@ -8,10 +8,15 @@ enforcement system.
 
 from datetime import UTC, datetime
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, SQLModel
 
 
+def _utcnow() -> datetime:
+    """Default factory for timestamp columns."""
+    return datetime.now(UTC)
+
+
 class UserWarning(SQLModel, table=True):
     """
     Tracks warning state for users with incomplete profiles.
@@ -23,7 +28,7 @@ class UserWarning(SQLModel, table=True):
 
     Attributes:
         id: Primary key (auto-generated).
-        user_id: Telegram user ID (indexed for fast lookups).
+        user_id: Telegram user ID (indexed together with group_id).
         group_id: Telegram group ID where the warning occurred.
         message_count: Number of messages sent since first warning.
         first_warned_at: Timestamp of first warning.
@@ -35,13 +40,16 @@ class UserWarning(SQLModel, table=True):
     """
 
     __tablename__ = "user_warnings"
+    __table_args__ = (
+        Index('ix_user_warnings_user_group', 'user_id', 'group_id'),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
-    user_id: int = Field(index=True)
+    user_id: int
     group_id: int = Field(index=True)
     message_count: int = Field(default=1)
-    first_warned_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    last_message_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    first_warned_at: datetime = Field(default_factory=_utcnow)
+    last_message_at: datetime = Field(default_factory=_utcnow)
     is_restricted: bool = Field(default=False)
     restricted_by_bot: bool = Field(default=False)
 
@@ -68,7 +76,7 @@ class PhotoVerificationWhitelist(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(index=True, unique=True)
     verified_by_admin_id: int
-    verified_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    verified_at: datetime = Field(default_factory=_utcnow)
     notes: str | None = Field(default=None)
 
 
@@ -101,7 +109,7 @@ class PendingCaptchaValidation(SQLModel, table=True):
     chat_id: int = Field(index=True)
     message_id: int
     user_full_name: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=_utcnow)
 
 
 class NewUserProbation(SQLModel, table=True):
@@ -114,7 +122,7 @@ class NewUserProbation(SQLModel, table=True):
 
     Attributes:
         id: Primary key (auto-generated).
-        user_id: Telegram user ID (indexed for fast lookups).
+        user_id: Telegram user ID (indexed together with group_id).
         group_id: Telegram group ID where probation applies.
         joined_at: Timestamp when probation started (after captcha verification).
         violation_count: Number of spam violations (forward/link messages).
@@ -123,11 +131,14 @@ class NewUserProbation(SQLModel, table=True):
     """
 
     __tablename__ = "new_user_probation"
+    __table_args__ = (
+        Index('ix_new_user_probation_user_group', 'user_id', 'group_id'),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
-    user_id: int = Field(index=True)
+    user_id: int
     group_id: int = Field(index=True)
-    joined_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    joined_at: datetime = Field(default_factory=_utcnow)
     violation_count: int = Field(default=0)
     first_violation_at: datetime | None = Field(default=None)
     last_violation_at: datetime | None = Field(default=None)
@@ -8,9 +8,14 @@ with SQLite backend for persistence.
 
 import logging
 import sqlite3
+from collections.abc import Iterable
+from contextlib import closing
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import NamedTuple
 
+from sqlalchemy import event, func, insert, update
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, SQLModel, create_engine, delete, select
 
 from bot.database.models import (
@@ -22,6 +27,44 @@ from bot.database.models import (
 
 logger = logging.getLogger(__name__)
 
+# Applied to every new pooled connection; synchronous, busy_timeout,
+# temp_store and the cache sizes are per-connection settings in SQLite.
+# busy_timeout makes a writer wait for a concurrent write (e.g. the scheduler
+# job vs. a handler running in a worker thread) instead of failing with
+# SQLITE_BUSY.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA busy_timeout=5000;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA mmap_size=268435456;",
+    "PRAGMA cache_size=-64000;",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection: sqlite3.Connection, connection_record: object) -> None:
+    """Configure a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+class ProbationRow(NamedTuple):
+    """Lightweight read-only view of a new_user_probation row."""
+
+    user_id: int
+    group_id: int
+    joined_at: datetime
+    violation_count: int
+    first_violation_at: datetime | None
+    last_violation_at: datetime | None
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Parse a datetime column stored by SQLAlchemy on SQLite as an aware UTC datetime."""
+    return None if value is None else datetime.fromisoformat(value).replace(tzinfo=UTC)
+
 
 class DatabaseService:
     """
@@ -47,14 +90,36 @@ class DatabaseService:
         sqlite3.register_adapter(datetime, lambda val: val.isoformat())
 
         self._engine = create_engine(f"sqlite:///{database_path}")
-
-        with self._engine.connect() as conn:
-            conn.exec_driver_sql("PRAGMA journal_mode=WAL;")
-            conn.exec_driver_sql("PRAGMA synchronous=NORMAL;")
+        event.listen(self._engine, "connect", _apply_sqlite_pragmas)
         logger.info("SQLite WAL mode enabled")
 
         SQLModel.metadata.create_all(self._engine)
 
+        # create_all() skips existing tables, so add indexes introduced after
+        # a database was first created
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self._engine, checkfirst=True)
+
+        # (user_id, group_id) pairs currently on probation, loaded on first use.
+        # This service is the only writer, so the set stays in sync with the table.
+        self._probation_keys: set[tuple[int, int]] | None = None
+
+    def _get_probation_keys(self) -> set[tuple[int, int]]:
+        """
+        Get the in-memory set of users on probation, loading it on first use.
+
+        Returns:
+            set[tuple[int, int]]: (user_id, group_id) pairs with a probation record.
+        """
+        if self._probation_keys is None:
+            with Session(self._engine) as session:
+                statement = select(NewUserProbation.user_id, NewUserProbation.group_id)
+                self._probation_keys = {
+                    (user_id, group_id) for user_id, group_id in session.exec(statement)
+                }
+        return self._probation_keys
+
     def get_or_create_user_warning(self, user_id: int, group_id: int) -> UserWarning:
         """
         Get existing warning record or create a new one.
@@ -105,7 +170,9 @@ class DatabaseService:
         Increment message count for an existing warning record.
 
         Called when user sends additional messages after first warning
-        but before reaching the restriction threshold.
+        but before reaching the restriction threshold. Uses a single
+        UPDATE ... RETURNING statement instead of a read-modify-write, so
+        it costs one round-trip and concurrent messages can't lose counts.
 
         Args:
             user_id: Telegram user ID.
@@ -117,6 +184,54 @@ class DatabaseService:
         Raises:
             ValueError: If no active warning record exists.
         """
+        statement = (
+            update(UserWarning)
+            .where(
+                UserWarning.user_id == user_id,
+                UserWarning.group_id == group_id,
+                ~UserWarning.is_restricted,
+            )
+            .values(
+                message_count=UserWarning.message_count + 1,
+                last_message_at=datetime.now(UTC),
+            )
+            .returning(UserWarning)
+        )
+
+        with Session(self._engine, expire_on_commit=False) as session:
+            record = session.scalars(statement).first()
+            if record is None:
+                raise ValueError(
+                    f"No warning record found for user {user_id} in group {group_id}"
+                )
+            session.commit()
+
+        logger.info(
+            f"Incremented message count for user_id={user_id}, group_id={group_id}, new_count={record.message_count}"
+        )
+        return record
+
+    def record_user_message(
+        self, user_id: int, group_id: int, warning_threshold: int
+    ) -> int:
+        """
+        Record a message from a user with an incomplete profile.
+
+        Combines get_or_create_user_warning() and increment_message_count()
+        in one transaction: the active warning record is created if missing,
+        and its count is incremented unless the threshold is already reached
+        (that record is about to be marked restricted instead).
+
+        Args:
+            user_id: Telegram user ID.
+            group_id: Telegram group ID.
+            warning_threshold: Message count at which the user gets restricted.
+
+        Returns:
+            int: Message count of the active record before this message
+                (1 for a newly created record).
+        """
+        now = datetime.now(UTC)
         with Session(self._engine) as session:
             statement = select(UserWarning).where(
                 UserWarning.user_id == user_id,
@@ -125,20 +240,26 @@ class DatabaseService:
             )
             record = session.exec(statement).first()
 
-            if record:
-                record.message_count += 1
-                record.last_message_at = datetime.now(UTC)
-                session.add(record)
-                session.commit()
-                session.refresh(record)
-                logger.info(
-                    f"Incremented message count for user_id={user_id}, group_id={group_id}, new_count={record.message_count}"
+            if record is None:
+                record = UserWarning(
+                    user_id=user_id,
+                    group_id=group_id,
+                    message_count=1,
+                    first_warned_at=now,
+                    last_message_at=now,
                 )
-                return record
+            message_count = record.message_count
 
-            raise ValueError(
-                f"No warning record found for user {user_id} in group {group_id}"
-            )
+            if message_count < warning_threshold:
+                record.message_count = message_count + 1
+                record.last_message_at = now
+            session.add(record)
+            session.commit()
+
+        logger.info(
+            f"Recorded message for user_id={user_id}, group_id={group_id}, count={message_count}"
+        )
+        return message_count
 
     def mark_user_restricted(self, user_id: int, group_id: int) -> UserWarning:
         """
@@ -307,6 +428,139 @@ class DatabaseService:
             )
             return record
 
+    def verify_user_atomic(
+        self, user_id: int, verified_by_admin_id: int, group_ids: Iterable[int]
+    ) -> dict[int, int]:
+        """
+        Whitelist a user and delete their warnings in one transaction.
+
+        Combines add_photo_verification_whitelist() and delete_user_warnings()
+        for every given group under a single COMMIT, so there is no window
+        where the user is whitelisted but still has warnings.
+
+        Args:
+            user_id: Telegram user ID.
+            verified_by_admin_id: Telegram user ID of admin performing verification.
+            group_ids: Groups whose warning records should be deleted.
+
+        Returns:
+            dict[int, int]: Number of warning records deleted per group ID.
+
+        Raises:
+            ValueError: If user is already whitelisted.
+        """
+        group_ids = list(group_ids)
+        with Session(self._engine) as session:
+            statement = select(PhotoVerificationWhitelist.id).where(
+                PhotoVerificationWhitelist.user_id == user_id
+            )
+            if session.exec(statement).first() is not None:
+                raise ValueError(f"User {user_id} is already whitelisted")
+
+            session.add(
+                PhotoVerificationWhitelist(
+                    user_id=user_id,
+                    verified_by_admin_id=verified_by_admin_id,
+                )
+            )
+            delete_statement = (
+                delete(UserWarning)
+                .where(
+                    UserWarning.user_id == user_id,
+                    UserWarning.group_id.in_(group_ids),  # type: ignore[attr-defined]
+                )
+                .returning(UserWarning.group_id)
+            )
+            try:
+                deleted_rows = session.exec(delete_statement).all()  # type: ignore[call-overload]
+                session.commit()
+            except IntegrityError as e:
+                # A concurrent verification inserted the row after our check
+                session.rollback()
+                raise ValueError(f"User {user_id} is already whitelisted") from e
+
+        deleted = dict.fromkeys(group_ids, 0)
+        for (group_id,) in deleted_rows:
+            deleted[group_id] += 1
+        logger.info(
+            f"Verified user_id={user_id}, admin_id={verified_by_admin_id}, "
+            f"deleted_warnings={sum(deleted.values())}"
+        )
+        return deleted
+
+    def verify_users_bulk(
+        self, user_ids: Iterable[int], verified_by_admin_id: int, group_ids: Iterable[int]
+    ) -> dict[int, dict[int, int]]:
+        """
+        Whitelist several users and delete their warnings in one transaction.
+
+        Bulk counterpart of verify_user_atomic(). Users already on the
+        whitelist are skipped rather than failing the whole batch. The new
+        whitelist rows are inserted as a single executemany batch and all
+        warnings are removed with a single DELETE.
+
+        Args:
+            user_ids: Telegram user IDs to verify.
+            verified_by_admin_id: Telegram user ID of admin performing verification.
+            group_ids: Groups whose warning records should be deleted.
+
+        Returns:
+            dict[int, dict[int, int]]: For each newly whitelisted user ID, the
+            number of warning records deleted per group ID. Users that were
+            already whitelisted are not included.
+
+        Raises:
+            ValueError: If a concurrent verification whitelisted one of the
+                users between the check and the insert; nothing is committed.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        group_ids = list(group_ids)
+        with Session(self._engine) as session:
+            statement = select(PhotoVerificationWhitelist.user_id).where(
+                PhotoVerificationWhitelist.user_id.in_(user_ids)  # type: ignore[attr-defined]
+            )
+            already_whitelisted = set(session.exec(statement).all())
+            new_user_ids = [user_id for user_id in user_ids if user_id not in already_whitelisted]
+            if not new_user_ids:
+                return {}
+
+            verified_at = datetime.now(UTC)
+            try:
+                session.execute(
+                    insert(PhotoVerificationWhitelist),
+                    [
+                        {
+                            "user_id": user_id,
+                            "verified_by_admin_id": verified_by_admin_id,
+                            "verified_at": verified_at,
+                        }
+                        for user_id in new_user_ids
+                    ],
+                )
+            except IntegrityError as e:
+                # A concurrent verification inserted one of these users after our check
+                session.rollback()
+                raise ValueError("One or more users were already whitelisted") from e
+            delete_statement = (
+                delete(UserWarning)
+                .where(
+                    UserWarning.user_id.in_(new_user_ids),  # type: ignore[attr-defined]
+                    UserWarning.group_id.in_(group_ids),  # type: ignore[attr-defined]
+                )
+                .returning(UserWarning.user_id, UserWarning.group_id)
+            )
+            deleted_rows = session.exec(delete_statement).all()  # type: ignore[call-overload]
+            session.commit()
+
+        deleted = {user_id: dict.fromkeys(group_ids, 0) for user_id in new_user_ids}
+        for user_id, group_id in deleted_rows:
+            deleted[user_id][group_id] += 1
+        logger.info(
+            f"Bulk verified {len(new_user_ids)} user(s), admin_id={verified_by_admin_id}, "
+            f"deleted_warnings={len(deleted_rows)}"
+        )
+        return deleted
+
     def is_user_photo_whitelisted(self, user_id: int) -> bool:
         """
         Check if user is in photo verification whitelist.
@@ -526,83 +780,109 @@ class DatabaseService:
             session.add(record)
             session.commit()
             session.refresh(record)
+            self._get_probation_keys().add((user_id, group_id))
             logger.info(f"Started probation for user_id={user_id}, group_id={group_id}")
             return record
 
     def get_new_user_probation(
         self, user_id: int, group_id: int
-    ) -> NewUserProbation | None:
+    ) -> ProbationRow | None:
         """
         Get probation record for a user.
 
+        Users without a probation record (the vast majority) are answered
+        from memory without querying the database. Others are read with a
+        single DB-API query, skipping ORM object construction since this
+        runs for every group message.
+
         Args:
             user_id: Telegram user ID.
             group_id: Telegram group ID.
 
         Returns:
-            NewUserProbation | None: Probation record or None if not found.
-        """
-        with Session(self._engine) as session:
-            statement = select(NewUserProbation).where(
-                NewUserProbation.user_id == user_id,
-                NewUserProbation.group_id == group_id,
-            )
-            return session.exec(statement).first()
+            ProbationRow | None: Probation record or None if not found.
+        """
+        if (user_id, group_id) not in self._get_probation_keys():
+            return None
+
+        with closing(self._engine.raw_connection()) as conn:
+            row = conn.execute(
+                "SELECT joined_at, violation_count, first_violation_at, last_violation_at "
+                "FROM new_user_probation WHERE user_id = ? AND group_id = ?",
+                (user_id, group_id),
+            ).fetchone()
+
+        if row is None:
+            return None
+        joined_at, violation_count, first_violation_at, last_violation_at = row
+        return ProbationRow(
+            user_id=user_id,
+            group_id=group_id,
+            joined_at=_parse_datetime(joined_at),
+            violation_count=violation_count,
+            first_violation_at=_parse_datetime(first_violation_at),
+            last_violation_at=_parse_datetime(last_violation_at),
+        )
 
     def increment_new_user_violation(
         self, user_id: int, group_id: int
-    ) -> NewUserProbation:
+    ) -> ProbationRow:
         """
         Increment violation count for a user on probation atomically.
 
-        Uses atomic SQL update to prevent race conditions when multiple
-        violations occur simultaneously.
+        Uses a single UPDATE ... RETURNING statement, so concurrent
+        violations can neither lose an increment nor overwrite the first
+        violation timestamp.
 
         Args:
             user_id: Telegram user ID.
             group_id: Telegram group ID.
 
         Returns:
-            NewUserProbation: Updated probation record.
+            ProbationRow: Updated probation record.
 
         Raises:
             ValueError: If no probation record exists.
         """
-        from sqlalchemy import update as sql_update
-        
-        with Session(self._engine) as session:
-            # First check if record exists
-            select_stmt = select(NewUserProbation).where(
+        now = datetime.now(UTC)
+        statement = (
+            update(NewUserProbation)
+            .where(
                 NewUserProbation.user_id == user_id,
                 NewUserProbation.group_id == group_id,
             )
-            record = session.exec(select_stmt).first()
+            .values(
+                violation_count=NewUserProbation.violation_count + 1,
+                first_violation_at=func.coalesce(NewUserProbation.first_violation_at, now),
+                last_violation_at=now,
+            )
+            .returning(
+                NewUserProbation.joined_at,
+                NewUserProbation.violation_count,
+                NewUserProbation.first_violation_at,
+                NewUserProbation.last_violation_at,
+            )
+        )
 
-            if not record:
+        with Session(self._engine) as session:
+            row = session.exec(statement).first()
+            if row is None:
                 raise ValueError(f"No probation record for user {user_id} in group {group_id}")
-
-            now = datetime.now(UTC)
-            
-            # Atomic update - increment directly in SQL
-            update_stmt = (
-                sql_update(NewUserProbation)
-                .where(NewUserProbation.id == record.id)
-                .values(
-                    violation_count=NewUserProbation.violation_count + 1,
-                    first_violation_at=now if record.first_violation_at is None else record.first_violation_at,
-                    last_violation_at=now,
-                )
-            )
-            session.exec(update_stmt)
             session.commit()
-            
-            # Refresh to get updated values
-            session.refresh(record)
-            logger.info(
-                f"Incremented violation for user_id={user_id}, group_id={group_id}, "
-                f"count={record.violation_count}"
-            )
-            return record
+
+        joined_at, violation_count, first_violation_at, last_violation_at = row
+        logger.info(
+            f"Incremented violation for user_id={user_id}, group_id={group_id}, "
+            f"count={violation_count}"
+        )
+        return ProbationRow(
+            user_id=user_id,
+            group_id=group_id,
+            joined_at=joined_at.replace(tzinfo=UTC),
+            violation_count=violation_count,
+            first_violation_at=first_violation_at.replace(tzinfo=UTC),
+            last_violation_at=last_violation_at.replace(tzinfo=UTC),
+        )
 
     def clear_new_user_probation(self, user_id: int, group_id: int) -> None:
         """
@@ -619,6 +899,7 @@ class DatabaseService:
             )
             session.exec(statement)
             session.commit()
+            self._get_probation_keys().discard((user_id, group_id))
             logger.info(f"Cleared probation for user_id={user_id}, group_id={group_id}")
 
 
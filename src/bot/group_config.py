@@ -9,12 +9,17 @@ single-group .env configuration for backward compatibility.
 
 import json
 import logging
+import os
+from collections.abc import ValuesView
 from datetime import timedelta
+from functools import cached_property, lru_cache
 from pathlib import Path
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 from telegram import Update
 
+from bot.constants import format_threshold_display
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,8 +28,11 @@ class GroupConfig(BaseModel):
     Per-group configuration settings.
 
     Each monitored group has its own set of feature flags and thresholds.
+    Instances are immutable once built.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     group_id: int
     warning_topic_id: int
     restrict_failed_users: bool = False
@@ -71,49 +79,59 @@ class GroupConfig(BaseModel):
             raise ValueError("new_user_probation_hours must be >= 0")
         return v
 
-    @property
+    @cached_property
     def probation_timedelta(self) -> timedelta:
         return timedelta(hours=self.new_user_probation_hours)
 
-    @property
+    @cached_property
     def warning_time_threshold_timedelta(self) -> timedelta:
         return timedelta(minutes=self.warning_time_threshold_minutes)
 
-    @property
+    @cached_property
     def captcha_timeout_timedelta(self) -> timedelta:
         return timedelta(seconds=self.captcha_timeout_seconds)
 
+    @cached_property
+    def warning_time_threshold_display(self) -> str:
+        return format_threshold_display(self.warning_time_threshold_minutes)
+
 
 class GroupRegistry:
     """
     Registry of monitored groups.
 
     Provides O(1) lookup by group_id and iteration over all groups.
+    Groups are registered at startup; registering later is supported but rare.
     """
 
     def __init__(self) -> None:
         self._groups: dict[int, GroupConfig] = {}
+        self._group_ids: frozenset[int] = frozenset()
 
     def register(self, config: GroupConfig) -> None:
         if config.group_id in self._groups:
             raise ValueError(f"Duplicate group_id: {config.group_id}")
         self._groups[config.group_id] = config
+        self._group_ids = frozenset(self._groups)
         logger.info(f"Registered group {config.group_id} (warning_topic={config.warning_topic_id})")
 
     def get(self, group_id: int) -> GroupConfig | None:
         return self._groups.get(group_id)
 
-    def all_groups(self) -> list[GroupConfig]:
-        return list(self._groups.values())
+    def all_groups(self) -> ValuesView[GroupConfig]:
+        return self._groups.values()
 
     def is_monitored(self, group_id: int) -> bool:
-        return group_id in self._groups
+        return group_id in self._group_ids
 
 
 def load_groups_from_json(path: str) -> list[GroupConfig]:
     """
     Parse a groups.json file into a list of GroupConfig objects.
 
+    Parsed results are cached per file modification time, so repeated
+    loads of an unchanged file skip parsing and validation.
+
     Args:
         path: Path to the JSON file.
 
@@ -125,6 +143,12 @@ def load_groups_from_json(path: str) -> list[GroupConfig]:
         json.JSONDecodeError: If the file is not valid JSON.
         ValueError: If the JSON structure is invalid.
     """
+    return list(_load_groups_cached(path, os.stat(path).st_mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _load_groups_cached(path: str, mtime_ns: int) -> tuple[GroupConfig, ...]:
+    """Parse and validate groups.json; mtime_ns only keys the cache."""
     with open(path) as f:
         data = json.load(f)
 
@@ -134,7 +158,7 @@ def load_groups_from_json(path: str) -> list[GroupConfig]:
     if not data:
         raise ValueError("groups.json must contain at least one group")
 
-    configs = [GroupConfig(**item) for item in data]
+    configs = tuple(GroupConfig(**item) for item in data)
 
     # Check for duplicate group_ids
     seen_ids: set[int] = set()
@@ -170,7 +194,8 @@ def build_group_registry(settings: object) -> GroupRegistry:
         logger.info(f"Loaded {len(configs)} group(s) from {groups_path}")
     else:
         logger.info("No groups.json found, using single-group config from .env")
-        config = GroupConfig(
+        # Settings already enforces the same constraints, so skip re-validation
+        config = GroupConfig.model_construct(
             group_id=settings.group_id,
             warning_topic_id=settings.warning_topic_id,
             restrict_failed_users=settings.restrict_failed_users,
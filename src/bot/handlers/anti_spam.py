@@ -7,9 +7,12 @@ result in message deletion, a warning on first offense, and restriction
 after exceeding the threshold.
 """
 
+import asyncio
 import logging
+from collections.abc import Iterator
 from datetime import UTC, datetime
-from urllib.parse import urlparse
+from functools import cache, lru_cache
+from itertools import chain
 
 from telegram import Message, MessageEntity, Update
 from telegram.ext import ContextTypes
@@ -17,17 +20,20 @@ from telegram.ext import ContextTypes
 from bot.constants import (
     NEW_USER_SPAM_RESTRICTION,
     NEW_USER_SPAM_WARNING,
-    RESTRICTED_PERMISSIONS,
-    WHITELISTED_URL_DOMAINS,
-    WHITELISTED_TELEGRAM_PATHS,
     format_hours_display,
+    whitelisted_telegram_paths,
+    whitelisted_url_domains,
 )
-from bot.database.service import get_database
-from bot.group_config import get_group_config_for_update
+from bot.database.service import DatabaseService, get_database
+from bot.group_config import GroupConfig, get_group_config_for_update
+from bot.permissions import RESTRICTED_PERMISSIONS
 from bot.services.telegram_utils import get_user_mention
 
 logger = logging.getLogger(__name__)
 
+_URL = MessageEntity.URL
+_TEXT_LINK = MessageEntity.TEXT_LINK
+
 
 def is_forwarded(message: Message) -> bool:
     """
@@ -92,6 +98,28 @@ def has_story(message: Message) -> bool:
     return message.story is not None
 
 
+def _iter_urls(message: Message) -> Iterator[str]:
+    """
+    Lazily yield URLs from a message's text and caption entities.
+
+    Args:
+        message: Telegram message to check.
+
+    Yields:
+        str: Each URL in entity order.
+    """
+    text = message.text or message.caption or ""
+    url_type, text_link_type = _URL, _TEXT_LINK
+
+    for entity in chain(message.entities or (), message.caption_entities or ()):
+        entity_type = entity.type
+        if entity_type == url_type:
+            offset = entity.offset
+            yield text[offset : offset + entity.length]
+        elif entity_type == text_link_type and entity.url:
+            yield entity.url
+
+
 def extract_urls(message: Message) -> list[str]:
     """
     Extract all URLs from a message.
@@ -102,24 +130,95 @@ def extract_urls(message: Message) -> list[str]:
     Returns:
         list[str]: List of URLs found in the message.
     """
-    urls = []
-    entities = list(message.entities or []) + list(message.caption_entities or [])
-    text = message.text or message.caption or ""
+    return list(_iter_urls(message))
+
 
-    for entity in entities:
-        if entity.type == MessageEntity.URL:
-            urls.append(text[entity.offset : entity.offset + entity.length])
-        elif entity.type == MessageEntity.TEXT_LINK and entity.url:
-            urls.append(entity.url)
+# Marks a trie node where a whitelisted domain ends
+_TERMINAL = ""
+
+
+@cache
+def _whitelisted_domain_trie() -> dict[str, dict]:
+    """
+    Build a trie of whitelisted domains keyed by reversed labels.
 
-    return urls
+    e.g., "docs.python.org" is stored as {"org": {"python": {"docs": {"": {}}}}},
+    so a hostname is matched with a single walk over its labels from the
+    right, without slicing parent-domain strings.
 
+    Returns:
+        dict[str, dict]: Root node of the reversed-label trie.
+    """
+    root: dict[str, dict] = {}
+    for domain in whitelisted_url_domains():
+        node = root
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        node[_TERMINAL] = {}
+    return root
+
+
+def _is_domain_whitelisted(hostname: str) -> bool:
+    """
+    Check if a hostname is a whitelisted domain or one of its subdomains.
 
+    Args:
+        hostname: Lowercased hostname without port.
+
+    Returns:
+        bool: True if the hostname or any parent domain is whitelisted.
+    """
+    node = _whitelisted_domain_trie()
+    for label in reversed(hostname.split(".")):
+        node = node.get(label)
+        if node is None:
+            return False
+        if _TERMINAL in node:
+            return True
+    return False
+
+
+def _split_host_path(url: str) -> tuple[str, str]:
+    """
+    Split a URL into its lowercased host (with port) and its path.
+
+    A lightweight stand-in for urlparse() covering the URLs Telegram marks
+    as entities. Only an http(s) scheme is stripped, so a "://" appearing
+    later in the query string never shifts the host.
+
+    Args:
+        url: URL with or without an http(s) scheme.
+
+    Returns:
+        tuple[str, str]: Lowercased host (port included) and path, without
+            query string or fragment.
+    """
+    scheme, sep, rest = url.partition("://")
+    if not sep or scheme.lower() not in ("http", "https"):
+        rest = url
+
+    end = len(rest)
+    for delimiter in "/?#":
+        index = rest.find(delimiter, 0, end)
+        if index != -1:
+            end = index
+
+    host = rest[:end].lower()
+    if rest[end:end + 1] != "/":
+        return host, ""
+    path = rest[end:].split("?", 1)[0].split("#", 1)[0]
+    return host, path
+
+
+@lru_cache(maxsize=4096)
 def is_url_whitelisted(url: str) -> bool:
     """
     Check if a URL's domain matches any whitelisted domain.
 
-    Uses suffix-based set lookups for O(hostname labels) performance.
+    Results are memoized per URL string; the whitelists are immutable, so
+    cached answers never go stale.
+
+    Walks reversed hostname labels through a trie of whitelisted domains.
     Checks if the URL's hostname exactly matches or is a subdomain of
     a whitelisted domain.
 
@@ -130,21 +229,15 @@ def is_url_whitelisted(url: str) -> bool:
         bool: True if URL's domain is whitelisted.
     """
     try:
-        # Add scheme if missing for proper parsing
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-
-        parsed = urlparse(url)
-        hostname = parsed.netloc.lower()
+        hostname, path = _split_host_path(url)
 
         # Remove port if present
         if ':' in hostname:
-            hostname = hostname.rsplit(':', 1)[0]
+            hostname = hostname.rpartition(':')[0]
 
         # Specific logic for Telegram links
-        # Check against WHITELISTED_TELEGRAM_PATHS instead of WHITELISTED_URL_DOMAINS
+        # Check against whitelisted Telegram paths instead of whitelisted domains
         if hostname in {"t.me", "telegram.me"}:
-            path = parsed.path
             if not path or path == "/":
                 return False
 
@@ -154,21 +247,12 @@ def is_url_whitelisted(url: str) -> bool:
             if not parts:
                 return False
 
-            first_segment = parts[0].lower()
-            return first_segment in WHITELISTED_TELEGRAM_PATHS
-
-        # Check suffixes of the hostname against the set
-        # e.g., "sub.example.github.com" checks:
-        # "sub.example.github.com", "example.github.com", "github.com", "com"
-        while hostname:
-            if hostname in WHITELISTED_URL_DOMAINS:
-                return True
-            dot_idx = hostname.find('.')
-            if dot_idx == -1:
-                return False
-            hostname = hostname[dot_idx + 1:]
+            first_segment = parts[0]
+            if not first_segment.islower():
+                first_segment = first_segment.lower()
+            return first_segment in whitelisted_telegram_paths()
 
-        return False
+        return _is_domain_whitelisted(hostname)
     except Exception:
         return False
 
@@ -183,15 +267,100 @@ def has_non_whitelisted_link(message: Message) -> bool:
     Returns:
         bool: True if message contains non-whitelisted links.
     """
-    urls = extract_urls(message)
-    if not urls:
-        return False
+    return any(not is_url_whitelisted(url) for url in _iter_urls(message))
 
-    for url in urls:
-        if not is_url_whitelisted(url):
-            return True
 
-    return False
+async def _delete_violation_message(msg: Message, user_id: int) -> None:
+    """
+    Delete a probation-violating message, logging any failure.
+
+    Args:
+        msg: The violating message.
+        user_id: Telegram user ID of the sender.
+    """
+    try:
+        await msg.delete()
+        logger.info(f"Deleted probation violation message from user_id={user_id}")
+    except Exception:
+        logger.error(
+            f"Failed to delete violation message: user_id={user_id}",
+            exc_info=True,
+        )
+
+
+async def _enforce_probation_violation(
+    context: ContextTypes.DEFAULT_TYPE,
+    db: DatabaseService,
+    group_config: GroupConfig,
+    user_id: int,
+    user_mention: str,
+) -> None:
+    """
+    Record a probation violation and warn or restrict the user.
+
+    Args:
+        context: Bot context with helper methods.
+        db: Database service.
+        group_config: Config of the group where the violation happened.
+        user_id: Telegram user ID of the violator.
+        user_mention: Markdown mention of the violator.
+    """
+    # 2. Increment violation count
+    record = db.increment_new_user_violation(user_id, group_config.group_id)
+
+    # 3. First violation: send warning to warning topic
+    if record.violation_count == 1:
+        probation_display = format_hours_display(group_config.new_user_probation_hours)
+        warning_text = NEW_USER_SPAM_WARNING.format(
+            user_mention=user_mention,
+            probation_display=probation_display,
+            rules_link=group_config.rules_link,
+        )
+        try:
+            await context.bot.send_message(
+                chat_id=group_config.group_id,
+                message_thread_id=group_config.warning_topic_id,
+                text=warning_text,
+                parse_mode="Markdown",
+            )
+            logger.info(f"Sent probation warning for user_id={user_id}")
+        except Exception:
+            logger.error(
+                f"Failed to send probation warning: user_id={user_id}",
+                exc_info=True,
+            )
+
+    # 4. Threshold reached: restrict user and notify
+    if record.violation_count == group_config.new_user_violation_threshold:
+        try:
+            await context.bot.restrict_chat_member(
+                chat_id=group_config.group_id,
+                user_id=user_id,
+                permissions=RESTRICTED_PERMISSIONS,
+            )
+            logger.info(
+                f"Restricted user_id={user_id} after {record.violation_count} "
+                f"probation violations"
+            )
+
+            # Send restriction notification to warning topic
+            restriction_text = NEW_USER_SPAM_RESTRICTION.format(
+                user_mention=user_mention,
+                violation_count=record.violation_count,
+                rules_link=group_config.rules_link,
+            )
+            await context.bot.send_message(
+                chat_id=group_config.group_id,
+                message_thread_id=group_config.warning_topic_id,
+                text=restriction_text,
+                parse_mode="Markdown",
+            )
+            logger.info(f"Sent restriction notification for user_id={user_id}")
+        except Exception:
+            logger.error(
+                f"Failed to restrict user: user_id={user_id}",
+                exc_info=True,
+            )
 
 
 async def handle_new_user_spam(
@@ -233,7 +402,7 @@ async def handle_new_user_spam(
         return
 
     # Check if probation has expired
-    # Note: SQLite returns naive datetimes, so we need to make joined_at timezone-aware
+    # Note: the database service returns aware datetimes; naive ones are treated as UTC
     joined_at = record.joined_at
     if joined_at.tzinfo is None:
         joined_at = joined_at.replace(tzinfo=UTC)
@@ -249,78 +418,25 @@ async def handle_new_user_spam(
     user_mention = get_user_mention(user)
 
     # Check for violations (forwarded message or non-whitelisted link or external reply)
-    if not (is_forwarded(msg) or has_non_whitelisted_link(msg) or has_external_reply(msg) or has_story(msg)):
-        return  # Not a violation
+    # Cheap attribute checks run first; URLs are only parsed if none of them
+    # matched, so the link result stays None ("not evaluated") otherwise
+    forwarded = is_forwarded(msg)
+    external_reply = has_external_reply(msg)
+    story = has_story(msg)
+    non_whitelisted_link: bool | None = None
+    if not (forwarded or external_reply or story):
+        non_whitelisted_link = has_non_whitelisted_link(msg)
+        if not non_whitelisted_link:
+            return  # Not a violation
 
     logger.info(
         f"Probation violation detected: user_id={user.id}, "
-        f"forwarded={is_forwarded(msg)}, has_non_whitelisted_link={has_non_whitelisted_link(msg)}, "
-        f"external_reply={has_external_reply(msg)}, has_story={has_story(msg)}"
+        f"forwarded={forwarded}, has_non_whitelisted_link={non_whitelisted_link}, "
+        f"external_reply={external_reply}, has_story={story}"
     )
 
-    # 1. Delete the violating message
-    try:
-        await msg.delete()
-        logger.info(f"Deleted probation violation message from user_id={user.id}")
-    except Exception:
-        logger.error(
-            f"Failed to delete violation message: user_id={user.id}",
-            exc_info=True,
-        )
-
-    # 2. Increment violation count
-    record = db.increment_new_user_violation(user.id, group_config.group_id)
-
-    # 3. First violation: send warning to warning topic
-    if record.violation_count == 1:
-        probation_display = format_hours_display(group_config.new_user_probation_hours)
-        warning_text = NEW_USER_SPAM_WARNING.format(
-            user_mention=user_mention,
-            probation_display=probation_display,
-            rules_link=group_config.rules_link,
-        )
-        try:
-            await context.bot.send_message(
-                chat_id=group_config.group_id,
-                message_thread_id=group_config.warning_topic_id,
-                text=warning_text,
-                parse_mode="Markdown",
-            )
-            logger.info(f"Sent probation warning for user_id={user.id}")
-        except Exception:
-            logger.error(
-                f"Failed to send probation warning: user_id={user.id}",
-                exc_info=True,
-            )
-
-    # 4. Threshold reached: restrict user and notify
-    if record.violation_count == group_config.new_user_violation_threshold:
-        try:
-            await context.bot.restrict_chat_member(
-                chat_id=group_config.group_id,
-                user_id=user.id,
-                permissions=RESTRICTED_PERMISSIONS,
-            )
-            logger.info(
-                f"Restricted user_id={user.id} after {record.violation_count} "
-                f"probation violations"
-            )
-
-            # Send restriction notification to warning topic
-            restriction_text = NEW_USER_SPAM_RESTRICTION.format(
-                user_mention=user_mention,
-                violation_count=record.violation_count,
-                rules_link=group_config.rules_link,
-            )
-            await context.bot.send_message(
-                chat_id=group_config.group_id,
-                message_thread_id=group_config.warning_topic_id,
-                text=restriction_text,
-                parse_mode="Markdown",
-            )
-            logger.info(f"Sent restriction notification for user_id={user.id}")
-        except Exception:
-            logger.error(
-                f"Failed to restrict user: user_id={user.id}",
-                exc_info=True,
-            )
+    # 1. Delete the violating message while the violation is recorded and enforced
+    await asyncio.gather(
+        _delete_violation_message(msg, user.id),
+        _enforce_probation_violation(context, db, group_config, user.id, user_mention),
+    )
@@ -6,7 +6,9 @@ joins the group, they are restricted and presented with a captcha button.
 If they don't verify within the timeout period, they remain restricted.
 """
 
+import asyncio
 import logging
+from weakref import WeakValueDictionary
 
 from sqlalchemy.exc import IntegrityError
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update, User
@@ -24,14 +26,30 @@ from bot.constants import (
     CAPTCHA_VERIFIED_MESSAGE,
     CAPTCHA_WELCOME_MESSAGE,
     CAPTCHA_WRONG_USER_MESSAGE,
-    RESTRICTED_PERMISSIONS,
 )
 from bot.database.service import get_database
 from bot.group_config import GroupConfig, get_group_config_for_update, get_group_registry
+from bot.permissions import RESTRICTED_PERMISSIONS
+from bot.services.admin_cache import AdminCache
 from bot.services.telegram_utils import get_user_mention, unrestrict_user
 
 logger = logging.getLogger(__name__)
 
+# One lock per (group_id, user_id) so the two updates a single join produces
+# (chat_member and the new_chat_members message) can't both send a challenge
+# now that updates are processed concurrently
+_challenge_locks: WeakValueDictionary[tuple[int, int], asyncio.Lock] = WeakValueDictionary()
+
+
+def _get_challenge_lock(group_id: int, user_id: int) -> asyncio.Lock:
+    """Return the captcha challenge lock for a user in a group, creating it if needed."""
+    key = (group_id, user_id)
+    lock = _challenge_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _challenge_locks[key] = lock
+    return lock
+
 
 def get_captcha_job_name(group_id: int, user_id: int) -> str:
     """
@@ -57,6 +75,9 @@ async def _initiate_captcha_challenge(
     Initiate captcha challenge for a new member.
 
     Sends captcha message with keyboard, stores in database, and schedules timeout job.
+    Challenges for the same user and group are serialized, and the pending
+    state is re-checked under the lock, so a join reported by both the
+    chat_member update and the join message only sends one challenge.
 
     Args:
         context: Bot context with helper methods and job queue.
@@ -64,6 +85,20 @@ async def _initiate_captcha_challenge(
         chat_id: The group chat ID.
         group_config: Per-group configuration.
     """
+    async with _get_challenge_lock(group_config.group_id, user.id):
+        if get_database().get_pending_captcha(user.id, group_config.group_id):
+            logger.info(f"Captcha already pending for user {user.id}, skipping duplicate challenge")
+            return
+        await _send_captcha_challenge(context, user, chat_id, group_config)
+
+
+async def _send_captcha_challenge(
+    context: ContextTypes.DEFAULT_TYPE,
+    user: User,
+    chat_id: int,
+    group_config: GroupConfig,
+) -> None:
+    """Restrict the user, send the captcha message, record it and schedule the timeout."""
     user_id = user.id
     user_mention = get_user_mention(user)
 
@@ -108,7 +143,12 @@ async def _initiate_captcha_challenge(
             user_full_name=user.full_name,
         )
     except IntegrityError:
+        # Another challenge was recorded first; don't leave this one orphaned
         logger.info(f"Captcha already exists for user {user_id} (race condition handled)")
+        try:
+            await sent_message.delete()
+        except Exception:
+            logger.warning(f"Failed to delete duplicate captcha message for user {user_id}", exc_info=True)
         return
 
     job_name = get_captcha_job_name(group_config.group_id, user_id)
@@ -206,6 +246,11 @@ async def chat_member_handler(
     old_status = update.chat_member.old_chat_member.status
     new_status = update.chat_member.new_chat_member.status
 
+    # Promotions/demotions make the cached admin list stale
+    admin_statuses = {ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER}
+    if (old_status in admin_statuses) != (new_status in admin_statuses):
+        AdminCache.invalidate(group_config.group_id)
+
     # Detect if this is a join event: user was not a member and now is a member
     left_statuses = {ChatMemberStatus.LEFT, ChatMemberStatus.BANNED}
     member_statuses = {
@@ -353,15 +398,23 @@ async def captcha_timeout_callback(context: ContextTypes.DEFAULT_TYPE) -> None:
     )
 
 
-def get_handlers() -> list:
+def get_handlers(captcha_enabled: bool = True) -> list:
     """
-    Return list of handlers to register for captcha verification.
+    Return list of handlers to register for new member handling and captcha.
+
+    The join handlers are always included because they start new-user
+    probation and keep the admin cache fresh regardless of the captcha
+    setting. The captcha button handler is only needed when at least one
+    group has captcha enabled.
+
+    Args:
+        captcha_enabled: Whether any monitored group has captcha enabled.
 
     Returns:
         list: List containing chat member handler, message handler (fallback),
-              and callback query handler.
+              and (if captcha is enabled) callback query handler.
     """
-    return [
+    handlers: list = [
         # Primary handler: ChatMemberUpdated - works even with hidden join messages
         ChatMemberHandler(
             chat_member_handler,
@@ -372,8 +425,12 @@ def get_handlers() -> list:
             filters.StatusUpdate.NEW_CHAT_MEMBERS,
             new_member_handler,
         ),
-        CallbackQueryHandler(
-            captcha_callback_handler,
-            pattern=r"^captcha_verify_\d+$",
-        ),
     ]
+    if captcha_enabled:
+        handlers.append(
+            CallbackQueryHandler(
+                captcha_callback_handler,
+                pattern=r"^captcha_verify_\d+$",
+            )
+        )
+    return handlers
@@ -8,6 +8,8 @@ This module handles admin commands to manually check user profiles:
 """
 
 import logging
+import re
+from functools import lru_cache
 
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.error import TimedOut
@@ -19,10 +21,11 @@ from bot.constants import (
     ADMIN_CHECK_PROMPT,
     ADMIN_WARN_SENT_MESSAGE,
     ADMIN_WARN_USER_MESSAGE,
-    MISSING_ITEMS_SEPARATOR,
+    MISSING_ITEMS_TEXTS,
 )
 from bot.database.service import get_database
 from bot.group_config import get_group_registry
+from bot.services.chat_cache import ChatCache
 from bot.services.telegram_utils import (
     extract_forwarded_user,
     get_user_mention,
@@ -32,6 +35,25 @@ from bot.services.user_checker import check_user_profile
 
 logger = logging.getLogger(__name__)
 
+# Warn button callback data: warn:<user_id>:<missing_code>
+WARN_CALLBACK_PATTERN = re.compile(r"^warn:(?P<user_id>\d+):(?P<missing_code>[pu]{0,2})$")
+
+# Warn callback missing-items code ("p" = photo, "u" = username) -> display text
+_MISSING_TEXTS = {
+    "p": MISSING_ITEMS_TEXTS[1],
+    "u": MISSING_ITEMS_TEXTS[2],
+    "pu": MISSING_ITEMS_TEXTS[3],
+    "up": MISSING_ITEMS_TEXTS[3],
+}
+
+
+@lru_cache(maxsize=256)
+def _unverify_keyboard(user_id: int) -> InlineKeyboardMarkup:
+    """Build (once per user) the keyboard shown for whitelisted complete profiles."""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton("❌ Unverify User", callback_data=f"unverify:{user_id}")]
+    ])
+
 
 async def _build_check_response(
     bot: Bot, user_id: int, user_name: str
@@ -39,6 +61,9 @@ async def _build_check_response(
     """
     Build the check response message and keyboard.
 
+    The user's chat info comes from ChatCache; callers invalidate or refresh
+    it first so the profile is judged on current data.
+
     Args:
         bot: Telegram bot instance.
         user_id: ID of the user to check.
@@ -48,7 +73,7 @@ async def _build_check_response(
         Tuple of (message text, optional keyboard markup).
     """
     try:
-        chat = await bot.get_chat(user_id)
+        chat = await ChatCache.get_chat(bot, user_id)
         result = await check_user_profile(bot, chat)  # type: ignore
     except Exception as e:
         logger.error(f"Failed to check profile for user {user_id}: {e}")
@@ -63,12 +88,7 @@ async def _build_check_response(
 
     if result.is_complete:
         action_prompt = ADMIN_CHECK_ACTION_COMPLETE
-        if is_whitelisted:
-            keyboard = InlineKeyboardMarkup([
-                [InlineKeyboardButton("❌ Unverify User", callback_data=f"unverify:{user_id}")]
-            ])
-        else:
-            keyboard = None
+        keyboard = _unverify_keyboard(user_id) if is_whitelisted else None
     else:
         action_prompt = ADMIN_CHECK_ACTION_INCOMPLETE
         # Store missing items in callback data (photo,username format)
@@ -115,7 +135,7 @@ async def handle_check_command(
         return
 
     admin_user_id = update.message.from_user.id
-    admin_ids = context.bot_data.get("admin_ids", [])
+    admin_ids = context.bot_data.get("admin_ids", frozenset())
 
     if admin_user_id not in admin_ids:
         await update.message.reply_text("❌ Kamu tidak memiliki izin untuk menggunakan perintah ini.")
@@ -136,8 +156,9 @@ async def handle_check_command(
         return
 
     try:
-        # Get user info for display name
-        chat = await context.bot.get_chat(target_user_id)
+        # Get current user info for display name; the profile check below
+        # reuses this fresh lookup
+        chat = await ChatCache.get_chat(context.bot, target_user_id, refresh=True)
         user_name = chat.full_name or f"User {target_user_id}"
 
         message, keyboard = await _build_check_response(context.bot, target_user_id, user_name)
@@ -168,7 +189,7 @@ async def handle_check_forwarded_message(
         return
 
     admin_user_id = update.message.from_user.id
-    admin_ids = context.bot_data.get("admin_ids", [])
+    admin_ids = context.bot_data.get("admin_ids", frozenset())
 
     if admin_user_id not in admin_ids:
         await update.message.reply_text("❌ Kamu tidak memiliki izin untuk menggunakan fitur ini.")
@@ -188,6 +209,9 @@ async def handle_check_forwarded_message(
 
     user_id, user_name = forwarded_info
 
+    # Judge the user's current profile, not a lookup from an earlier check
+    ChatCache.invalidate(user_id)
+
     try:
         message, keyboard = await _build_check_response(context.bot, user_id, user_name)
         await update.message.reply_text(message, reply_markup=keyboard, parse_mode="Markdown")
@@ -219,7 +243,7 @@ async def handle_warn_callback(
     await query.answer()
 
     admin_user_id = query.from_user.id
-    admin_ids = context.bot_data.get("admin_ids", [])
+    admin_ids = context.bot_data.get("admin_ids", frozenset())
 
     if admin_user_id not in admin_ids:
         await query.edit_message_text("❌ Kamu tidak memiliki izin untuk menggunakan perintah ini.")
@@ -230,28 +254,23 @@ async def handle_warn_callback(
         return
 
     # Parse callback data: warn:<user_id>:<missing_code>
-    try:
-        parts = query.data.split(":")
-        target_user_id = int(parts[1])
-        missing_code = parts[2] if len(parts) > 2 else ""
-    except (IndexError, ValueError):
+    match = WARN_CALLBACK_PATTERN.match(query.data)
+    if match is None:
         await query.edit_message_text("❌ Data callback tidak valid.")
         logger.error(f"Invalid callback_data format: {query.data}")
         return
+    target_user_id = int(match["user_id"])
+    missing_code = match["missing_code"]
 
     # Build missing items text
-    missing_items = []
-    if "p" in missing_code:
-        missing_items.append("foto profil publik")
-    if "u" in missing_code:
-        missing_items.append("username")
-    missing_text = MISSING_ITEMS_SEPARATOR.join(missing_items) if missing_items else "profil"
+    missing_text = _MISSING_TEXTS.get(missing_code, "profil")
 
     registry = get_group_registry()
 
     try:
-        # Get user info for mention
-        chat = await context.bot.get_chat(target_user_id)
+        # Get user info for mention (usually cached by the /check that
+        # produced this button)
+        chat = await ChatCache.get_chat(context.bot, target_user_id)
         user_mention = get_user_mention(chat)
 
         # Send warning to all monitored groups
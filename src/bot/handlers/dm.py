@@ -10,9 +10,10 @@ unrestriction flow. When a restricted user DMs the bot:
    across all monitored groups where they are restricted
 """
 
+import asyncio
 import logging
 
-from telegram import Update
+from telegram import Bot, Update
 from telegram.constants import ChatMemberStatus
 from telegram.ext import ContextTypes
 
@@ -25,16 +26,65 @@ from bot.constants import (
     DM_NO_RESTRICTION_MESSAGE,
     DM_UNRESTRICTION_NOTIFICATION,
     DM_UNRESTRICTION_SUCCESS_MESSAGE,
-    MISSING_ITEMS_SEPARATOR,
+    MISSING_ITEMS_TEXTS,
 )
 from bot.database.service import get_database
-from bot.group_config import get_group_registry
+from bot.group_config import GroupConfig, get_group_registry
 from bot.services.telegram_utils import get_user_mention, get_user_status, unrestrict_user
 from bot.services.user_checker import check_user_profile
 
 logger = logging.getLogger(__name__)
 
 
+def _is_member(user_status: ChatMemberStatus | None) -> bool:
+    """Return True if the status means the user is currently in the group."""
+    return user_status is not None and user_status not in (ChatMemberStatus.LEFT, ChatMemberStatus.BANNED)
+
+
+async def _is_member_of_any_group(bot: Bot, groups: list[GroupConfig], user_id: int) -> bool:
+    """
+    Check whether the user belongs to at least one of the given groups.
+
+    Groups are probed one at a time and the search stops at the first
+    match, so a member usually costs a single getChatMember call.
+
+    Args:
+        bot: Telegram bot instance.
+        groups: Groups to probe.
+        user_id: Telegram user ID.
+
+    Returns:
+        bool: True if the user is a member of any of the groups.
+    """
+    for gc in groups:
+        if _is_member(await get_user_status(bot, gc.group_id, user_id)):
+            return True
+    return False
+
+
+async def _send_unrestriction_notification(bot: Bot, gc: GroupConfig, user_mention: str) -> None:
+    """
+    Announce a DM unrestriction in the group's warning topic, logging any failure.
+
+    Args:
+        bot: Telegram bot instance.
+        gc: Config of the group where the user was unrestricted.
+        user_mention: Markdown mention of the user.
+    """
+    try:
+        await bot.send_message(
+            chat_id=gc.group_id,
+            message_thread_id=gc.warning_topic_id,
+            text=DM_UNRESTRICTION_NOTIFICATION.format(user_mention=user_mention),
+            parse_mode="Markdown",
+        )
+    except Exception:
+        logger.error(
+            f"Failed to send unrestriction notification (group_id={gc.group_id})",
+            exc_info=True,
+        )
+
+
 async def handle_dm(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
     Handle direct messages to the bot for unrestriction flow.
@@ -67,16 +117,33 @@ async def handle_dm(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
     logger.info(f"DM handler called for user_id={user.id} ({user.full_name})")
 
-    # Check user's membership across all monitored groups
-    member_groups = []
-    for gc in registry.all_groups():
-        logger.info(f"Checking user status in group_id={gc.group_id} for user_id={user.id}")
-        user_status = await get_user_status(context.bot, gc.group_id, user.id)
-        if user_status is not None and user_status not in (ChatMemberStatus.LEFT, ChatMemberStatus.BANNED):
-            member_groups.append((gc, user_status))
+    # Only groups where the bot holds state for this user (a restriction to
+    # lift or a pending captcha) need their membership status; the DB checks
+    # are local, so ask Telegram about those groups only
+    groups = list(registry.all_groups())
+    candidate_groups = [
+        gc
+        for gc in groups
+        if db.is_user_restricted_by_bot(user.id, gc.group_id)
+        or db.get_pending_captcha(user.id, gc.group_id)
+    ]
+    candidate_ids = {gc.group_id for gc in candidate_groups}
+    logger.info(f"Checking user status in {len(candidate_groups)} group(s) for user_id={user.id}")
+    statuses = await asyncio.gather(
+        *(get_user_status(context.bot, gc.group_id, user.id) for gc in candidate_groups)
+    )
+    member_groups = [
+        (gc, user_status)
+        for gc, user_status in zip(candidate_groups, statuses)
+        if _is_member(user_status)
+    ]
 
     # User not in any monitored group
-    if not member_groups:
+    if not member_groups and not await _is_member_of_any_group(
+        context.bot,
+        [gc for gc in groups if gc.group_id not in candidate_ids],
+        user.id,
+    ):
         await update.message.reply_text(DM_NOT_IN_GROUP_MESSAGE)
         logger.info(f"DM from user {user.id} ({user.full_name}) - not in any monitored group")
         return
@@ -98,8 +165,7 @@ async def handle_dm(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
     # Profile still incomplete - tell them what's missing
     if not result.is_complete:
-        missing = result.get_missing_items()
-        missing_text = MISSING_ITEMS_SEPARATOR.join(missing)
+        missing_text = MISSING_ITEMS_TEXTS[result.missing_mask]
         reply_message = DM_INCOMPLETE_PROFILE_MESSAGE.format(
             missing_text=missing_text,
             rules_link=settings.rules_link,
@@ -128,6 +194,8 @@ async def handle_dm(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     # Unrestrict user from all groups where restricted by bot
     unrestricted_any = False
     all_already_unrestricted = True
+    user_mention = get_user_mention(user)
+    notification_tasks: list[asyncio.Task[None]] = []
 
     for gc, user_status in restricted_groups:
         # User was restricted by bot but is no longer restricted on Telegram
@@ -147,18 +215,6 @@ async def handle_dm(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
             await unrestrict_user(context.bot, gc.group_id, user.id)
             db.mark_user_unrestricted(user.id, gc.group_id)
             unrestricted_any = True
-
-            # Send notification to warning topic
-            user_mention = get_user_mention(user)
-            notification_message = DM_UNRESTRICTION_NOTIFICATION.format(
-                user_mention=user_mention
-            )
-            await context.bot.send_message(
-                chat_id=gc.group_id,
-                message_thread_id=gc.warning_topic_id,
-                text=notification_message,
-                parse_mode="Markdown",
-            )
             logger.info(
                 f"Unrestricted user {user.id} ({user.full_name}) via DM (group_id={gc.group_id})"
             )
@@ -167,13 +223,22 @@ async def handle_dm(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
                 f"Failed to unrestrict user {user.id} ({user.full_name}) via DM (group_id={gc.group_id})",
                 exc_info=True,
             )
+            continue
 
-    if unrestricted_any:
-        await update.message.reply_text(DM_UNRESTRICTION_SUCCESS_MESSAGE)
-    elif all_already_unrestricted:
-        await update.message.reply_text(DM_ALREADY_UNRESTRICTED_MESSAGE)
-    else:
-        # All unrestriction attempts failed
-        raise RuntimeError(
-            f"Failed to unrestrict user {user.id} in any group"
+        # Notify the warning topic in the background; the user's reply doesn't wait on it
+        notification_tasks.append(
+            asyncio.create_task(_send_unrestriction_notification(context.bot, gc, user_mention))
         )
+
+    try:
+        if unrestricted_any:
+            await update.message.reply_text(DM_UNRESTRICTION_SUCCESS_MESSAGE)
+        elif all_already_unrestricted:
+            await update.message.reply_text(DM_ALREADY_UNRESTRICTED_MESSAGE)
+        else:
+            # All unrestriction attempts failed
+            raise RuntimeError(
+                f"Failed to unrestrict user {user.id} in any group"
+            )
+    finally:
+        await asyncio.gather(*notification_tasks)
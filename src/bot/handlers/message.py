@@ -7,28 +7,45 @@ have complete profiles (photo + username). It implements two modes:
 2. Restriction mode: Progressive enforcement with muting after threshold
 """
 
+import asyncio
 import logging
+from weakref import WeakValueDictionary
 
-from telegram import Update
+from telegram import Bot, Update, User
+from telegram.error import BadRequest, Forbidden
 from telegram.ext import ContextTypes
 
-
 from bot.constants import (
-    MISSING_ITEMS_SEPARATOR,
-    RESTRICTED_PERMISSIONS,
+    MISSING_ITEMS_TEXTS,
     RESTRICTION_MESSAGE_AFTER_MESSAGES,
     WARNING_MESSAGE_NO_RESTRICTION,
     WARNING_MESSAGE_WITH_THRESHOLD,
-    format_threshold_display,
 )
 from bot.database.service import get_database
-from bot.group_config import get_group_config_for_update
+from bot.group_config import GroupConfig, get_group_config_for_update
+from bot.permissions import RESTRICTED_PERMISSIONS
 from bot.services.bot_info import BotInfoCache
 from bot.services.telegram_utils import get_user_mention
-from bot.services.user_checker import check_user_profile
+from bot.services.user_checker import check_user_profile, has_recently_confirmed_photo
 
 logger = logging.getLogger(__name__)
 
+# (group_id, user_id) -> lock serializing that user's messages in that group.
+# Updates are processed concurrently, so without it two quick messages from
+# one user could race through the warning/restriction ladder out of order.
+# Weak values let idle locks be dropped instead of accumulating per user.
+_user_locks: WeakValueDictionary[tuple[int, int], asyncio.Lock] = WeakValueDictionary()
+
+
+def _get_user_lock(group_id: int, user_id: int) -> asyncio.Lock:
+    """Return the lock for a user's messages in a group, creating it if needed."""
+    key = (group_id, user_id)
+    lock = _user_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _user_locks[key] = lock
+    return lock
+
 
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
@@ -44,86 +61,121 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         update: Telegram update containing the message.
         context: Bot context with helper methods.
     """
+    message = update.message
+
     # Skip if no message or sender
-    if not update.message or not update.message.from_user:
-        logger.info("Skipping message: no message or sender")
+    if not message or not message.from_user:
+        logger.debug("Skipping message: no message or sender")
         return
 
     group_config = get_group_config_for_update(update)
 
     # Only process messages from monitored groups
     if group_config is None:
-        logger.info(
-            f"Skipping message: chat not monitored (chat_id={update.effective_chat.id if update.effective_chat else None})"
+        logger.debug(
+            "Skipping message: chat not monitored (chat_id=%s)",
+            update.effective_chat.id if update.effective_chat else None,
         )
         return
 
-    user = update.message.from_user
-    logger.info(
-        f"Handler called: user_id={user.id}, user={user.full_name}, chat_id={update.effective_chat.id}"
+    user = message.from_user
+    bot = context.bot
+    group_id = group_config.group_id
+    logger.debug(
+        "Handler called: user_id=%s, user=%s, chat_id=%s",
+        user.id, user.full_name, group_id,
     )
 
     # Ignore messages from bots
     if user.is_bot:
-        logger.info(f"Skipping message: user is bot (user_id={user.id})")
+        logger.debug("Skipping message: user is bot (user_id=%s)", user.id)
+        return
+
+    # Fast path: username is on the update and the photo was just confirmed,
+    # so the profile is complete without touching the database or the API
+    if user.username is not None and has_recently_confirmed_photo(user.id):
+        logger.debug("User has complete profile (cached): user_id=%s", user.id)
         return
 
+    async with _get_user_lock(group_id, user.id):
+        await _check_and_enforce(bot, group_config, user)
+
+
+async def _check_and_enforce(bot: Bot, group_config: GroupConfig, user: User) -> None:
+    """
+    Check a message sender's profile and warn or restrict them if incomplete.
+
+    Args:
+        bot: Telegram bot instance.
+        group_config: Config of the group the message was sent in.
+        user: Sender of the message.
+    """
+    group_id = group_config.group_id
+    topic_id = group_config.warning_topic_id
+
     # Check if user has complete profile (photo + username)
-    result = await check_user_profile(context.bot, user)
+    result = await check_user_profile(bot, user)
 
     # User has complete profile, nothing to do
     if result.is_complete:
-        logger.info(
-            f"User has complete profile: user_id={user.id}, user={user.full_name}"
+        logger.debug(
+            "User has complete profile: user_id=%s, user=%s", user.id, user.full_name
         )
         return
 
     # Build warning message components
-    missing = result.get_missing_items()
-    missing_text = MISSING_ITEMS_SEPARATOR.join(missing)
+    missing_text = MISSING_ITEMS_TEXTS[result.missing_mask]
     user_mention = get_user_mention(user)
-    logger.info(
-        f"Building warning message: user_id={user.id}, user={user.full_name}, missing={missing_text}"
+    logger.debug(
+        "Building warning message: user_id=%s, user=%s, missing=%s",
+        user.id, user.full_name, missing_text,
     )
 
     # Warning mode: just send warning, don't restrict
     if not group_config.restrict_failed_users:
         try:
-            threshold_display = format_threshold_display(
-                group_config.warning_time_threshold_minutes
-            )
+            threshold_display = group_config.warning_time_threshold_display
             warning_message = WARNING_MESSAGE_NO_RESTRICTION.format(
                 user_mention=user_mention,
                 missing_text=missing_text,
                 threshold_display=threshold_display,
                 rules_link=group_config.rules_link,
             )
-            await context.bot.send_message(
-                chat_id=group_config.group_id,
-                message_thread_id=group_config.warning_topic_id,
+            await bot.send_message(
+                chat_id=group_id,
+                message_thread_id=topic_id,
                 text=warning_message,
                 parse_mode="Markdown",
             )
             logger.info(
-                f"Warned user {user.id} ({user.full_name}) for missing: {missing_text} (group_id={group_config.group_id})"
+                "Warned user %s (%s) for missing: %s (group_id=%s)",
+                user.id, user.full_name, missing_text, group_id,
+            )
+        except (BadRequest, Forbidden) as e:
+            logger.warning(
+                "Failed to send warning message: user_id=%s, user=%s: %s",
+                user.id, user.full_name, e,
             )
         except Exception:
             logger.error(
-                f"Failed to send warning message: user_id={user.id}, user={user.full_name}",
+                "Failed to send warning message: user_id=%s, user=%s",
+                user.id, user.full_name,
                 exc_info=True,
             )
         return
 
     # Progressive restriction mode: track messages and restrict at threshold
     db = get_database()
-    record = db.get_or_create_user_warning(user.id, group_config.group_id)
+    message_count = db.record_user_message(
+        user.id, group_id, group_config.warning_threshold
+    )
 
-    # First message: send warning with threshold info
-    if record.message_count == 1:
+    # First message: send warning with threshold info. Skipped when the
+    # first message already reaches the threshold (warning_threshold=1):
+    # the restriction notice below is then the only message sent.
+    if message_count == 1 and message_count < group_config.warning_threshold:
         try:
-            threshold_display = format_threshold_display(
-                group_config.warning_time_threshold_minutes
-            )
+            threshold_display = group_config.warning_time_threshold_display
             warning_message = WARNING_MESSAGE_WITH_THRESHOLD.format(
                 user_mention=user_mention,
                 missing_text=missing_text,
@@ -131,74 +183,90 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 threshold_display=threshold_display,
                 rules_link=group_config.rules_link,
             )
-            logger.info(
-                f"Sending first warning: user_id={user.id}, user={user.full_name}, threshold={group_config.warning_threshold}"
+            logger.debug(
+                "Sending first warning: user_id=%s, user=%s, threshold=%s",
+                user.id, user.full_name, group_config.warning_threshold,
             )
-            await context.bot.send_message(
-                chat_id=group_config.group_id,
-                message_thread_id=group_config.warning_topic_id,
+            await bot.send_message(
+                chat_id=group_id,
+                message_thread_id=topic_id,
                 text=warning_message,
                 parse_mode="Markdown",
             )
             logger.info(
-                f"First warning for user {user.id} ({user.full_name}) for missing: {missing_text} (group_id={group_config.group_id})"
+                "First warning for user %s (%s) for missing: %s (group_id=%s)",
+                user.id, user.full_name, missing_text, group_id,
+            )
+        except (BadRequest, Forbidden) as e:
+            logger.warning(
+                "Failed to send first warning: user_id=%s, user=%s: %s",
+                user.id, user.full_name, e,
             )
         except Exception:
             logger.error(
-                f"Failed to send first warning: user_id={user.id}, user={user.full_name}",
+                "Failed to send first warning: user_id=%s, user=%s",
+                user.id, user.full_name,
                 exc_info=True,
             )
 
     # Threshold reached: restrict user
-    if record.message_count >= group_config.warning_threshold:
+    if message_count >= group_config.warning_threshold:
         try:
             # Apply restriction (mute user)
-            logger.info(
-                f"Restricting user: user_id={user.id}, user={user.full_name}, message_count={record.message_count}"
+            logger.debug(
+                "Restricting user: user_id=%s, user=%s, message_count=%s",
+                user.id, user.full_name, message_count,
             )
-            await context.bot.restrict_chat_member(
-                chat_id=group_config.group_id,
+            await bot.restrict_chat_member(
+                chat_id=group_id,
                 user_id=user.id,
                 permissions=RESTRICTED_PERMISSIONS,
             )
             logger.info(
-                f"Restriction applied: user_id={user.id}, user={user.full_name}, group_id={group_config.group_id}"
+                "Restriction applied: user_id=%s, user=%s, group_id=%s",
+                user.id, user.full_name, group_id,
             )
-            db.mark_user_restricted(user.id, group_config.group_id)
+            db.mark_user_restricted(user.id, group_id)
 
-            # Get bot username for DM link (cached to avoid repeated API calls)
-            bot_username = await BotInfoCache.get_username(context.bot)
-            dm_link = f"https://t.me/{bot_username}"
+            # DM link for appeal (prefetched in post_init, cached thereafter)
+            dm_link = await BotInfoCache.get_dm_link(bot)
 
             # Send restriction notice with DM link for appeal
             restriction_message = RESTRICTION_MESSAGE_AFTER_MESSAGES.format(
                 user_mention=user_mention,
-                message_count=record.message_count,
+                message_count=message_count,
                 missing_text=missing_text,
                 rules_link=group_config.rules_link,
                 dm_link=dm_link,
             )
-            logger.info(
-                f"Sending restriction notice: user_id={user.id}, user={user.full_name}, message_count={record.message_count}"
+            logger.debug(
+                "Sending restriction notice: user_id=%s, user=%s, message_count=%s",
+                user.id, user.full_name, message_count,
             )
-            await context.bot.send_message(
-                chat_id=group_config.group_id,
-                message_thread_id=group_config.warning_topic_id,
+            await bot.send_message(
+                chat_id=group_id,
+                message_thread_id=topic_id,
                 text=restriction_message,
                 parse_mode="Markdown",
             )
             logger.info(
-                f"Restricted user {user.id} ({user.full_name}) after {record.message_count} messages (group_id={group_config.group_id})"
+                "Restricted user %s (%s) after %s messages (group_id=%s)",
+                user.id, user.full_name, message_count, group_id,
+            )
+        except (BadRequest, Forbidden) as e:
+            logger.warning(
+                "Failed to restrict user: user_id=%s, user=%s, message_count=%s: %s",
+                user.id, user.full_name, message_count, e,
             )
         except Exception:
             logger.error(
-                f"Failed to restrict user: user_id={user.id}, user={user.full_name}, message_count={record.message_count}",
+                "Failed to restrict user: user_id=%s, user=%s, message_count=%s",
+                user.id, user.full_name, message_count,
                 exc_info=True,
             )
     else:
-        # Not at threshold yet: silently increment count (no spam)
-        db.increment_message_count(user.id, group_config.group_id)
-        logger.info(
-            f"Silent increment for user {user.id} ({user.full_name}), "
-            f"count: {record.message_count + 1}/{group_config.warning_threshold}"
+        # Not at threshold yet: the count was already incremented above (no spam)
+        logger.debug(
+            "Silent increment for user %s (%s), count: %s/%s",
+            user.id, user.full_name, message_count + 1, group_config.warning_threshold,
         )
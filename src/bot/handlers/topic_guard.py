@@ -7,15 +7,37 @@ post in the warning topic.
 """
 
 import logging
+from collections.abc import Iterable
 
-from telegram import Update
-from telegram.ext import ContextTypes
+from telegram import Message, Update
+from telegram.ext import ContextTypes, filters
 
-from bot.group_config import get_group_config_for_update
+from bot.group_config import GroupConfig, get_group_config_for_update
+from bot.services.admin_cache import AdminCache
 
 logger = logging.getLogger(__name__)
 
 
+class WarningTopicFilter(filters.MessageFilter):
+    """
+    Match only messages posted in a monitored group's warning topic.
+
+    Lets the dispatcher drop the vast majority of group messages (those
+    outside the warning topic) without ever creating a handler coroutine.
+    """
+
+    __slots__ = ("_topics",)
+
+    def __init__(self, group_configs: Iterable[GroupConfig]):
+        super().__init__(name="WarningTopicFilter")
+        self._topics = frozenset(
+            (gc.group_id, gc.warning_topic_id) for gc in group_configs
+        )
+
+    def filter(self, message: Message) -> bool:
+        return (message.chat.id, message.message_thread_id) in self._topics
+
+
 async def guard_warning_topic(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
     Delete messages from non-admins in the warning topic.
@@ -32,15 +54,17 @@ async def guard_warning_topic(update: Update, context: ContextTypes.DEFAULT_TYPE
         context: Bot context with helper methods.
     """
     try:
+        message = update.message
+
         # Skip if no message or sender
-        if not update.message or not update.message.from_user:
+        if not message or not message.from_user:
             logger.info("No message or no sender, skipping")
             return
 
         group_config = get_group_config_for_update(update)
-        user = update.message.from_user
+        user = message.from_user
         chat_id = update.effective_chat.id if update.effective_chat else None
-        thread_id = update.message.message_thread_id
+        thread_id = message.message_thread_id
 
         logger.info(
             f"Topic guard called: user_id={user.id}, chat_id={chat_id}, thread_id={thread_id}"
@@ -60,25 +84,19 @@ async def guard_warning_topic(update: Update, context: ContextTypes.DEFAULT_TYPE
             )
             return
 
-        bot_id = context.bot.id
+        bot = context.bot
+        bot_id = bot.id
 
         # Allow bot's own messages
         if user.id == bot_id:
             logger.info(f"Allowing bot's own message (bot_id={bot_id})")
             return
 
-        # Check if user is an admin or creator
+        # Check if user is an admin or creator (cached per group)
         logger.info(f"Checking admin status for user {user.id} ({user.full_name})")
-        chat_member = await context.bot.get_chat_member(
-            chat_id=group_config.group_id,
-            user_id=user.id,
-        )
-
-        admin_statuses = ("administrator", "creator")
-        if chat_member.status in admin_statuses:
-            logger.info(
-                f"Allowing message from {chat_member.status} {user.id} ({user.full_name})"
-            )
+        admin_ids = await AdminCache.get_admin_ids(bot, group_config.group_id)
+        if user.id in admin_ids:
+            logger.info(f"Allowing message from admin {user.id} ({user.full_name})")
             return
 
         # Delete message from non-admin user
@@ -86,7 +104,7 @@ async def guard_warning_topic(update: Update, context: ContextTypes.DEFAULT_TYPE
             f"Deleting message from non-admin user {user.id} ({user.full_name}) "
             f"in warning topic (group_id={group_config.group_id}, thread_id={thread_id})"
         )
-        await update.message.delete()
+        await message.delete()
 
     except Exception as e:
         logger.error(
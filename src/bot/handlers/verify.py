@@ -6,19 +6,230 @@ manage the photo verification whitelist for users whose profile pictures are
 hidden due to Telegram privacy settings.
 """
 
+import asyncio
 import logging
+import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 
-from telegram import Bot, Update
+from telegram import Bot, CallbackQuery, Message, Update, User
 from telegram.error import BadRequest
 from telegram.ext import ContextTypes
 
-from bot.constants import VERIFICATION_CLEARANCE_MESSAGE
+from bot.constants import (
+    VERIFICATION_BULK_CONFLICT_MESSAGE,
+    VERIFICATION_BULK_SKIPPED_MESSAGE,
+    VERIFICATION_BULK_SUCCESS_MESSAGE,
+    VERIFICATION_BULK_VERIFIED_IDS,
+    VERIFICATION_CLEARANCE_MESSAGE,
+    VERIFICATION_SUCCESS_MESSAGE,
+    VERIFY_BULK_USAGE_MESSAGE,
+)
 from bot.database.service import DatabaseService, get_database
-from bot.group_config import GroupRegistry, get_group_registry
+from bot.group_config import GroupConfig, GroupRegistry, get_group_registry
+from bot.services.chat_cache import ChatCache
 from bot.services.telegram_utils import get_user_mention, unrestrict_user
 
 logger = logging.getLogger(__name__)
 
+_NOT_ADMIN_MESSAGE = "❌ Kamu tidak memiliki izin untuk menggunakan perintah ini."
+_INTERNAL_ERROR_MESSAGE = "❌ Terjadi kesalahan internal."
+
+# Full tracebacks are logged at most once per interval per action; repeats
+# in between are logged as a single line to avoid flooding the log sink
+_TRACEBACK_INTERVAL_SECONDS = 60.0
+_last_traceback_at: dict[str, float] = {}
+
+# Inline button callback data: verify:<user_id> / unverify:<user_id>
+VERIFY_CALLBACK_PATTERN = re.compile(r"^verify:(?P<user_id>\d+)$")
+UNVERIFY_CALLBACK_PATTERN = re.compile(r"^unverify:(?P<user_id>\d+)$")
+# Matches both button kinds so a single handler can be registered for them
+VERIFICATION_CALLBACK_PATTERN = re.compile(r"^(?:un)?verify:\d+$")
+
+
+async def _check_admin(
+    context: ContextTypes.DEFAULT_TYPE,
+    user: User,
+    reply: Callable[[str], Awaitable[object]],
+    action: str,
+) -> bool:
+    """
+    Check that the user is a group admin, replying with an error if not.
+
+    Args:
+        context: Bot context holding the cached admin IDs.
+        user: User who triggered the action.
+        reply: Coroutine function used to send the rejection text.
+        action: Action name for the log message (e.g. "/verify command").
+
+    Returns:
+        True if the user is an admin.
+    """
+    if user.id in context.bot_data.get("admin_ids", frozenset()):
+        return True
+    await reply(_NOT_ADMIN_MESSAGE)
+    logger.warning(
+        "Non-admin user %s (%s) attempted to use %s", user.id, user.full_name, action
+    )
+    return False
+
+
+async def _parse_command_args(
+    message: Message, args: list[str] | None, command: str
+) -> int | None:
+    """
+    Parse the target user ID from a command's arguments, replying on error.
+
+    Args:
+        message: Message containing the command.
+        args: Command arguments.
+        command: Command name for the usage hint (e.g. "verify").
+
+    Returns:
+        The target user ID, or None if the arguments were invalid.
+    """
+    if not args:
+        await message.reply_text(f"❌ Penggunaan: /{command} USER_ID")
+        return None
+    try:
+        return int(args[0])
+    except ValueError:
+        await message.reply_text("❌ User ID harus berupa angka.")
+        return None
+
+
+async def _parse_callback_data(query: CallbackQuery, pattern: re.Pattern[str]) -> int | None:
+    """
+    Parse the target user ID from callback data, replying on error.
+
+    Args:
+        query: Callback query from the inline button.
+        pattern: Compiled callback pattern with a "user_id" group.
+
+    Returns:
+        The target user ID, or None if the data was invalid.
+    """
+    match = pattern.match(query.data or "")
+    if match is None:
+        await query.edit_message_text("❌ Data callback tidak valid.")
+        logger.error("Invalid callback_data format: %s", query.data)
+        return None
+    return int(match["user_id"])
+
+
+def _log_callback_error(action: str, target_user_id: int) -> None:
+    """
+    Log the exception being handled, with a traceback at most once per interval.
+
+    Must be called from within an ``except`` block.
+
+    Args:
+        action: Action name used to throttle and label the log (e.g. "verify").
+        target_user_id: ID of the user the callback acted on.
+    """
+    now = time.monotonic()
+    last = _last_traceback_at.get(action)
+    if last is None or now - last >= _TRACEBACK_INTERVAL_SECONDS:
+        _last_traceback_at[action] = now
+        logger.exception("Error during %s callback for user %s", action, target_user_id)
+    else:
+        logger.error(
+            "Error during %s callback for user %s (traceback suppressed)",
+            action,
+            target_user_id,
+        )
+
+
+@asynccontextmanager
+async def _answering(query: CallbackQuery) -> AsyncIterator[None]:
+    """
+    Acknowledge a callback query concurrently with the handler body.
+
+    The answer's response isn't needed by anything that follows, so it is
+    sent in the background and only awaited on exit, saving a round-trip
+    before the admin check and database work can start.
+    """
+    answer_task = asyncio.create_task(query.answer())
+    try:
+        yield
+    finally:
+        await answer_task
+
+
+async def _check_private_chat(update: Update) -> bool:
+    """
+    Check that a command was sent in a private chat, replying if not.
+
+    Args:
+        update: Telegram update containing the command.
+
+    Returns:
+        True if the chat is private (or unknown).
+    """
+    if update.effective_chat and update.effective_chat.type != "private":
+        await update.message.reply_text(  # type: ignore[union-attr]
+            "❌ Perintah ini hanya bisa digunakan di chat pribadi dengan bot."
+        )
+        return False
+    return True
+
+
+async def _unrestrict_if_restricted(bot: Bot, group_id: int, user_id: int) -> None:
+    """Unrestrict a user, tolerating users who aren't restricted or in the group."""
+    try:
+        await unrestrict_user(bot, group_id, user_id)
+        logger.info("Unrestricted user %s in group %s during verification", user_id, group_id)
+    except BadRequest as e:
+        # User might not be restricted or not in group - that's okay
+        logger.info("Could not unrestrict user %s in group %s: %s", user_id, group_id, e)
+
+
+async def _send_clearance_notice(bot: Bot, group_config: GroupConfig, user_id: int) -> None:
+    """Tell the group's warning topic that a previously warned user was verified."""
+    # Get user info for proper mention (invalidated by the caller, then
+    # cached across groups)
+    user_info = await ChatCache.get_chat(bot, user_id)
+    user_mention = get_user_mention(user_info)
+
+    # Send clearance message to warning topic
+    clearance_message = VERIFICATION_CLEARANCE_MESSAGE.format(
+        user_mention=user_mention
+    )
+    await bot.send_message(
+        chat_id=group_config.group_id,
+        message_thread_id=group_config.warning_topic_id,
+        text=clearance_message,
+        parse_mode="Markdown"
+    )
+    logger.info(
+        "Sent clearance notification to warning topic for user %s in group %s",
+        user_id,
+        group_config.group_id,
+    )
+
+
+async def _clear_user_in_group(
+    bot: Bot, group_config: GroupConfig, user_id: int, deleted_count: int
+) -> None:
+    """
+    Lift a verified user's restriction in one group and announce the clearance.
+
+    The unrestriction and the clearance notice are independent API calls,
+    so they run concurrently.
+
+    Args:
+        bot: Telegram bot instance.
+        group_config: Group to clear the user in.
+        user_id: ID of the verified user.
+        deleted_count: Number of warning records already deleted in this group.
+    """
+    calls = [_unrestrict_if_restricted(bot, group_config.group_id, user_id)]
+    # Send notification to warning topic if user had previous warnings
+    if deleted_count > 0:
+        calls.append(_send_clearance_notice(bot, group_config, user_id))
+    await asyncio.gather(*calls)
+
 
 async def verify_user(
     bot: Bot, db: DatabaseService, registry: GroupRegistry, target_user_id: int, admin_user_id: int
@@ -43,54 +254,37 @@ async def verify_user(
     Raises:
         ValueError: If user is already whitelisted.
     """
-    db.add_photo_verification_whitelist(
+    groups = registry.all_groups()
+    # Whitelist and delete warnings in all groups in a single transaction,
+    # off the event loop so other updates keep flowing during the write
+    deleted_counts = await asyncio.to_thread(
+        db.verify_user_atomic,
         user_id=target_user_id,
         verified_by_admin_id=admin_user_id,
+        group_ids=[group_config.group_id for group_config in groups],
     )
 
-    # Unrestrict user and delete warnings in all monitored groups
-    total_deleted = 0
-    for group_config in registry.all_groups():
-        # Unrestrict user if they are restricted
-        try:
-            await unrestrict_user(bot, group_config.group_id, target_user_id)
-            logger.info(f"Unrestricted user {target_user_id} in group {group_config.group_id} during verification")
-        except BadRequest as e:
-            # User might not be restricted or not in group - that's okay
-            logger.info(f"Could not unrestrict user {target_user_id} in group {group_config.group_id}: {e}")
-
-        # Delete all warning records for this user in this group
-        deleted_count = db.delete_user_warnings(target_user_id, group_config.group_id)
-        total_deleted += deleted_count
-
-        # Send notification to warning topic if user had previous warnings
-        if deleted_count > 0:
-            # Get user info for proper mention
-            user_info = await bot.get_chat(target_user_id)
-            user_mention = get_user_mention(user_info)
-
-            # Send clearance message to warning topic
-            clearance_message = VERIFICATION_CLEARANCE_MESSAGE.format(
-                user_mention=user_mention
-            )
-            await bot.send_message(
-                chat_id=group_config.group_id,
-                message_thread_id=group_config.warning_topic_id,
-                text=clearance_message,
-                parse_mode="Markdown"
+    # Drop any cached profile so the clearance notices mention the user
+    # by their current username
+    ChatCache.invalidate(target_user_id)
+
+    # Unrestrict user in all monitored groups at once
+    await asyncio.gather(
+        *(
+            _clear_user_in_group(
+                bot, group_config, target_user_id, deleted_counts[group_config.group_id]
             )
-            logger.info(f"Sent clearance notification to warning topic for user {target_user_id} in group {group_config.group_id}")
+            for group_config in groups
+        )
+    )
+    total_deleted = sum(deleted_counts.values())
 
     if total_deleted > 0:
-        logger.info(f"Deleted {total_deleted} total warning record(s) for user {target_user_id}")
-
-    return (
-        f"✅ User dengan ID {target_user_id} telah diverifikasi:\n"
-        f"• Ditambahkan ke whitelist foto profil\n"
-        f"• Pembatasan dicabut (jika ada)\n"
-        f"• Riwayat warning dihapus\n\n"
-        f"User ini tidak akan dicek foto profil lagi."
-    )
+        logger.info(
+            "Deleted %s total warning record(s) for user %s", total_deleted, target_user_id
+        )
+
+    return VERIFICATION_SUCCESS_MESSAGE.format(user_id=target_user_id)
 
 
 async def unverify_user(
@@ -110,13 +304,80 @@ async def unverify_user(
     Raises:
         ValueError: If user is not in whitelist.
     """
-    db.remove_photo_verification_whitelist(user_id=target_user_id)
+    await asyncio.to_thread(db.remove_photo_verification_whitelist, user_id=target_user_id)
     logger.info(
-        f"Admin {admin_user_id} removed user {target_user_id} from photo verification whitelist"
+        "Admin %s removed user %s from photo verification whitelist", admin_user_id, target_user_id
     )
     return f"✅ User dengan ID {target_user_id} telah dihapus dari whitelist verifikasi foto."
 
 
+async def verify_users(
+    bot: Bot,
+    db: DatabaseService,
+    registry: GroupRegistry,
+    target_user_ids: list[int],
+    admin_user_id: int,
+) -> str:
+    """
+    Verify several users at once by adding them to the photo verification whitelist.
+
+    Bulk counterpart of verify_user(): the whitelist inserts and warning
+    deletions for all users happen in one database transaction, then every
+    user is unrestricted and announced in every monitored group concurrently.
+    Users that are already whitelisted are skipped.
+
+    Args:
+        bot: Telegram bot instance.
+        db: Database service instance.
+        registry: Group registry for iterating all groups.
+        target_user_ids: IDs of the users to verify.
+        admin_user_id: ID of the admin performing the verification.
+
+    Returns:
+        Summary message string.
+    """
+    groups = registry.all_groups()
+    deleted_counts = await asyncio.to_thread(
+        db.verify_users_bulk,
+        user_ids=target_user_ids,
+        verified_by_admin_id=admin_user_id,
+        group_ids=[group_config.group_id for group_config in groups],
+    )
+
+    for user_id in deleted_counts:
+        ChatCache.invalidate(user_id)
+
+    await asyncio.gather(
+        *(
+            _clear_user_in_group(bot, group_config, user_id, user_counts[group_config.group_id])
+            for user_id, user_counts in deleted_counts.items()
+            for group_config in groups
+        )
+    )
+
+    verified_ids = list(deleted_counts)
+    skipped_ids = [
+        user_id for user_id in dict.fromkeys(target_user_ids) if user_id not in deleted_counts
+    ]
+    logger.info(
+        "Admin %s bulk verified %s user(s), skipped %s already whitelisted",
+        admin_user_id,
+        len(verified_ids),
+        len(skipped_ids),
+    )
+
+    lines = [VERIFICATION_BULK_SUCCESS_MESSAGE.format(count=len(verified_ids))]
+    if verified_ids:
+        lines.append(
+            VERIFICATION_BULK_VERIFIED_IDS.format(user_ids=", ".join(map(str, verified_ids)))
+        )
+    if skipped_ids:
+        lines.append(
+            VERIFICATION_BULK_SKIPPED_MESSAGE.format(user_ids=", ".join(map(str, skipped_ids)))
+        )
+    return "\n".join(lines)
+
+
 async def handle_verify_command(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> None:
@@ -135,31 +396,17 @@ async def handle_verify_command(
     if not update.message or not update.message.from_user:
         return
 
-    if update.effective_chat and update.effective_chat.type != "private":
-        await update.message.reply_text(
-            "❌ Perintah ini hanya bisa digunakan di chat pribadi dengan bot."
-        )
+    if not await _check_private_chat(update):
         return
 
     admin_user_id = update.message.from_user.id
-    admin_ids = context.bot_data.get("admin_ids", [])
-
-    if admin_user_id not in admin_ids:
-        await update.message.reply_text("❌ Kamu tidak memiliki izin untuk menggunakan perintah ini.")
-        logger.warning(
-            f"Non-admin user {admin_user_id} ({update.message.from_user.full_name}) "
-            f"attempted to use /verify command"
-        )
+    if not await _check_admin(
+        context, update.message.from_user, update.message.reply_text, "/verify command"
+    ):
         return
 
-    if context.args and len(context.args) > 0:
-        try:
-            target_user_id = int(context.args[0])
-        except ValueError:
-            await update.message.reply_text("❌ User ID harus berupa angka.")
-            return
-    else:
-        await update.message.reply_text("❌ Penggunaan: /verify USER_ID")
+    target_user_id = await _parse_command_args(update.message, context.args, "verify")
+    if target_user_id is None:
         return
 
     db = get_database()
@@ -169,14 +416,74 @@ async def handle_verify_command(
         message = await verify_user(context.bot, db, registry, target_user_id, admin_user_id)
         await update.message.reply_text(message)
         logger.info(
-            f"Admin {admin_user_id} ({update.message.from_user.full_name}) "
-            f"whitelisted user {target_user_id} for photo verification"
+            "Admin %s (%s) whitelisted user %s for photo verification",
+            admin_user_id,
+            update.message.from_user.full_name,
+            target_user_id,
         )
     except ValueError as e:
         await update.message.reply_text(f"ℹ️ User dengan ID {target_user_id} sudah ada di whitelist.")
         logger.info(
-            f"Admin {admin_user_id} tried to whitelist {target_user_id} but already exists: {e}"
+            "Admin %s tried to whitelist %s but already exists: %s",
+            admin_user_id,
+            target_user_id,
+            e,
+        )
+
+
+async def handle_verify_bulk_command(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """
+    Handle /verify_bulk command to whitelist several users at once.
+
+    Usage: /verify_bulk USER_ID [USER_ID ...] (e.g., /verify_bulk 123 456 789)
+
+    Only works in bot DMs.
+
+    Args:
+        update: Telegram update containing the command.
+        context: Bot context with helper methods.
+    """
+    if not update.message or not update.message.from_user:
+        return
+
+    if not await _check_private_chat(update):
+        return
+
+    admin_user_id = update.message.from_user.id
+    if not await _check_admin(
+        context, update.message.from_user, update.message.reply_text, "/verify_bulk command"
+    ):
+        return
+
+    if not context.args:
+        await update.message.reply_text(VERIFY_BULK_USAGE_MESSAGE)
+        return
+    try:
+        target_user_ids = [int(arg) for arg in context.args]
+    except ValueError:
+        await update.message.reply_text("❌ User ID harus berupa angka.")
+        return
+
+    db = get_database()
+
+    try:
+        registry = get_group_registry()
+        message = await verify_users(context.bot, db, registry, target_user_ids, admin_user_id)
+        await update.message.reply_text(message)
+        logger.info(
+            "Admin %s (%s) bulk whitelisted %s user(s) for photo verification",
+            admin_user_id,
+            update.message.from_user.full_name,
+            len(target_user_ids),
         )
+    except ValueError as e:
+        await update.message.reply_text(VERIFICATION_BULK_CONFLICT_MESSAGE)
+        logger.info("Admin %s bulk verify raced with another verification: %s", admin_user_id, e)
+    except Exception:
+        await update.message.reply_text(_INTERNAL_ERROR_MESSAGE)
+        logger.exception("Error during /verify_bulk command for %s user(s)", len(target_user_ids))
 
 
 async def handle_unverify_command(
@@ -197,31 +504,17 @@ async def handle_unverify_command(
     if not update.message or not update.message.from_user:
         return
 
-    if update.effective_chat and update.effective_chat.type != "private":
-        await update.message.reply_text(
-            "❌ Perintah ini hanya bisa digunakan di chat pribadi dengan bot."
-        )
+    if not await _check_private_chat(update):
         return
 
     admin_user_id = update.message.from_user.id
-    admin_ids = context.bot_data.get("admin_ids", [])
-
-    if admin_user_id not in admin_ids:
-        await update.message.reply_text("❌ Kamu tidak memiliki izin untuk menggunakan perintah ini.")
-        logger.warning(
-            f"Non-admin user {admin_user_id} ({update.message.from_user.full_name}) "
-            f"attempted to use /unverify command"
-        )
+    if not await _check_admin(
+        context, update.message.from_user, update.message.reply_text, "/unverify command"
+    ):
         return
 
-    if context.args and len(context.args) > 0:
-        try:
-            target_user_id = int(context.args[0])
-        except ValueError:
-            await update.message.reply_text("❌ User ID harus berupa angka.")
-            return
-    else:
-        await update.message.reply_text("❌ Penggunaan: /unverify USER_ID")
+    target_user_id = await _parse_command_args(update.message, context.args, "unverify")
+    if target_user_id is None:
         return
 
     db = get_database()
@@ -232,7 +525,10 @@ async def handle_unverify_command(
     except ValueError as e:
         await update.message.reply_text(f"ℹ️ User dengan ID {target_user_id} tidak ada di whitelist.")
         logger.info(
-            f"Admin {admin_user_id} tried to remove {target_user_id} but not in whitelist: {e}"
+            "Admin %s tried to remove %s but not in whitelist: %s",
+            admin_user_id,
+            target_user_id,
+            e,
         )
 
 
@@ -253,45 +549,38 @@ async def handle_verify_callback(
     if not query or not query.from_user or not query.data:
         return
 
-    await query.answer()
-
-    admin_user_id = query.from_user.id
-    admin_ids = context.bot_data.get("admin_ids", [])
-
-    if admin_user_id not in admin_ids:
-        await query.edit_message_text("❌ Kamu tidak memiliki izin untuk menggunakan perintah ini.")
-        logger.warning(
-            f"Non-admin user {admin_user_id} ({query.from_user.full_name}) "
-            f"attempted to use verify callback"
-        )
-        return
+    async with _answering(query):
+        admin_user_id = query.from_user.id
+        if not await _check_admin(context, query.from_user, query.edit_message_text, "verify callback"):
+            return
 
-    # Extract user_id from callback_data
-    try:
-        target_user_id = int(query.data.split(":")[1])
-    except (IndexError, ValueError):
-        await query.edit_message_text("❌ Data callback tidak valid.")
-        logger.error(f"Invalid callback_data format: {query.data}")
-        return
+        target_user_id = await _parse_callback_data(query, VERIFY_CALLBACK_PATTERN)
+        if target_user_id is None:
+            return
 
-    db = get_database()
+        db = get_database()
 
-    try:
-        registry = get_group_registry()
-        message = await verify_user(context.bot, db, registry, target_user_id, admin_user_id)
-        await query.edit_message_text(message)
-        logger.info(
-            f"Admin {admin_user_id} ({query.from_user.full_name}) "
-            f"verified user {target_user_id} via callback"
-        )
-    except ValueError as e:
-        await query.edit_message_text(f"ℹ️ User dengan ID {target_user_id} sudah ada di whitelist.")
-        logger.info(
-            f"Admin {admin_user_id} tried to verify {target_user_id} via callback but already exists: {e}"
-        )
-    except Exception as e:
-        await query.edit_message_text(f"❌ Terjadi kesalahan: {str(e)}")
-        logger.error(f"Error during verify callback: {e}", exc_info=True)
+        try:
+            registry = get_group_registry()
+            message = await verify_user(context.bot, db, registry, target_user_id, admin_user_id)
+            await query.edit_message_text(message)
+            logger.info(
+                "Admin %s (%s) verified user %s via callback",
+                admin_user_id,
+                query.from_user.full_name,
+                target_user_id,
+            )
+        except ValueError as e:
+            await query.edit_message_text(f"ℹ️ User dengan ID {target_user_id} sudah ada di whitelist.")
+            logger.info(
+                "Admin %s tried to verify %s via callback but already exists: %s",
+                admin_user_id,
+                target_user_id,
+                e,
+            )
+        except Exception:
+            await query.edit_message_text(_INTERNAL_ERROR_MESSAGE)
+            _log_callback_error("verify", target_user_id)
 
 
 async def handle_unverify_callback(
@@ -311,41 +600,54 @@ async def handle_unverify_callback(
     if not query or not query.from_user or not query.data:
         return
 
-    await query.answer()
+    async with _answering(query):
+        admin_user_id = query.from_user.id
+        if not await _check_admin(context, query.from_user, query.edit_message_text, "unverify callback"):
+            return
 
-    admin_user_id = query.from_user.id
-    admin_ids = context.bot_data.get("admin_ids", [])
+        target_user_id = await _parse_callback_data(query, UNVERIFY_CALLBACK_PATTERN)
+        if target_user_id is None:
+            return
 
-    if admin_user_id not in admin_ids:
-        await query.edit_message_text("❌ Kamu tidak memiliki izin untuk menggunakan perintah ini.")
-        logger.warning(
-            f"Non-admin user {admin_user_id} ({query.from_user.full_name}) "
-            f"attempted to use unverify callback"
-        )
-        return
+        db = get_database()
 
-    # Extract user_id from callback_data
-    try:
-        target_user_id = int(query.data.split(":")[1])
-    except (IndexError, ValueError):
-        await query.edit_message_text("❌ Data callback tidak valid.")
-        logger.error(f"Invalid callback_data format: {query.data}")
-        return
+        try:
+            message = await unverify_user(db, target_user_id, admin_user_id)
+            await query.edit_message_text(message)
+            logger.info(
+                "Admin %s (%s) unverified user %s via callback",
+                admin_user_id,
+                query.from_user.full_name,
+                target_user_id,
+            )
+        except ValueError as e:
+            await query.edit_message_text(f"ℹ️ User dengan ID {target_user_id} tidak ada di whitelist.")
+            logger.info(
+                "Admin %s tried to unverify %s via callback but not in whitelist: %s",
+                admin_user_id,
+                target_user_id,
+                e,
+            )
+        except Exception:
+            await query.edit_message_text(_INTERNAL_ERROR_MESSAGE)
+            _log_callback_error("unverify", target_user_id)
 
-    db = get_database()
 
-    try:
-        message = await unverify_user(db, target_user_id, admin_user_id)
-        await query.edit_message_text(message)
-        logger.info(
-            f"Admin {admin_user_id} ({query.from_user.full_name}) "
-            f"unverified user {target_user_id} via callback"
-        )
-    except ValueError as e:
-        await query.edit_message_text(f"ℹ️ User dengan ID {target_user_id} tidak ada di whitelist.")
-        logger.info(
-            f"Admin {admin_user_id} tried to unverify {target_user_id} via callback but not in whitelist: {e}"
-        )
-    except Exception as e:
-        await query.edit_message_text(f"❌ Terjadi kesalahan: {str(e)}")
-        logger.error(f"Error during unverify callback: {e}", exc_info=True)
+async def handle_verification_callback(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """
+    Dispatch a verify or unverify button click to the matching handler.
+
+    Registered once with VERIFICATION_CALLBACK_PATTERN so the dispatcher
+    tries a single regex for both button kinds.
+
+    Args:
+        update: Telegram update containing the callback query.
+        context: Bot context with helper methods.
+    """
+    query = update.callback_query
+    if query and query.data and query.data.startswith("unverify:"):
+        await handle_unverify_callback(update, context)
+    else:
+        await handle_verify_callback(update, context)
@@ -11,8 +11,9 @@ and starts the polling loop. Handler registration order matters:
 import logging
 
 import logfire
+from telegram import Update
 from telegram.error import NetworkError, TimedOut
-from telegram.ext import Application, CallbackQueryHandler, CommandHandler, ContextTypes, MessageHandler, filters
+from telegram.ext import AIORateLimiter, Application, CallbackQueryHandler, CommandHandler, ContextTypes, MessageHandler, filters
 
 from bot.config import get_settings
 from bot.database.service import init_database
@@ -21,18 +22,21 @@ from bot.handlers import captcha
 from bot.handlers.anti_spam import handle_new_user_spam
 from bot.handlers.dm import handle_dm
 from bot.handlers.message import handle_message
-from bot.handlers.topic_guard import guard_warning_topic
+from bot.handlers.topic_guard import WarningTopicFilter, guard_warning_topic
 from bot.handlers.verify import (
-    handle_unverify_callback,
+    VERIFICATION_CALLBACK_PATTERN,
     handle_unverify_command,
-    handle_verify_callback,
+    handle_verification_callback,
+    handle_verify_bulk_command,
     handle_verify_command,
 )
 from bot.handlers.check import (
+    WARN_CALLBACK_PATTERN,
     handle_check_command,
     handle_check_forwarded_message,
     handle_warn_callback,
 )
+from bot.services.bot_info import BotInfoCache
 from bot.services.scheduler import auto_restrict_expired_warnings
 from bot.services.telegram_utils import fetch_group_admin_ids
 
@@ -49,10 +53,14 @@ def configure_logging() -> None:
     - In local dev: console output only (send_to_logfire=False)
     - In production: sends to Logfire only if LOGFIRE_TOKEN is set
     """
-    # Configure basic logging FIRST to capture Settings initialization logs
+    # Configure logging once, FIRST, so Settings initialization logs are captured.
+    # The Logfire handler and the configured level are added to this same setup
+    # below instead of rebuilding it with a second basicConfig call.
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
     logging.basicConfig(
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         level=logging.INFO,
+        handlers=[stream_handler],
         force=True,  # Override any existing config
     )
 
@@ -85,14 +93,10 @@ def configure_logging() -> None:
         inspect_arguments=False,
     )
 
-    # Reconfigure logging with both stream and Logfire handlers
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
-    logging.basicConfig(
-        level=log_level,
-        handlers=[stream_handler, logfire.LogfireLoggingHandler()],
-        force=True,  # Override previous config
-    )
+    # Forward to Logfire as well, at the configured level
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logfire.LogfireLoggingHandler())
+    root_logger.setLevel(log_level)
 
     # Suppress verbose HTTP logs from httpx/httpcore used by python-telegram-bot
     # These libraries log every HTTP request at INFO level, flooding logs with Telegram API polling requests
@@ -109,6 +113,17 @@ def configure_logging() -> None:
 
 logger = logging.getLogger(__name__)
 
+# Update types the bot has handlers for; everything else is never requested.
+# - message: group messages, commands, DMs, forwarded messages, join messages
+# - callback_query: verify/unverify/warn/captcha buttons
+# - chat_member: join detection and admin cache invalidation (requires the bot
+#   to be an admin; Telegram only sends it when explicitly requested)
+# edited_message, my_chat_member, message_reaction etc. have no handlers.
+ALLOWED_UPDATES = [Update.MESSAGE, Update.CALLBACK_QUERY, Update.CHAT_MEMBER]
+
+# Local path the webhook server accepts updates on (appended to WEBHOOK_URL)
+WEBHOOK_PATH = "telegram"
+
 
 async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
@@ -160,9 +175,15 @@ async def post_init(application: Application) -> None:  # type: ignore[type-arg]
             group_admin_ids[gc.group_id] = []
 
     application.bot_data["group_admin_ids"] = group_admin_ids  # type: ignore[index]
-    application.bot_data["admin_ids"] = list(all_admin_ids)  # type: ignore[index]
+    application.bot_data["admin_ids"] = frozenset(all_admin_ids)  # type: ignore[index]
     logger.info(f"Total unique admins across all groups: {len(all_admin_ids)}")
 
+    # Prefetch the bot's username so restriction notices never wait on getMe
+    try:
+        await BotInfoCache.get_dm_link(application.bot)  # type: ignore[arg-type]
+    except Exception as e:
+        logger.error(f"Failed to prefetch bot username: {e}")
+
     # Recover pending captcha verifications for groups with captcha enabled
     has_captcha = any(gc.captcha_enabled for gc in registry.all_groups())
     if has_captcha:
@@ -204,15 +225,30 @@ def main() -> None:
     logger.info(f"Database initialized at {settings.database_path}")
 
     # Build the bot application with the token and post_init callback
-    application = Application.builder().token(settings.telegram_bot_token).post_init(post_init).build()
+    # Updates are processed concurrently so a slow API call in one chat
+    # doesn't stall the others; handle_message serializes per user itself.
+    # Outgoing API calls go through AIORateLimiter, which paces them per chat
+    # and globally and retries on 429 (retry_after) instead of failing.
+    application = (
+        Application.builder()
+        .token(settings.telegram_bot_token)
+        .post_init(post_init)
+        .concurrent_updates(True)
+        .rate_limiter(AIORateLimiter(max_retries=3))
+        .build()
+    )
     application.add_error_handler(error_handler)
     logger.info("Application built successfully")
 
+    # Group-message handlers only ever act on monitored groups; filtering on
+    # chat ID up front keeps other chats from reaching their callbacks at all
+    monitored_groups = filters.Chat(chat_id=[gc.group_id for gc in registry.all_groups()])
+
     # Handler 1: Topic guard - runs first (group -1) to delete unauthorized
     # messages in the warning topic before other handlers process them
     application.add_handler(
         MessageHandler(
-            filters.ALL,
+            WarningTopicFilter(registry.all_groups()),
             guard_warning_topic,
         ),
         group=-1,
@@ -224,6 +260,10 @@ def main() -> None:
         CommandHandler("verify", handle_verify_command)
     )
     logger.info("Registered handler: verify_command (group=0)")
+    application.add_handler(
+        CommandHandler("verify_bulk", handle_verify_bulk_command)
+    )
+    logger.info("Registered handler: verify_bulk_command (group=0)")
 
     # Handler 3: /unverify command - allows admins to remove users from whitelist in DM
     application.add_handler(
@@ -248,22 +288,20 @@ def main() -> None:
 
     # Handler 5: Callback handlers for verify/unverify buttons
     application.add_handler(
-        CallbackQueryHandler(handle_verify_callback, pattern=r"^verify:\d+$")
-    )
-    logger.info("Registered handler: verify_callback (group=0)")
-    application.add_handler(
-        CallbackQueryHandler(handle_unverify_callback, pattern=r"^unverify:\d+$")
+        CallbackQueryHandler(handle_verification_callback, pattern=VERIFICATION_CALLBACK_PATTERN)
     )
-    logger.info("Registered handler: unverify_callback (group=0)")
+    logger.info("Registered handler: verification_callback (group=0)")
     application.add_handler(
-        CallbackQueryHandler(handle_warn_callback, pattern=r"^warn:\d+:")
+        CallbackQueryHandler(handle_warn_callback, pattern=WARN_CALLBACK_PATTERN)
     )
     logger.info("Registered handler: warn_callback (group=0)")
 
-    # Handler 6: Captcha handlers - new member verification
-    for handler in captcha.get_handlers():
+    # Handler 6: Captcha handlers - new member verification. The captcha
+    # button handler is skipped entirely when no group uses captcha.
+    captcha_enabled = any(gc.captcha_enabled for gc in registry.all_groups())
+    for handler in captcha.get_handlers(captcha_enabled=captcha_enabled):
         application.add_handler(handler)
-    logger.info("Registered handler: captcha_handlers (group=0)")
+    logger.info(f"Registered handler: captcha_handlers (group=0, captcha_enabled={captcha_enabled})")
 
     # Handler 7: DM handler - processes private messages (including /start)
     # for the unrestriction flow. Must be registered before group handler
@@ -279,7 +317,7 @@ def main() -> None:
     # Handler 8: New-user anti-spam handler - checks for forwards/links from users on probation
     application.add_handler(
         MessageHandler(
-            filters.ChatType.GROUPS,
+            filters.ChatType.GROUPS & monitored_groups,
             handle_new_user_spam,
         )
     )
@@ -289,7 +327,7 @@ def main() -> None:
     # groups and warns/restricts users with incomplete profiles
     application.add_handler(
         MessageHandler(
-            filters.ChatType.GROUPS & ~filters.COMMAND,
+            filters.ChatType.GROUPS & monitored_groups & ~filters.COMMAND,
             handle_message,
         ),
         group=1,
@@ -306,10 +344,26 @@ def main() -> None:
         )
         logger.info("JobQueue registered: auto_restrict_job (every 5 minutes, first run in 5 minutes)")
 
-    logger.info(f"Starting bot polling for {group_count} group(s)")
     logger.info("All handlers registered successfully")
 
-    application.run_polling(allowed_updates=["message", "callback_query", "chat_member"])
+    # Webhook mode lets Telegram push updates instead of the bot holding a
+    # single getUpdates request open; polling remains the default for local dev
+    if settings.use_webhook:
+        logger.info(
+            f"Starting bot webhook on {settings.webhook_listen}:{settings.webhook_port} "
+            f"for {group_count} group(s)"
+        )
+        application.run_webhook(
+            listen=settings.webhook_listen,
+            port=settings.webhook_port,
+            url_path=WEBHOOK_PATH,
+            webhook_url=f"{settings.webhook_url.rstrip('/')}/{WEBHOOK_PATH}",
+            secret_token=settings.webhook_secret_token,
+            allowed_updates=ALLOWED_UPDATES,
+        )
+    else:
+        logger.info(f"Starting bot polling for {group_count} group(s)")
+        application.run_polling(allowed_updates=ALLOWED_UPDATES)
 
 
 if __name__ == "__main__":
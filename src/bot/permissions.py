@@ -0,0 +1,26 @@
+"""
+Chat permission presets for the PythonID bot.
+
+Kept separate from bot.constants so that modules which only need message
+templates and formatters don't have to import python-telegram-bot.
+"""
+
+from telegram import ChatPermissions
+
+# Permissions applied when restricting a user (effectively mutes them)
+RESTRICTED_PERMISSIONS = ChatPermissions(
+    can_send_messages=False,
+    can_send_audios=False,
+    can_send_documents=False,
+    can_send_photos=False,
+    can_send_videos=False,
+    can_send_video_notes=False,
+    can_send_voice_notes=False,
+    can_send_polls=False,
+    can_send_other_messages=False,
+    can_add_web_page_previews=False,
+    can_change_info=False,
+    can_invite_users=False,
+    can_pin_messages=False,
+    can_manage_topics=False,
+)
@@ -0,0 +1,72 @@
+"""
+Group administrator caching service for the PythonID bot.
+
+This module caches each monitored group's administrator IDs so that
+handlers needing an "is this user an admin?" check (e.g., the warning
+topic guard) can answer from memory instead of calling getChatMember
+for every message.
+"""
+
+import time
+
+from telegram import Bot
+
+from bot.services.telegram_utils import fetch_group_admin_ids
+
+
+class AdminCache:
+    """
+    Time-limited cache of administrator IDs per group.
+
+    Entries expire after TTL_SECONDS and are invalidated early when a
+    chat member update shows someone gaining or losing admin rights.
+
+    Usage:
+        admin_ids = await AdminCache.get_admin_ids(bot, group_id)
+    """
+
+    TTL_SECONDS = 300.0
+
+    # Class-level cache: group_id -> (fetched_at monotonic time, admin IDs)
+    _entries: dict[int, tuple[float, frozenset[int]]] = {}
+
+    @classmethod
+    async def get_admin_ids(cls, bot: Bot, group_id: int) -> frozenset[int]:
+        """
+        Get a group's administrator IDs, fetching only if not cached or expired.
+
+        Args:
+            bot: Telegram bot instance.
+            group_id: Telegram group ID.
+
+        Returns:
+            frozenset[int]: IDs of the group's creator and administrators.
+
+        Raises:
+            Exception: If unable to fetch administrators (bot not in group, etc.).
+        """
+        now = time.monotonic()
+        entry = cls._entries.get(group_id)
+        if entry is not None and now - entry[0] < cls.TTL_SECONDS:
+            return entry[1]
+
+        admin_ids = frozenset(await fetch_group_admin_ids(bot, group_id))
+        cls._entries[group_id] = (now, admin_ids)
+        return admin_ids
+
+    @classmethod
+    def invalidate(cls, group_id: int) -> None:
+        """
+        Drop the cached admin IDs for a group, if any.
+
+        Args:
+            group_id: Telegram group ID.
+        """
+        cls._entries.pop(group_id, None)
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Clear all cached admin IDs (primarily for testing).
+        """
+        cls._entries.clear()
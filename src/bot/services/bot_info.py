@@ -19,10 +19,12 @@ class BotInfoCache:
 
     Usage:
         username = await BotInfoCache.get_username(bot)
+        dm_link = await BotInfoCache.get_dm_link(bot)
     """
 
-    # Class-level cache for bot username
+    # Class-level cache for bot username and the DM link built from it
     _username: str | None = None
+    _dm_link: str | None = None
 
     @classmethod
     async def get_username(cls, bot: Bot) -> str:
@@ -40,9 +42,25 @@ class BotInfoCache:
             cls._username = me.username
         return cls._username
 
+    @classmethod
+    async def get_dm_link(cls, bot: Bot) -> str:
+        """
+        Get the https://t.me link for DMing the bot, built once.
+
+        Args:
+            bot: Telegram bot instance.
+
+        Returns:
+            str: DM link like "https://t.me/<username>".
+        """
+        if cls._dm_link is None:
+            cls._dm_link = f"https://t.me/{await cls.get_username(bot)}"
+        return cls._dm_link
+
     @classmethod
     def reset(cls) -> None:
         """
-        Clear the cached username (primarily for testing).
+        Clear the cached username and DM link (primarily for testing).
         """
         cls._username = None
+        cls._dm_link = None
@@ -0,0 +1,82 @@
+"""
+Chat info caching service for the PythonID bot.
+
+This module provides a short-lived cache for get_chat() results so that
+repeated lookups of the same user within one operation (e.g., the
+clearance mention sent to every group after a verification) don't each
+cost a Telegram API round-trip.
+"""
+
+import time
+
+from telegram import Bot, ChatFullInfo
+
+
+class ChatCache:
+    """
+    Time-limited cache for chat information.
+
+    Entries expire after TTL_SECONDS and expired entries are evicted
+    whenever a new one is stored, so the cache only holds recently used
+    chats. Callers that act on a user's current profile (e.g. /check)
+    pass refresh=True to bypass the cached entry.
+
+    Usage:
+        chat = await ChatCache.get_chat(bot, user_id)
+    """
+
+    TTL_SECONDS = 120.0
+
+    # Class-level cache: chat_id -> (fetched_at monotonic time, chat)
+    _entries: dict[int, tuple[float, ChatFullInfo]] = {}
+
+    @classmethod
+    async def get_chat(cls, bot: Bot, chat_id: int, refresh: bool = False) -> ChatFullInfo:
+        """
+        Get chat info, fetching from the API only if not cached or expired.
+
+        Args:
+            bot: Telegram bot instance.
+            chat_id: Telegram user or group ID.
+            refresh: Always fetch from the API, replacing any cached entry.
+
+        Returns:
+            ChatFullInfo: Chat information.
+        """
+        now = time.monotonic()
+        entry = cls._entries.get(chat_id)
+        if not refresh and entry is not None and now - entry[0] < cls.TTL_SECONDS:
+            return entry[1]
+
+        chat = await bot.get_chat(chat_id)
+        cls._evict_expired(now)
+        cls._entries[chat_id] = (now, chat)
+        return chat
+
+    @classmethod
+    def _evict_expired(cls, now: float) -> None:
+        """Drop entries older than TTL_SECONDS."""
+        expired = [
+            chat_id
+            for chat_id, (fetched_at, _) in cls._entries.items()
+            if now - fetched_at >= cls.TTL_SECONDS
+        ]
+        for chat_id in expired:
+            del cls._entries[chat_id]
+
+    @classmethod
+    def invalidate(cls, chat_id: int) -> None:
+        """
+        Drop the cached entry for a chat, if any.
+
+        Args:
+            chat_id: Telegram user or group ID.
+        """
+        cls._entries.pop(chat_id, None)
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Clear all cached chats (primarily for testing).
+        """
+        cls._entries.clear()
@@ -13,12 +13,11 @@ from telegram.ext import ContextTypes
 
 
 from bot.constants import (
-    RESTRICTED_PERMISSIONS,
     RESTRICTION_MESSAGE_AFTER_TIME,
-    format_threshold_display,
 )
 from bot.database.service import get_database
 from bot.group_config import get_group_registry
+from bot.permissions import RESTRICTED_PERMISSIONS
 from bot.services.bot_info import BotInfoCache
 from bot.services.telegram_utils import get_user_mention, get_user_status
 
@@ -40,10 +39,9 @@ async def auto_restrict_expired_warnings(context: ContextTypes.DEFAULT_TYPE) ->
     registry = get_group_registry()
     db = get_database()
 
-    # Get bot username once for all DM links
+    # Get the bot's DM link once for all restriction notices
     bot = context.bot
-    bot_username = await BotInfoCache.get_username(bot)
-    dm_link = f"https://t.me/{bot_username}"
+    dm_link = await BotInfoCache.get_dm_link(bot)
 
     for group_config in registry.all_groups():
         # Get warnings that exceeded time threshold for this group
@@ -93,9 +91,7 @@ async def auto_restrict_expired_warnings(context: ContextTypes.DEFAULT_TYPE) ->
                     user_mention = f"User {warning.user_id}"
 
                 # Send notification to warning topic
-                threshold_display = format_threshold_display(
-                    group_config.warning_time_threshold_minutes
-                )
+                threshold_display = group_config.warning_time_threshold_display
                 restriction_message = RESTRICTION_MESSAGE_AFTER_TIME.format(
                     user_mention=user_mention,
                     threshold_display=threshold_display,
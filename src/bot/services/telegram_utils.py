@@ -111,7 +111,8 @@ async def unrestrict_user(
     """
     logger.info(f"Unrestricting user_id={user_id} in group_id={group_id}")
     try:
-        # Get group's default permissions
+        # Get group's current default permissions; fetched fresh so a recent
+        # change to the group's settings is never undone
         chat = await bot.get_chat(group_id)
         default_permissions = chat.permissions
         
@@ -5,7 +5,9 @@ This module provides utilities for checking if a Telegram user has
 a complete profile (public photo and username set).
 """
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
 
 from telegram import Bot, User
@@ -14,8 +16,29 @@ from bot.database.service import get_database
 
 logger = logging.getLogger(__name__)
 
+# Seconds a confirmed public profile photo is trusted without re-fetching.
+# Only positive results are cached: a user who just added a photo and
+# DMs the bot must never see a stale "missing photo" answer.
+PROFILE_PHOTO_CACHE_TTL_SECONDS = 30.0
 
-@dataclass
+# user_id -> monotonic time the photo was last confirmed; expired entries
+# are evicted whenever a new confirmation is stored
+_photo_confirmed_at: dict[int, float] = {}
+
+# user_id -> in-flight getUserProfilePhotos lookup, shared by concurrent checks
+_photo_fetches: dict[int, asyncio.Task[bool]] = {}
+
+
+# Missing item names indexed by ProfileCheckResult.missing_mask
+_MISSING_ITEMS: tuple[tuple[str, ...], ...] = (
+    (),
+    ("foto profil publik",),
+    ("username",),
+    ("foto profil publik", "username"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class ProfileCheckResult:
     """
     Result of a user profile completeness check.
@@ -38,6 +61,16 @@ class ProfileCheckResult:
         """
         return self.has_profile_photo and self.has_username
 
+    @property
+    def missing_mask(self) -> int:
+        """
+        Bitmask of missing profile items, for indexing MISSING_ITEMS_TEXTS.
+
+        Returns:
+            int: Bit 0 set if the photo is missing, bit 1 if the username is.
+        """
+        return (not self.has_profile_photo) | (not self.has_username) << 1
+
     def get_missing_items(self) -> list[str]:
         """
         Get list of missing profile items in Indonesian.
@@ -45,12 +78,60 @@ class ProfileCheckResult:
         Returns:
             list[str]: List of missing items (e.g., ["foto profil publik", "username"]).
         """
-        missing = []
-        if not self.has_profile_photo:
-            missing.append("foto profil publik")
-        if not self.has_username:
-            missing.append("username")
-        return missing
+        return list(_MISSING_ITEMS[self.missing_mask])
+
+
+def has_recently_confirmed_photo(user_id: int) -> bool:
+    """Return True if the user's profile photo was confirmed within the TTL."""
+    confirmed_at = _photo_confirmed_at.get(user_id)
+    return (
+        confirmed_at is not None
+        and time.monotonic() - confirmed_at < PROFILE_PHOTO_CACHE_TTL_SECONDS
+    )
+
+
+def clear_profile_photo_cache() -> None:
+    """Clear cached profile photo results (for testing)."""
+    _photo_confirmed_at.clear()
+    _photo_fetches.clear()
+
+
+def _evict_expired_photos(now: float) -> None:
+    """Drop confirmations older than PROFILE_PHOTO_CACHE_TTL_SECONDS."""
+    expired = [
+        user_id
+        for user_id, confirmed_at in _photo_confirmed_at.items()
+        if now - confirmed_at >= PROFILE_PHOTO_CACHE_TTL_SECONDS
+    ]
+    for user_id in expired:
+        del _photo_confirmed_at[user_id]
+
+
+async def _fetch_has_profile_photo(bot: Bot, user_id: int) -> bool:
+    """Fetch whether the user has a public profile photo, caching a positive result."""
+    photos = await bot.get_user_profile_photos(user_id, limit=1)
+    has_profile_photo = photos.total_count > 0
+    if has_profile_photo:
+        now = time.monotonic()
+        _evict_expired_photos(now)
+        _photo_confirmed_at[user_id] = now
+    return has_profile_photo
+
+
+async def _has_profile_photo(bot: Bot, user_id: int) -> bool:
+    """
+    Look up the user's profile photo, coalescing concurrent lookups.
+
+    A burst of messages from one user (or a message racing a DM) shares a
+    single getUserProfilePhotos request instead of issuing one each.
+    """
+    task = _photo_fetches.get(user_id)
+    if task is None:
+        task = asyncio.create_task(_fetch_has_profile_photo(bot, user_id))
+        _photo_fetches[user_id] = task
+        task.add_done_callback(lambda _: _photo_fetches.pop(user_id, None))
+    # Shield so one cancelled caller doesn't cancel the lookup for the others
+    return await asyncio.shield(task)
 
 
 async def check_user_profile(bot: Bot, user: User) -> ProfileCheckResult:
@@ -63,7 +144,8 @@ async def check_user_profile(bot: Bot, user: User) -> ProfileCheckResult:
 
     Note: Profile photos are fetched via API as they're not included
     in the User object. This makes one API call per check unless user
-    is in the whitelist.
+    is in the whitelist or had a photo confirmed within the last
+    PROFILE_PHOTO_CACHE_TTL_SECONDS.
 
     Args:
         bot: Telegram bot instance for API calls.
@@ -76,15 +158,17 @@ async def check_user_profile(bot: Bot, user: User) -> ProfileCheckResult:
     
     has_username = user.username is not None
 
-    db = get_database()
     try:
-        if db.is_user_photo_whitelisted(user.id):
+        # In-memory cache first; the whitelist needs a database query
+        if has_recently_confirmed_photo(user.id):
+            logger.info(f"Using cached profile photo result for user_id={user.id}")
+            has_profile_photo = True
+        elif get_database().is_user_photo_whitelisted(user.id):
             logger.info(f"User {user.id} is photo whitelisted")
             has_profile_photo = True
         else:
             logger.info(f"Fetching profile photos for user_id={user.id}")
-            photos = await bot.get_user_profile_photos(user.id, limit=1)
-            has_profile_photo = photos.total_count > 0
+            has_profile_photo = await _has_profile_photo(bot, user.id)
     except Exception:
         logger.error(f"Error checking profile for user_id={user.id}", exc_info=True)
         raise
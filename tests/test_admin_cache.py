@@ -0,0 +1,63 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from bot.services.admin_cache import AdminCache
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    AdminCache.reset()
+    yield
+    AdminCache.reset()
+
+
+def _bot_with_admins(*user_ids):
+    bot = AsyncMock()
+    admins = []
+    for user_id in user_ids:
+        admin = MagicMock()
+        admin.user.id = user_id
+        admins.append(admin)
+    bot.get_chat_administrators.return_value = admins
+    return bot
+
+
+class TestAdminCache:
+    async def test_fetches_admin_ids_on_first_call(self):
+        bot = _bot_with_admins(1, 2)
+
+        result = await AdminCache.get_admin_ids(bot, -100123)
+
+        assert result == frozenset({1, 2})
+        bot.get_chat_administrators.assert_called_once_with(-100123)
+
+    async def test_caches_admin_ids_on_subsequent_calls(self):
+        bot = _bot_with_admins(1)
+
+        await AdminCache.get_admin_ids(bot, -100123)
+        await AdminCache.get_admin_ids(bot, -100123)
+
+        bot.get_chat_administrators.assert_called_once()
+
+    async def test_refetches_after_ttl(self):
+        bot = _bot_with_admins(1)
+
+        with patch("bot.services.admin_cache.time.monotonic", return_value=1000.0):
+            await AdminCache.get_admin_ids(bot, -100123)
+        with patch(
+            "bot.services.admin_cache.time.monotonic",
+            return_value=1000.0 + AdminCache.TTL_SECONDS,
+        ):
+            await AdminCache.get_admin_ids(bot, -100123)
+
+        assert bot.get_chat_administrators.call_count == 2
+
+    async def test_invalidate_drops_entry(self):
+        bot = _bot_with_admins(1)
+
+        await AdminCache.get_admin_ids(bot, -100123)
+        AdminCache.invalidate(-100123)
+        await AdminCache.get_admin_ids(bot, -100123)
+
+        assert bot.get_chat_administrators.call_count == 2
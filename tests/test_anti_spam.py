@@ -191,10 +191,29 @@ class TestUrlWhitelist:
         # This URL has an invalid character that may cause parsing issues
         assert is_url_whitelisted("\x00invalid") is False
 
-    def test_urlparse_exception_returns_false(self):
+    def test_scheme_in_query_does_not_shift_host(self):
+        """Test that a URL embedded in the query string is not treated as the host."""
+        assert is_url_whitelisted("https://evil.com/r?to=https://github.com") is False
+        assert is_url_whitelisted("evil.com/r?to=https://github.com") is False
+
+    def test_query_and_fragment_ignored(self):
+        """Test that query strings and fragments don't affect the host."""
+        assert is_url_whitelisted("https://github.com?tab=repos") is True
+        assert is_url_whitelisted("https://github.com#readme") is True
+
+    def test_parse_exception_returns_false(self):
         """Test that exceptions during URL parsing return False."""
-        with patch("bot.handlers.anti_spam.urlparse", side_effect=ValueError("parse error")):
+        is_url_whitelisted.cache_clear()
+        with patch("bot.handlers.anti_spam._split_host_path", side_effect=ValueError("parse error")):
             assert is_url_whitelisted("https://github.com/user/repo") is False
+        is_url_whitelisted.cache_clear()
+
+    def test_result_is_memoized(self):
+        """Test that repeated checks of the same URL hit the cache."""
+        is_url_whitelisted.cache_clear()
+        is_url_whitelisted("https://github.com/user/repo")
+        is_url_whitelisted("https://github.com/user/repo")
+        assert is_url_whitelisted.cache_info().hits == 1
 
 
 class TestExtractUrls:
@@ -464,6 +483,35 @@ class TestHandleNewUserSpam:
 
         mock_update.message.delete.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_forwarded_message_logs_link_check_as_not_evaluated(
+        self, mock_update, mock_context, group_config, caplog
+    ):
+        """Test that the skipped link check is logged as None, not False."""
+        mock_update.message.forward_origin = MagicMock()
+        mock_update.message.text = "Check https://spam-site.com/scam"
+
+        mock_record = MagicMock()
+        mock_record.joined_at = datetime.now(UTC)
+
+        updated_record = MagicMock()
+        updated_record.violation_count = 1
+
+        mock_db = MagicMock()
+        mock_db.get_new_user_probation.return_value = mock_record
+        mock_db.increment_new_user_violation.return_value = updated_record
+
+        with (
+            patch("bot.handlers.anti_spam.get_group_config_for_update", return_value=group_config),
+            patch("bot.handlers.anti_spam.get_database", return_value=mock_db),
+            patch("bot.handlers.anti_spam.has_non_whitelisted_link") as mock_link_check,
+            caplog.at_level("INFO", logger="bot.handlers.anti_spam"),
+        ):
+            await handle_new_user_spam(mock_update, mock_context)
+
+        mock_link_check.assert_not_called()
+        assert "forwarded=True, has_non_whitelisted_link=None" in caplog.text
+
     @pytest.mark.asyncio
     async def test_deletes_message_with_non_whitelisted_link(
         self, mock_update, mock_context, group_config
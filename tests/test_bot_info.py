@@ -47,3 +47,15 @@ class TestBotInfoCache:
         await BotInfoCache.get_username(bot)
 
         assert bot.get_me.call_count == 2
+
+    async def test_dm_link_built_from_cached_username(self):
+        bot = AsyncMock()
+        me = MagicMock()
+        me.username = "test_bot"
+        bot.get_me.return_value = me
+
+        assert await BotInfoCache.get_dm_link(bot) == "https://t.me/test_bot"
+        assert await BotInfoCache.get_dm_link(bot) == "https://t.me/test_bot"
+        await BotInfoCache.get_username(bot)
+
+        bot.get_me.assert_called_once()
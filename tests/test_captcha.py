@@ -1,3 +1,4 @@
+import asyncio
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -487,6 +488,16 @@ class TestGetHandlers:
         handlers = get_handlers()
         assert any(isinstance(h, CallbackQueryHandler) for h in handlers)
 
+    def test_get_handlers_without_captcha_keeps_join_handlers_only(self):
+        from telegram.ext import CallbackQueryHandler, ChatMemberHandler
+
+        from bot.handlers.captcha import get_handlers
+
+        handlers = get_handlers(captcha_enabled=False)
+        assert len(handlers) == 2
+        assert any(isinstance(h, ChatMemberHandler) for h in handlers)
+        assert not any(isinstance(h, CallbackQueryHandler) for h in handlers)
+
 
 class TestCaptchaTimeoutCallback:
     async def test_captcha_timeout_keeps_user_restricted(self, mock_context, temp_db):
@@ -686,6 +697,22 @@ class TestChatMemberHandler:
         mock_context.bot.restrict_chat_member.assert_not_called()
         mock_context.bot.send_message.assert_not_called()
 
+    async def test_admin_promotion_invalidates_admin_cache(
+        self, mock_context, group_config, temp_db
+    ):
+        """Test MEMBER -> ADMINISTRATOR drops the group's cached admin list."""
+        from telegram.constants import ChatMemberStatus
+
+        update = self.create_chat_member_update(ChatMemberStatus.MEMBER, ChatMemberStatus.ADMINISTRATOR)
+
+        with (
+            patch("bot.handlers.captcha.get_group_config_for_update", return_value=group_config),
+            patch("bot.handlers.captcha.AdminCache.invalidate") as mock_invalidate,
+        ):
+            await chat_member_handler(update, mock_context)
+
+        mock_invalidate.assert_called_once_with(group_config.group_id)
+
     async def test_left_to_restricted_triggers_captcha(
         self, mock_context, group_config, temp_db
     ):
@@ -735,6 +762,7 @@ class TestChatMemberHandler:
         sent_message = MagicMock()
         sent_message.chat_id = -1001234567890
         sent_message.message_id = 999
+        sent_message.delete = AsyncMock()
         mock_context.bot.send_message.return_value = sent_message
 
         with (
@@ -746,6 +774,67 @@ class TestChatMemberHandler:
 
         # Should handle gracefully and not schedule timeout job
         mock_context.job_queue.run_once.assert_not_called()
+        # The duplicate challenge message is removed instead of left orphaned
+        sent_message.delete.assert_awaited_once()
+
+    async def test_race_condition_duplicate_delete_fails(
+        self, mock_context, group_config, temp_db, caplog
+    ):
+        """Test a failed delete of the duplicate challenge is logged, not raised."""
+        from sqlalchemy.exc import IntegrityError
+        from telegram.constants import ChatMemberStatus
+        from telegram.error import BadRequest
+
+        update = self.create_chat_member_update(ChatMemberStatus.LEFT, ChatMemberStatus.MEMBER)
+
+        sent_message = MagicMock()
+        sent_message.chat_id = -1001234567890
+        sent_message.message_id = 999
+        sent_message.delete = AsyncMock(side_effect=BadRequest("Message can't be deleted"))
+        mock_context.bot.send_message.return_value = sent_message
+
+        with (
+            patch("bot.handlers.captcha.get_group_config_for_update", return_value=group_config),
+            patch("bot.database.service.DatabaseService.add_pending_captcha") as mock_add,
+        ):
+            mock_add.side_effect = IntegrityError(None, None, None)
+            await chat_member_handler(update, mock_context)
+
+        sent_message.delete.assert_awaited_once()
+        mock_context.job_queue.run_once.assert_not_called()
+        records = [
+            r for r in caplog.records
+            if "Failed to delete duplicate captcha message" in r.getMessage()
+        ]
+        assert len(records) == 1
+        assert records[0].levelname == "WARNING"
+
+    async def test_concurrent_join_updates_send_one_challenge(
+        self, mock_context, group_config, temp_db, mock_update_new_member
+    ):
+        """Test chat_member and new_chat_members updates for one join send one captcha."""
+        from telegram.constants import ChatMemberStatus
+
+        update = self.create_chat_member_update(ChatMemberStatus.LEFT, ChatMemberStatus.MEMBER)
+
+        sent_message = MagicMock()
+        sent_message.chat_id = -1001234567890
+        sent_message.message_id = 999
+
+        async def slow_send(**kwargs):
+            await asyncio.sleep(0)
+            return sent_message
+
+        mock_context.bot.send_message.side_effect = slow_send
+
+        with patch("bot.handlers.captcha.get_group_config_for_update", return_value=group_config):
+            await asyncio.gather(
+                chat_member_handler(update, mock_context),
+                new_member_handler(mock_update_new_member, mock_context),
+            )
+
+        mock_context.bot.send_message.assert_called_once()
+        mock_context.job_queue.run_once.assert_called_once()
 
     async def test_bot_member_skipped_in_chat_member(
         self, mock_context, group_config, temp_db
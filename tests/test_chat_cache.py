@@ -0,0 +1,102 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from bot.services.chat_cache import ChatCache
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    ChatCache.reset()
+    yield
+    ChatCache.reset()
+
+
+class TestChatCache:
+    async def test_fetches_chat_on_first_call(self):
+        bot = AsyncMock()
+        chat = MagicMock()
+        bot.get_chat.return_value = chat
+
+        result = await ChatCache.get_chat(bot, 123)
+
+        assert result is chat
+        bot.get_chat.assert_called_once_with(123)
+
+    async def test_caches_chat_on_subsequent_calls(self):
+        bot = AsyncMock()
+        bot.get_chat.return_value = MagicMock()
+
+        await ChatCache.get_chat(bot, 123)
+        await ChatCache.get_chat(bot, 123)
+
+        bot.get_chat.assert_called_once()
+
+    async def test_caches_per_chat_id(self):
+        bot = AsyncMock()
+        bot.get_chat.return_value = MagicMock()
+
+        await ChatCache.get_chat(bot, 123)
+        await ChatCache.get_chat(bot, 456)
+
+        assert bot.get_chat.call_count == 2
+
+    async def test_refetches_after_ttl(self):
+        bot = AsyncMock()
+        bot.get_chat.return_value = MagicMock()
+
+        with patch("bot.services.chat_cache.time.monotonic", return_value=1000.0):
+            await ChatCache.get_chat(bot, 123)
+        with patch(
+            "bot.services.chat_cache.time.monotonic",
+            return_value=1000.0 + ChatCache.TTL_SECONDS,
+        ):
+            await ChatCache.get_chat(bot, 123)
+
+        assert bot.get_chat.call_count == 2
+
+    async def test_errors_are_not_cached(self):
+        bot = AsyncMock()
+        bot.get_chat.side_effect = [Exception("boom"), MagicMock()]
+
+        with pytest.raises(Exception, match="boom"):
+            await ChatCache.get_chat(bot, 123)
+        await ChatCache.get_chat(bot, 123)
+
+        assert bot.get_chat.call_count == 2
+
+    async def test_invalidate_drops_entry(self):
+        bot = AsyncMock()
+        bot.get_chat.return_value = MagicMock()
+
+        await ChatCache.get_chat(bot, 123)
+        ChatCache.invalidate(123)
+        await ChatCache.get_chat(bot, 123)
+
+        assert bot.get_chat.call_count == 2
+
+    async def test_refresh_bypasses_cached_entry(self):
+        bot = AsyncMock()
+        old_chat, new_chat = MagicMock(), MagicMock()
+        bot.get_chat.side_effect = [old_chat, new_chat]
+
+        await ChatCache.get_chat(bot, 123)
+        result = await ChatCache.get_chat(bot, 123, refresh=True)
+
+        assert result is new_chat
+        assert await ChatCache.get_chat(bot, 123) is new_chat
+        assert bot.get_chat.call_count == 2
+
+    async def test_expired_entries_are_evicted_on_insert(self):
+        bot = AsyncMock()
+        bot.get_chat.return_value = MagicMock()
+
+        with patch("bot.services.chat_cache.time.monotonic", return_value=1000.0):
+            await ChatCache.get_chat(bot, 123)
+        with patch(
+            "bot.services.chat_cache.time.monotonic",
+            return_value=1000.0 + ChatCache.TTL_SECONDS,
+        ):
+            await ChatCache.get_chat(bot, 456)
+
+        assert set(ChatCache._entries) == {456}
@@ -7,13 +7,22 @@ from telegram.error import TimedOut
 
 from bot.group_config import GroupConfig, GroupRegistry
 from bot.handlers.check import (
+    WARN_CALLBACK_PATTERN,
     handle_check_command,
     handle_check_forwarded_message,
     handle_warn_callback,
 )
+from bot.services.chat_cache import ChatCache
 from bot.services.user_checker import ProfileCheckResult
 
 
+@pytest.fixture(autouse=True)
+def reset_chat_cache():
+    ChatCache.reset()
+    yield
+    ChatCache.reset()
+
+
 @pytest.fixture
 def mock_settings():
     settings = MagicMock()
@@ -131,6 +140,28 @@ class TestHandleCheckCommand:
         assert "\u2705" in call_args.args[0]
         assert call_args.kwargs.get("reply_markup") is None
 
+    async def test_check_command_ignores_cached_profile(self, mock_update, mock_context):
+        """/check looks the user up fresh instead of trusting the cache."""
+        mock_context.args = ["555666"]
+
+        stale_bot = MagicMock()
+        stale_bot.get_chat = AsyncMock(return_value=MagicMock(username="old_name"))
+        await ChatCache.get_chat(stale_bot, 555666)
+
+        mock_db = MagicMock()
+        mock_db.is_user_photo_whitelisted.return_value = False
+
+        with (
+            patch(
+                "bot.handlers.check.check_user_profile",
+                return_value=ProfileCheckResult(has_profile_photo=True, has_username=True),
+            ),
+            patch("bot.handlers.check.get_database", return_value=mock_db),
+        ):
+            await handle_check_command(mock_update, mock_context)
+
+        mock_context.bot.get_chat.assert_awaited_once_with(555666)
+
     async def test_check_command_complete_profile_whitelisted(
         self, mock_update, mock_context
     ):
@@ -436,6 +467,44 @@ class TestHandleWarnCallback:
         edit_call_args = query.edit_message_text.call_args
         assert "dikirim" in edit_call_args.args[0]
 
+    async def test_warn_callback_reuses_check_lookup(
+        self, mock_update, mock_context, mock_registry
+    ):
+        """Warn click after /check reuses the cached user lookup."""
+        mock_update.message.from_user.id = 12345
+        mock_context.args = ["555666"]
+
+        mock_db = MagicMock()
+        mock_db.is_user_photo_whitelisted.return_value = False
+
+        with (
+            patch(
+                "bot.handlers.check.check_user_profile",
+                return_value=ProfileCheckResult(has_profile_photo=False, has_username=True),
+            ),
+            patch("bot.handlers.check.get_database", return_value=mock_db),
+        ):
+            await handle_check_command(mock_update, mock_context)
+
+        update = MagicMock()
+        query = MagicMock()
+        query.from_user = MagicMock()
+        query.from_user.id = 12345
+        query.from_user.full_name = "Admin User"
+        query.data = "warn:555666:p"
+        query.answer = AsyncMock()
+        query.edit_message_text = AsyncMock()
+        update.callback_query = query
+
+        with patch(
+            "bot.handlers.check.get_group_registry",
+            return_value=mock_registry,
+        ):
+            await handle_warn_callback(update, mock_context)
+
+        mock_context.bot.get_chat.assert_awaited_once_with(555666)
+        mock_context.bot.send_message.assert_called_once()
+
     async def test_warn_callback_success_missing_photo_only(
         self, mock_context, mock_settings, group_config, mock_registry
     ):
@@ -484,6 +553,17 @@ class TestHandleWarnCallback:
         call_args = query.edit_message_text.call_args
         assert "tidak valid" in call_args.args[0]
 
+    def test_warn_callback_pattern(self):
+        """Callback pattern accepts only well-formed warn data."""
+        match = WARN_CALLBACK_PATTERN.match("warn:555666:pu")
+        assert match is not None
+        assert match["user_id"] == "555666"
+        assert match["missing_code"] == "pu"
+        assert WARN_CALLBACK_PATTERN.match("warn:555666:") is not None
+        assert WARN_CALLBACK_PATTERN.match("warn:invalid") is None
+        assert WARN_CALLBACK_PATTERN.match("warn:555666:px") is None
+        assert WARN_CALLBACK_PATTERN.match("verify:555666") is None
+
     async def test_warn_callback_no_query(self, mock_context):
         """Returns early if no callback query."""
         update = MagicMock()
@@ -1,37 +1,39 @@
+import logging
 from datetime import timedelta
 
 import pytest
+from pydantic import ValidationError
 
-from bot.config import Settings, get_settings, get_env_file
+from bot.config import Settings, get_env_file, get_settings, reset_settings
 
 
 class TestGetEnvFile:
     def test_default_production(self, monkeypatch, tmp_path):
-        monkeypatch.delenv("BOT_ENV", raising=False)
+        monkeypatch.setattr("bot.config._BOT_ENV", "production")
         monkeypatch.chdir(tmp_path)
         tmp_path.joinpath(".env").touch()
         assert get_env_file() == ".env"
 
     def test_production_explicit(self, monkeypatch, tmp_path):
-        monkeypatch.setenv("BOT_ENV", "production")
+        monkeypatch.setattr("bot.config._BOT_ENV", "production")
         monkeypatch.chdir(tmp_path)
         tmp_path.joinpath(".env").touch()
         assert get_env_file() == ".env"
 
     def test_staging_environment(self, monkeypatch, tmp_path):
-        monkeypatch.setenv("BOT_ENV", "staging")
+        monkeypatch.setattr("bot.config._BOT_ENV", "staging")
         monkeypatch.chdir(tmp_path)
         tmp_path.joinpath(".env.staging").touch()
         assert get_env_file() == ".env.staging"
 
     def test_unknown_environment_falls_back_to_default(self, monkeypatch, tmp_path):
-        monkeypatch.setenv("BOT_ENV", "unknown")
+        monkeypatch.setattr("bot.config._BOT_ENV", "unknown")
         monkeypatch.chdir(tmp_path)
         tmp_path.joinpath(".env").touch()
         assert get_env_file() == ".env"
     
     def test_no_env_file_returns_none(self, monkeypatch, tmp_path):
-        monkeypatch.delenv("BOT_ENV", raising=False)
+        monkeypatch.setattr("bot.config._BOT_ENV", "production")
         monkeypatch.chdir(tmp_path)
         assert get_env_file() is None
 
@@ -61,16 +63,32 @@ class TestSettings:
         monkeypatch.setenv("GROUP_ID", "-100999")
         monkeypatch.setenv("WARNING_TOPIC_ID", "1")
 
-        get_settings.cache_clear()
+        reset_settings()
 
         settings1 = get_settings()
         settings2 = get_settings()
 
         assert settings1 is settings2
 
+    def test_reset_settings_reloads(self, monkeypatch):
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "first_token")
+        monkeypatch.setenv("GROUP_ID", "-100999")
+        monkeypatch.setenv("WARNING_TOPIC_ID", "1")
+
+        reset_settings()
+        settings1 = get_settings()
+
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "second_token")
+        reset_settings()
+        settings2 = get_settings()
+
+        assert settings1 is not settings2
+        assert settings2.telegram_bot_token == "second_token"
+        reset_settings()
+
     def test_logfire_environment_auto_detection_staging(self, monkeypatch):
         """Test that logfire_environment is set to 'staging' when BOT_ENV=staging."""
-        monkeypatch.setenv("BOT_ENV", "staging")
+        monkeypatch.setattr("bot.config._BOT_ENV", "staging")
         monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
         monkeypatch.setenv("GROUP_ID", "-100999")
         monkeypatch.setenv("WARNING_TOPIC_ID", "1")
@@ -81,7 +99,7 @@ class TestSettings:
 
     def test_logfire_environment_defaults_to_production(self, monkeypatch):
         """Test that logfire_environment defaults to production when BOT_ENV is not set."""
-        monkeypatch.delenv("BOT_ENV", raising=False)
+        monkeypatch.setattr("bot.config._BOT_ENV", "production")
         monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
         monkeypatch.setenv("GROUP_ID", "-100999")
         monkeypatch.setenv("WARNING_TOPIC_ID", "1")
@@ -90,6 +108,17 @@ class TestSettings:
 
         assert settings.logfire_environment == "production"
 
+    def test_settings_are_frozen(self, monkeypatch):
+        """Test that Settings cannot be mutated after construction."""
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
+        monkeypatch.setenv("GROUP_ID", "-100999")
+        monkeypatch.setenv("WARNING_TOPIC_ID", "1")
+
+        settings = Settings(_env_file=None)
+
+        with pytest.raises(ValidationError):
+            settings.warning_threshold = 10
+
     def test_probation_timedelta(self, monkeypatch):
         """Test probation_timedelta property returns correct timedelta."""
         monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
@@ -123,6 +152,43 @@ class TestSettings:
 
         assert settings.captcha_timeout_timedelta == timedelta(seconds=90)
 
+    def test_debug_logging_masks_token(self, monkeypatch, caplog):
+        """Test that configuration is logged at DEBUG level with the token masked."""
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "secret_token_abcd")
+        monkeypatch.setenv("GROUP_ID", "-100999")
+        monkeypatch.setenv("WARNING_TOPIC_ID", "1")
+
+        with caplog.at_level(logging.DEBUG, logger="bot.config"):
+            Settings(_env_file=None)
+
+        assert "group_id: -100999" in caplog.text
+        assert "telegram_bot_token: ***abcd" in caplog.text
+        assert "secret_token" not in caplog.text
+
+    def test_debug_logging_skipped_when_disabled(self, monkeypatch, caplog):
+        """Test that per-field configuration logs are skipped above DEBUG level."""
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
+        monkeypatch.setenv("GROUP_ID", "-100999")
+        monkeypatch.setenv("WARNING_TOPIC_ID", "1")
+
+        with caplog.at_level(logging.INFO, logger="bot.config"):
+            Settings(_env_file=None)
+
+        assert "Configuration loaded successfully" in caplog.text
+        assert "group_id:" not in caplog.text
+
+    def test_timedeltas_computed_once(self, monkeypatch):
+        """Test timedelta properties return the same cached object on repeated access."""
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
+        monkeypatch.setenv("GROUP_ID", "-100999")
+        monkeypatch.setenv("WARNING_TOPIC_ID", "1")
+
+        settings = Settings(_env_file=None)
+
+        assert settings.probation_timedelta is settings.probation_timedelta
+        assert settings.warning_time_threshold_timedelta is settings.warning_time_threshold_timedelta
+        assert settings.captcha_timeout_timedelta is settings.captcha_timeout_timedelta
+
 
 class TestSettingsValidation:
     def test_group_id_must_be_negative(self, monkeypatch):
@@ -183,3 +249,39 @@ class TestSettingsValidation:
 
         with pytest.raises(ValueError, match="warning_time_threshold_minutes must be greater than 0"):
             Settings(_env_file=None)
+
+    def test_webhook_url_required_when_webhook_enabled(self, monkeypatch):
+        """Test that webhook_url must be set when use_webhook is enabled."""
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
+        monkeypatch.setenv("GROUP_ID", "-100999")
+        monkeypatch.setenv("WARNING_TOPIC_ID", "1")
+        monkeypatch.setenv("USE_WEBHOOK", "true")
+        monkeypatch.setenv("WEBHOOK_SECRET_TOKEN", "secret")
+
+        with pytest.raises(ValueError, match="webhook_url is required"):
+            Settings(_env_file=None)
+
+    def test_webhook_secret_token_required_when_webhook_enabled(self, monkeypatch):
+        """Test that webhook_secret_token must be set when use_webhook is enabled."""
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
+        monkeypatch.setenv("GROUP_ID", "-100999")
+        monkeypatch.setenv("WARNING_TOPIC_ID", "1")
+        monkeypatch.setenv("USE_WEBHOOK", "true")
+        monkeypatch.setenv("WEBHOOK_URL", "https://bot.example.com")
+
+        with pytest.raises(ValueError, match="webhook_secret_token is required"):
+            Settings(_env_file=None)
+
+    def test_webhook_mode_with_url_and_secret_is_valid(self, monkeypatch):
+        """Test that webhook mode loads when both URL and secret are set."""
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
+        monkeypatch.setenv("GROUP_ID", "-100999")
+        monkeypatch.setenv("WARNING_TOPIC_ID", "1")
+        monkeypatch.setenv("USE_WEBHOOK", "true")
+        monkeypatch.setenv("WEBHOOK_URL", "https://bot.example.com")
+        monkeypatch.setenv("WEBHOOK_SECRET_TOKEN", "secret")
+
+        settings = Settings(_env_file=None)
+
+        assert settings.use_webhook is True
+        assert settings.webhook_secret_token == "secret"
@@ -4,7 +4,12 @@ Tests for the constants module.
 Tests utility functions like format_threshold_display and format_hours_display.
 """
 
-from bot.constants import format_hours_display, format_threshold_display
+from bot.constants import (
+    format_hours_display,
+    format_threshold_display,
+    whitelisted_telegram_paths,
+    whitelisted_url_domains,
+)
 
 
 class TestFormatThresholdDisplay:
@@ -22,6 +27,13 @@ class TestFormatThresholdDisplay:
         assert format_threshold_display(1) == "1 menit"
         assert format_threshold_display(59) == "59 menit"
 
+    def test_result_is_memoized(self):
+        """Test that repeated calls with the same value hit the cache."""
+        format_threshold_display.cache_clear()
+        format_threshold_display(180)
+        format_threshold_display(180)
+        assert format_threshold_display.cache_info().hits == 1
+
 
 class TestFormatHoursDisplay:
     def test_formats_days_when_hours_is_24_or_more(self):
@@ -36,3 +48,22 @@ class TestFormatHoursDisplay:
         assert format_hours_display(1) == "1 jam"
         assert format_hours_display(12) == "12 jam"
         assert format_hours_display(23) == "23 jam"
+
+    def test_result_is_memoized(self):
+        """Test that repeated calls with the same value hit the cache."""
+        format_hours_display.cache_clear()
+        format_hours_display(72)
+        format_hours_display(72)
+        assert format_hours_display.cache_info().hits == 1
+
+
+class TestWhitelistAccessors:
+    def test_url_domains_built_once(self):
+        """Test that the URL domain whitelist is cached after first access."""
+        assert whitelisted_url_domains() is whitelisted_url_domains()
+        assert "github.com" in whitelisted_url_domains()
+
+    def test_telegram_paths_built_once(self):
+        """Test that the Telegram path whitelist is cached after first access."""
+        assert whitelisted_telegram_paths() is whitelisted_telegram_paths()
+        assert "pythonid" in whitelisted_telegram_paths()
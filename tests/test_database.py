@@ -1,18 +1,43 @@
+import sqlite3
 import tempfile
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlmodel import Session
 
 from bot.database.models import UserWarning
 from bot.database.service import (
     DatabaseService,
+    ProbationRow,
     get_database,
     init_database,
     reset_database,
 )
 
 
+def _stale_whitelist_check():
+    """Make the first query in a session miss existing whitelist rows.
+
+    Simulates another verification committing between the whitelist check
+    and the insert.
+    """
+    original_exec = Session.exec
+    calls = []
+
+    def exec_(self, statement, *args, **kwargs):
+        calls.append(statement)
+        if len(calls) == 1:
+            result = MagicMock()
+            result.first.return_value = None
+            result.all.return_value = []
+            return result
+        return original_exec(self, statement, *args, **kwargs)
+
+    return patch.object(Session, "exec", exec_)
+
+
 @pytest.fixture
 def temp_db():
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -38,6 +63,30 @@ class TestDatabaseService:
             assert db_path.exists()
             reset_database()
 
+    def test_connections_use_tuned_pragmas(self, db_service):
+        with db_service._engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+            assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+            assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2  # MEMORY
+            assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -64000
+
+    def test_adds_composite_indexes_to_existing_database(self, temp_db):
+        reset_database()
+        with sqlite3.connect(temp_db) as conn:
+            conn.execute("DROP INDEX ix_user_warnings_user_group")
+            conn.execute("DROP INDEX ix_new_user_probation_user_group")
+
+        init_database(str(temp_db))
+
+        with sqlite3.connect(temp_db) as conn:
+            names = {
+                row[0]
+                for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            }
+        assert "ix_user_warnings_user_group" in names
+        assert "ix_new_user_probation_user_group" in names
+
 
 class TestGetOrCreateUserWarning:
     def test_creates_new_record(self, db_service):
@@ -93,6 +142,55 @@ class TestIncrementMessageCount:
             db_service.increment_message_count(user_id=999, group_id=-100999)
 
 
+    def test_skips_restricted_record(self, db_service):
+        db_service.get_or_create_user_warning(user_id=123, group_id=-100999)
+        db_service.mark_user_restricted(user_id=123, group_id=-100999)
+
+        with pytest.raises(ValueError):
+            db_service.increment_message_count(user_id=123, group_id=-100999)
+
+    def test_returned_record_is_usable_after_commit(self, db_service):
+        created = db_service.get_or_create_user_warning(user_id=123, group_id=-100999)
+
+        record = db_service.increment_message_count(user_id=123, group_id=-100999)
+
+        assert record.id == created.id
+        assert record.last_message_at >= created.last_message_at
+
+class TestRecordUserMessage:
+    def test_creates_record_and_counts_first_message(self, db_service):
+        count = db_service.record_user_message(user_id=123, group_id=-100999, warning_threshold=3)
+
+        assert count == 1
+        record = db_service.get_or_create_user_warning(user_id=123, group_id=-100999)
+        assert record.message_count == 2
+
+    def test_increments_below_threshold(self, db_service):
+        counts = [
+            db_service.record_user_message(user_id=123, group_id=-100999, warning_threshold=3)
+            for _ in range(3)
+        ]
+
+        assert counts == [1, 2, 3]
+
+    def test_does_not_increment_at_threshold(self, db_service):
+        for _ in range(4):
+            count = db_service.record_user_message(user_id=123, group_id=-100999, warning_threshold=3)
+
+        assert count == 3
+        record = db_service.get_or_create_user_warning(user_id=123, group_id=-100999)
+        assert record.message_count == 3
+
+    def test_starts_new_record_after_restriction(self, db_service):
+        for _ in range(3):
+            db_service.record_user_message(user_id=123, group_id=-100999, warning_threshold=3)
+        db_service.mark_user_restricted(user_id=123, group_id=-100999)
+
+        count = db_service.record_user_message(user_id=123, group_id=-100999, warning_threshold=3)
+
+        assert count == 1
+
+
 class TestMarkUserRestricted:
     def test_marks_as_restricted(self, db_service):
         db_service.get_or_create_user_warning(user_id=123, group_id=-100999)
@@ -227,6 +325,97 @@ class TestDeleteUserWarnings:
         assert deleted_count == 0
 
 
+class TestVerifyUserAtomic:
+    def test_whitelists_and_deletes_warnings_per_group(self, db_service):
+        db_service.get_or_create_user_warning(user_id=12345, group_id=-100111)
+        db_service.get_or_create_user_warning(user_id=12345, group_id=-100222)
+        db_service.get_or_create_user_warning(user_id=67890, group_id=-100111)
+
+        deleted = db_service.verify_user_atomic(
+            user_id=12345, verified_by_admin_id=1, group_ids=[-100111, -100222, -100333]
+        )
+
+        assert deleted == {-100111: 1, -100222: 1, -100333: 0}
+        assert db_service.is_user_photo_whitelisted(12345) is True
+        assert db_service.delete_user_warnings(user_id=12345, group_id=-100111) == 0
+        assert db_service.delete_user_warnings(user_id=67890, group_id=-100111) == 1
+
+    def test_already_whitelisted_raises_and_keeps_warnings(self, db_service):
+        db_service.add_photo_verification_whitelist(user_id=12345, verified_by_admin_id=1)
+        db_service.get_or_create_user_warning(user_id=12345, group_id=-100111)
+
+        with pytest.raises(ValueError, match="already whitelisted"):
+            db_service.verify_user_atomic(
+                user_id=12345, verified_by_admin_id=1, group_ids=[-100111]
+            )
+
+        assert db_service.delete_user_warnings(user_id=12345, group_id=-100111) == 1
+
+
+    def test_concurrent_insert_raises_value_error(self, db_service):
+        db_service.add_photo_verification_whitelist(user_id=12345, verified_by_admin_id=2)
+        db_service.get_or_create_user_warning(user_id=12345, group_id=-100111)
+
+        with _stale_whitelist_check(), pytest.raises(ValueError, match="already whitelisted"):
+            db_service.verify_user_atomic(
+                user_id=12345, verified_by_admin_id=1, group_ids=[-100111]
+            )
+
+        # Rolled back: the warning deletion is not committed
+        assert db_service.delete_user_warnings(user_id=12345, group_id=-100111) == 1
+
+
+class TestVerifyUsersBulk:
+    def test_whitelists_all_and_deletes_warnings(self, db_service):
+        db_service.get_or_create_user_warning(user_id=111, group_id=-100111)
+        db_service.get_or_create_user_warning(user_id=222, group_id=-100111)
+        db_service.get_or_create_user_warning(user_id=222, group_id=-100222)
+
+        deleted = db_service.verify_users_bulk(
+            user_ids=[111, 222, 333], verified_by_admin_id=1, group_ids=[-100111, -100222]
+        )
+
+        assert deleted == {
+            111: {-100111: 1, -100222: 0},
+            222: {-100111: 1, -100222: 1},
+            333: {-100111: 0, -100222: 0},
+        }
+        for user_id in (111, 222, 333):
+            assert db_service.is_user_photo_whitelisted(user_id) is True
+
+    def test_skips_already_whitelisted_and_duplicates(self, db_service):
+        db_service.add_photo_verification_whitelist(user_id=111, verified_by_admin_id=1)
+        db_service.get_or_create_user_warning(user_id=111, group_id=-100111)
+
+        deleted = db_service.verify_users_bulk(
+            user_ids=[111, 222, 222], verified_by_admin_id=1, group_ids=[-100111]
+        )
+
+        assert deleted == {222: {-100111: 0}}
+        # Existing whitelist entry's warnings are left untouched
+        assert db_service.delete_user_warnings(user_id=111, group_id=-100111) == 1
+
+    def test_concurrent_insert_raises_value_error(self, db_service):
+        db_service.add_photo_verification_whitelist(user_id=222, verified_by_admin_id=2)
+        db_service.get_or_create_user_warning(user_id=111, group_id=-100111)
+
+        with _stale_whitelist_check(), pytest.raises(ValueError, match="already whitelisted"):
+            db_service.verify_users_bulk(
+                user_ids=[111, 222], verified_by_admin_id=1, group_ids=[-100111]
+            )
+
+        # Nothing from the batch is committed
+        assert db_service.is_user_photo_whitelisted(111) is False
+        assert db_service.delete_user_warnings(user_id=111, group_id=-100111) == 1
+
+    def test_all_already_whitelisted_returns_empty(self, db_service):
+        db_service.add_photo_verification_whitelist(user_id=111, verified_by_admin_id=1)
+
+        assert db_service.verify_users_bulk(
+            user_ids=[111], verified_by_admin_id=1, group_ids=[-100111]
+        ) == {}
+
+
 class TestModuleLevelFunctions:
     def test_get_database_raises_error_before_init(self):
         """Test that get_database raises RuntimeError if init_database not called."""
@@ -289,6 +478,20 @@ class TestNewUserProbation:
         assert record is not None
         assert record.user_id == 1001
 
+    def test_get_new_user_probation_parses_row(self, db_service: DatabaseService):
+        """Test that get_new_user_probation returns a ProbationRow with parsed datetimes."""
+        db_service.start_new_user_probation(user_id=1001, group_id=-100)
+        db_service.increment_new_user_violation(user_id=1001, group_id=-100)
+
+        record = db_service.get_new_user_probation(user_id=1001, group_id=-100)
+
+        assert isinstance(record, ProbationRow)
+        assert isinstance(record.joined_at, datetime)
+        assert isinstance(record.first_violation_at, datetime)
+        assert isinstance(record.last_violation_at, datetime)
+        assert record.joined_at.tzinfo is UTC
+        assert record.violation_count == 1
+
     def test_get_new_user_probation_returns_none_if_not_exists(
         self, db_service: DatabaseService
     ):
@@ -297,6 +500,24 @@ class TestNewUserProbation:
 
         assert record is None
 
+    def test_get_new_user_probation_returns_none_if_row_deleted_externally(
+        self, db_service: DatabaseService
+    ):
+        """Test that a known key whose row is gone from the database returns None."""
+        from sqlmodel import delete
+
+        from bot.database.models import NewUserProbation
+
+        db_service.start_new_user_probation(user_id=1001, group_id=-100)
+        # Delete behind the service's back so its in-memory key set still has the user
+        with Session(db_service._engine) as session:
+            session.exec(delete(NewUserProbation).where(NewUserProbation.user_id == 1001))
+            session.commit()
+
+        record = db_service.get_new_user_probation(user_id=1001, group_id=-100)
+
+        assert record is None
+
     def test_increment_new_user_violation(self, db_service: DatabaseService):
         """Test that increment_new_user_violation updates count and timestamps."""
         db_service.start_new_user_probation(user_id=1001, group_id=-100)
@@ -318,6 +539,19 @@ class TestNewUserProbation:
 
         assert record.violation_count == 2
 
+    def test_increment_new_user_violation_keeps_first_violation_at(
+        self, db_service: DatabaseService
+    ):
+        """Test that later violations don't overwrite the first violation timestamp."""
+        db_service.start_new_user_probation(user_id=1001, group_id=-100)
+
+        first = db_service.increment_new_user_violation(user_id=1001, group_id=-100)
+        second = db_service.increment_new_user_violation(user_id=1001, group_id=-100)
+
+        assert isinstance(second, ProbationRow)
+        assert second.first_violation_at == first.first_violation_at
+        assert second.last_violation_at >= first.last_violation_at
+
     def test_increment_new_user_violation_raises_if_no_record(
         self, db_service: DatabaseService
     ):
@@ -333,3 +567,25 @@ class TestNewUserProbation:
 
         record = db_service.get_new_user_probation(user_id=1001, group_id=-100)
         assert record is None
+
+    def test_get_new_user_probation_skips_query_for_unknown_user(
+        self, db_service: DatabaseService
+    ):
+        """Test that users without probation are answered from memory."""
+        db_service.start_new_user_probation(user_id=1001, group_id=-100)
+
+        with patch("bot.database.service.Session") as mock_session:
+            record = db_service.get_new_user_probation(user_id=9999, group_id=-100)
+
+        assert record is None
+        mock_session.assert_not_called()
+
+    def test_probation_keys_loaded_from_existing_database(self, temp_db):
+        """Test that probation records persisted earlier are found by a new service."""
+        DatabaseService(str(temp_db)).start_new_user_probation(user_id=1001, group_id=-100)
+
+        service = DatabaseService(str(temp_db))
+        record = service.get_new_user_probation(user_id=1001, group_id=-100)
+
+        assert record is not None
+        assert record.user_id == 1001
@@ -126,6 +126,61 @@ class TestHandleDM:
         call_args = mock_update.message.reply_text.call_args
         assert "belum bergabung di grup" in call_args.args[0]
 
+    async def test_stops_probing_groups_at_first_membership(
+        self, mock_update, mock_context, mock_settings, group_config, temp_db
+    ):
+        registry = GroupRegistry()
+        registry.register(group_config)
+        registry.register(GroupConfig(group_id=-1009999999999, warning_topic_id=7))
+        registry.register(GroupConfig(group_id=-1008888888888, warning_topic_id=8))
+        statuses = {group_config.group_id: "left", -1009999999999: "member"}
+        complete_result = ProfileCheckResult(has_profile_photo=True, has_username=True)
+
+        async def fake_status(bot, group_id, user_id):
+            return statuses[group_id]
+
+        with (
+            patch("bot.handlers.dm.get_settings", return_value=mock_settings),
+            patch("bot.handlers.dm.get_group_registry", return_value=registry),
+            patch("bot.handlers.dm.get_user_status", side_effect=fake_status) as mock_status,
+            patch("bot.handlers.dm.check_user_profile", return_value=complete_result),
+        ):
+            await handle_dm(mock_update, mock_context)
+
+        assert mock_status.call_count == 2
+        call_args = mock_update.message.reply_text.call_args
+        assert "tidak memiliki pembatasan dari bot" in call_args.args[0]
+
+    async def test_only_queries_groups_with_bot_restriction(
+        self, mock_update, mock_context, mock_settings, group_config, temp_db
+    ):
+        from bot.database.service import get_database
+
+        db = get_database()
+        db.get_or_create_user_warning(12345, group_config.group_id)
+        db.mark_user_restricted(12345, group_config.group_id)
+
+        registry = GroupRegistry()
+        registry.register(group_config)
+        registry.register(GroupConfig(group_id=-1009999999999, warning_topic_id=7))
+        complete_result = ProfileCheckResult(has_profile_photo=True, has_username=True)
+
+        with (
+            patch("bot.handlers.dm.get_settings", return_value=mock_settings),
+            patch("bot.handlers.dm.get_group_registry", return_value=registry),
+            patch(
+                "bot.handlers.dm.get_user_status",
+                new_callable=AsyncMock,
+                return_value="restricted",
+            ) as mock_status,
+            patch("bot.handlers.dm.check_user_profile", return_value=complete_result),
+            patch("bot.handlers.dm.unrestrict_user", new_callable=AsyncMock),
+        ):
+            await handle_dm(mock_update, mock_context)
+
+        mock_status.assert_called_once_with(mock_context.bot, group_config.group_id, 12345)
+        assert db.is_user_restricted_by_bot(12345, group_config.group_id) is False
+
     async def test_user_kicked_from_group(
         self, mock_update, mock_context, mock_settings, mock_registry, temp_db
     ):
@@ -264,6 +319,44 @@ class TestHandleDM:
 
         assert db.is_user_restricted_by_bot(12345, -1001234567890) is False
 
+    async def test_notification_failure_does_not_block_success_reply(
+        self, mock_update, mock_context, mock_settings, mock_registry, temp_db
+    ):
+        from bot.database.service import get_database
+
+        db = get_database()
+        db.get_or_create_user_warning(12345, -1001234567890)
+        db.mark_user_restricted(12345, -1001234567890)
+        mock_context.bot.send_message.side_effect = Exception("topic closed")
+
+        complete_result = ProfileCheckResult(
+            has_profile_photo=True, has_username=True
+        )
+
+        with (
+            patch("bot.handlers.dm.get_settings", return_value=mock_settings),
+            patch("bot.handlers.dm.get_group_registry", return_value=mock_registry),
+            patch(
+                "bot.handlers.dm.get_user_status",
+                new_callable=AsyncMock,
+                return_value="restricted",
+            ),
+            patch(
+                "bot.handlers.dm.check_user_profile",
+                return_value=complete_result,
+            ),
+            patch(
+                "bot.handlers.dm.unrestrict_user",
+                new_callable=AsyncMock,
+            ),
+        ):
+            await handle_dm(mock_update, mock_context)
+
+        mock_context.bot.send_message.assert_called_once()
+        reply_args = mock_update.message.reply_text.call_args
+        assert "dicabut" in reply_args.args[0]
+        assert db.is_user_restricted_by_bot(12345, -1001234567890) is False
+
     async def test_user_already_unrestricted_on_telegram(
         self, mock_update, mock_context, mock_settings, mock_registry, temp_db
     ):
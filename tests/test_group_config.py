@@ -1,6 +1,7 @@
 """Tests for the group_config module."""
 
 import json
+import os
 import tempfile
 from datetime import timedelta
 from unittest.mock import MagicMock, patch
@@ -76,6 +77,11 @@ class TestGroupConfig:
         gc = GroupConfig(group_id=-1, warning_topic_id=42, new_user_probation_hours=0)
         assert gc.new_user_probation_hours == 0
 
+    def test_is_frozen(self):
+        gc = GroupConfig(group_id=-1, warning_topic_id=42)
+        with pytest.raises(ValidationError):
+            gc.warning_threshold = 10
+
     def test_probation_timedelta(self):
         gc = GroupConfig(group_id=-1, warning_topic_id=42, new_user_probation_hours=72)
         assert gc.probation_timedelta == timedelta(hours=72)
@@ -88,6 +94,16 @@ class TestGroupConfig:
         gc = GroupConfig(group_id=-1, warning_topic_id=42, captcha_timeout_seconds=120)
         assert gc.captcha_timeout_timedelta == timedelta(seconds=120)
 
+    def test_warning_time_threshold_display(self):
+        assert GroupConfig(group_id=-1, warning_topic_id=42, warning_time_threshold_minutes=180).warning_time_threshold_display == "3 jam"
+        assert GroupConfig(group_id=-1, warning_topic_id=42, warning_time_threshold_minutes=30).warning_time_threshold_display == "30 menit"
+
+    def test_timedeltas_computed_once(self):
+        gc = GroupConfig(group_id=-1, warning_topic_id=42)
+        assert gc.probation_timedelta is gc.probation_timedelta
+        assert gc.warning_time_threshold_timedelta is gc.warning_time_threshold_timedelta
+        assert gc.captcha_timeout_timedelta is gc.captcha_timeout_timedelta
+
 
 class TestGroupRegistry:
     def test_register_and_get(self):
@@ -127,7 +143,7 @@ class TestGroupRegistry:
 
     def test_empty_registry(self):
         registry = GroupRegistry()
-        assert registry.all_groups() == []
+        assert list(registry.all_groups()) == []
         assert registry.get(-100) is None
         assert registry.is_monitored(-100) is False
 
@@ -167,6 +183,27 @@ class TestLoadGroupsFromJson:
         assert configs[0].restrict_failed_users is True
         assert configs[0].warning_threshold == 5
 
+    def test_unchanged_file_is_cached(self, tmp_path):
+        path = tmp_path / "groups.json"
+        path.write_text(json.dumps([{"group_id": -100, "warning_topic_id": 1}]))
+
+        first = load_groups_from_json(str(path))
+        second = load_groups_from_json(str(path))
+
+        assert first[0] is second[0]
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        path = tmp_path / "groups.json"
+        path.write_text(json.dumps([{"group_id": -100, "warning_topic_id": 1}]))
+        load_groups_from_json(str(path))
+
+        path.write_text(json.dumps([{"group_id": -200, "warning_topic_id": 2}]))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        configs = load_groups_from_json(str(path))
+        assert configs[0].group_id == -200
+
     def test_file_not_found(self):
         with pytest.raises(FileNotFoundError):
             load_groups_from_json("/nonexistent/path.json")
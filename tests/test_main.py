@@ -0,0 +1,16 @@
+import importlib
+
+from telegram import Update
+
+
+class TestMainModule:
+    def test_module_imports(self):
+        main = importlib.import_module("bot.main")
+
+        assert callable(main.main)
+        assert callable(main.configure_logging)
+
+    def test_allowed_updates_cover_handled_types(self):
+        from bot.main import ALLOWED_UPDATES
+
+        assert set(ALLOWED_UPDATES) == {Update.MESSAGE, Update.CALLBACK_QUERY, Update.CHAT_MEMBER}
@@ -1,13 +1,22 @@
+import asyncio
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from telegram.error import BadRequest, Forbidden
 
 from bot.database.service import init_database, reset_database
 from bot.group_config import GroupConfig
-from bot.handlers.message import handle_message
-from bot.services.user_checker import ProfileCheckResult
+from bot.handlers.message import _get_user_lock, handle_message
+from bot.services.user_checker import ProfileCheckResult, clear_profile_photo_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_profile_photo_cache():
+    clear_profile_photo_cache()
+    yield
+    clear_profile_photo_cache()
 
 
 @pytest.fixture
@@ -284,6 +293,30 @@ class TestHandleMessageWithProgressiveRestriction:
         assert "🚫" in call_args.kwargs["text"]
         assert "dibatasi" in call_args.kwargs["text"]
 
+    async def test_threshold_of_one_sends_only_restriction_notice(
+        self, mock_update, mock_context, group_config_with_restriction, temp_db
+    ):
+        group_config = group_config_with_restriction.model_copy(update={"warning_threshold": 1})
+        incomplete_result = ProfileCheckResult(
+            has_profile_photo=False, has_username=True
+        )
+
+        with (
+            patch(
+                "bot.handlers.message.get_group_config_for_update",
+                return_value=group_config,
+            ),
+            patch(
+                "bot.handlers.message.check_user_profile",
+                return_value=incomplete_result,
+            ),
+        ):
+            await handle_message(mock_update, mock_context)
+
+        mock_context.bot.restrict_chat_member.assert_called_once()
+        mock_context.bot.send_message.assert_called_once()
+        assert "🚫" in mock_context.bot.send_message.call_args.kwargs["text"]
+
     async def test_no_restriction_when_disabled(
         self, mock_update, mock_context, group_config
     ):
@@ -336,6 +369,42 @@ class TestHandleMessageWithProgressiveRestriction:
         assert "⚠️" in mock_context.bot.send_message.call_args.kwargs["text"]
 
 
+class TestHandleMessageProfilePhotoCache:
+    async def test_cached_complete_profile_skips_check(
+        self, mock_update, mock_context, group_config
+    ):
+        with (
+            patch("bot.handlers.message.get_group_config_for_update", return_value=group_config),
+            patch("bot.handlers.message.has_recently_confirmed_photo", return_value=True),
+            patch("bot.handlers.message.check_user_profile") as mock_check,
+        ):
+            await handle_message(mock_update, mock_context)
+
+        mock_check.assert_not_called()
+        mock_context.bot.send_message.assert_not_called()
+
+    async def test_cached_photo_without_username_still_checked(
+        self, mock_update, mock_context, group_config
+    ):
+        mock_update.message.from_user.username = None
+        incomplete_result = ProfileCheckResult(
+            has_profile_photo=True, has_username=False
+        )
+
+        with (
+            patch("bot.handlers.message.get_group_config_for_update", return_value=group_config),
+            patch("bot.handlers.message.has_recently_confirmed_photo", return_value=True),
+            patch(
+                "bot.handlers.message.check_user_profile",
+                return_value=incomplete_result,
+            ) as mock_check,
+        ):
+            await handle_message(mock_update, mock_context)
+
+        mock_check.assert_called_once()
+        mock_context.bot.send_message.assert_called_once()
+
+
 class TestHandleMessageErrorHandling:
     async def test_send_warning_message_fails(self, mock_update, mock_context, group_config):
         """Test when sending warning message fails (lines 110-111)."""
@@ -421,3 +490,143 @@ class TestHandleMessageErrorHandling:
 
         # restrict_chat_member should have been called and failed
         mock_context.bot.restrict_chat_member.assert_called_once()
+
+    async def test_forbidden_warning_logged_without_traceback(
+        self, mock_update, mock_context, group_config, caplog
+    ):
+        """Expected Telegram refusals are logged as warnings, not errors."""
+        incomplete_result = ProfileCheckResult(
+            has_profile_photo=False, has_username=True
+        )
+        mock_context.bot.send_message.side_effect = Forbidden("bot was kicked")
+
+        with (
+            patch("bot.handlers.message.get_group_config_for_update", return_value=group_config),
+            patch(
+                "bot.handlers.message.check_user_profile",
+                return_value=incomplete_result,
+            ),
+        ):
+            await handle_message(mock_update, mock_context)
+
+        records = [r for r in caplog.records if r.name == "bot.handlers.message"]
+        assert any(r.levelname == "WARNING" and r.exc_info is None for r in records)
+        assert not any(r.levelname == "ERROR" for r in records)
+
+    @pytest.mark.parametrize(
+        "error", [Forbidden("bot was kicked"), BadRequest("Chat not found")]
+    )
+    async def test_first_warning_refusal_logged_without_traceback(
+        self, mock_update, mock_context, temp_db, caplog, error
+    ):
+        """A refused first warning in restriction mode is logged as a plain warning."""
+        gc = GroupConfig(
+            group_id=-1001234567890,
+            warning_topic_id=42,
+            restrict_failed_users=True,
+            warning_threshold=3,
+            warning_time_threshold_minutes=180,
+            rules_link="https://example.com/rules",
+        )
+        incomplete_result = ProfileCheckResult(
+            has_profile_photo=False, has_username=True
+        )
+        mock_context.bot.send_message.side_effect = error
+
+        with (
+            patch("bot.handlers.message.get_group_config_for_update", return_value=gc),
+            patch(
+                "bot.handlers.message.check_user_profile",
+                return_value=incomplete_result,
+            ),
+        ):
+            await handle_message(mock_update, mock_context)
+
+        records = [r for r in caplog.records if r.name == "bot.handlers.message"]
+        warnings = [r for r in records if r.levelname == "WARNING"]
+        assert len(warnings) == 1
+        assert "Failed to send first warning" in warnings[0].getMessage()
+        assert warnings[0].exc_info is None
+        assert not any(r.levelname == "ERROR" for r in records)
+
+    @pytest.mark.parametrize(
+        "error", [Forbidden("bot was kicked"), BadRequest("Not enough rights")]
+    )
+    async def test_restriction_notice_refusal_logged_without_traceback(
+        self, mock_update, mock_context, temp_db, caplog, error
+    ):
+        """A refused restriction notice is logged as a plain warning."""
+        gc = GroupConfig(
+            group_id=-1001234567890,
+            warning_topic_id=42,
+            restrict_failed_users=True,
+            warning_threshold=1,
+            warning_time_threshold_minutes=180,
+            rules_link="https://example.com/rules",
+        )
+        incomplete_result = ProfileCheckResult(
+            has_profile_photo=False, has_username=True
+        )
+        mock_context.bot.send_message.side_effect = error
+
+        with (
+            patch("bot.handlers.message.get_group_config_for_update", return_value=gc),
+            patch(
+                "bot.handlers.message.check_user_profile",
+                return_value=incomplete_result,
+            ),
+            patch(
+                "bot.handlers.message.BotInfoCache.get_dm_link",
+                AsyncMock(return_value="https://t.me/testbot"),
+            ),
+        ):
+            await handle_message(mock_update, mock_context)
+
+        mock_context.bot.restrict_chat_member.assert_called_once()
+        records = [r for r in caplog.records if r.name == "bot.handlers.message"]
+        warnings = [r for r in records if r.levelname == "WARNING"]
+        assert len(warnings) == 1
+        assert "Failed to restrict user" in warnings[0].getMessage()
+        assert warnings[0].exc_info is None
+        assert not any(r.levelname == "ERROR" for r in records)
+
+
+class TestUserLocks:
+    def test_same_user_and_group_share_a_lock(self):
+        lock = _get_user_lock(-1001234567890, 12345)
+
+        assert _get_user_lock(-1001234567890, 12345) is lock
+        assert _get_user_lock(-1001234567890, 67890) is not lock
+        assert _get_user_lock(-100999, 12345) is not lock
+
+    async def test_messages_from_one_user_are_processed_in_order(
+        self, mock_update, mock_context, temp_db
+    ):
+        gc = GroupConfig(
+            group_id=-1001234567890,
+            warning_topic_id=42,
+            restrict_failed_users=True,
+            warning_threshold=3,
+        )
+        incomplete_result = ProfileCheckResult(
+            has_profile_photo=False, has_username=True
+        )
+        active = 0
+        max_active = 0
+
+        async def slow_check(bot, user):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return incomplete_result
+
+        with (
+            patch("bot.handlers.message.get_group_config_for_update", return_value=gc),
+            patch("bot.handlers.message.check_user_profile", side_effect=slow_check),
+        ):
+            await asyncio.gather(*(handle_message(mock_update, mock_context) for _ in range(3)))
+
+        assert max_active == 1
+        mock_context.bot.restrict_chat_member.assert_called_once()
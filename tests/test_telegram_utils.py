@@ -293,6 +293,19 @@ class TestUnrestrictUser:
             permissions=mock_permissions,
         )
 
+    async def test_unrestrict_user_uses_current_group_permissions(self, mock_bot):
+        """Test that each unrestriction applies the group's current permissions."""
+        old_chat = MagicMock()
+        new_chat = MagicMock()
+        mock_bot.get_chat.side_effect = [old_chat, new_chat]
+
+        await unrestrict_user(mock_bot, group_id=123, user_id=456)
+        await unrestrict_user(mock_bot, group_id=123, user_id=789)
+
+        assert mock_bot.get_chat.call_count == 2
+        last_call = mock_bot.restrict_chat_member.call_args
+        assert last_call.kwargs["permissions"] is new_chat.permissions
+
     async def test_unrestrict_user_raises_bad_request(self, mock_bot):
         """Test that BadRequest is raised when user not found."""
         mock_bot.get_chat.side_effect = BadRequest("User not found")
@@ -3,7 +3,24 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from bot.group_config import GroupConfig
-from bot.handlers.topic_guard import guard_warning_topic
+from bot.handlers.topic_guard import WarningTopicFilter, guard_warning_topic
+from bot.services.admin_cache import AdminCache
+
+
+@pytest.fixture(autouse=True)
+def reset_admin_cache():
+    AdminCache.reset()
+    yield
+    AdminCache.reset()
+
+
+def _admins(*user_ids):
+    admins = []
+    for user_id in user_ids:
+        admin = MagicMock()
+        admin.user.id = user_id
+        admins.append(admin)
+    return admins
 
 
 @pytest.fixture
@@ -43,7 +60,7 @@ class TestGuardWarningTopic:
 
         await guard_warning_topic(update, mock_context)
 
-        mock_context.bot.get_chat_member.assert_not_called()
+        mock_context.bot.get_chat_administrators.assert_not_called()
 
     async def test_no_user(self, mock_context):
         update = MagicMock()
@@ -52,7 +69,7 @@ class TestGuardWarningTopic:
 
         await guard_warning_topic(update, mock_context)
 
-        mock_context.bot.get_chat_member.assert_not_called()
+        mock_context.bot.get_chat_administrators.assert_not_called()
 
     async def test_wrong_group_ignored(self, mock_update, mock_context):
         mock_update.effective_chat.id = -100999999
@@ -60,7 +77,7 @@ class TestGuardWarningTopic:
         with patch("bot.handlers.topic_guard.get_group_config_for_update", return_value=None):
             await guard_warning_topic(mock_update, mock_context)
 
-        mock_context.bot.get_chat_member.assert_not_called()
+        mock_context.bot.get_chat_administrators.assert_not_called()
         mock_update.message.delete.assert_not_called()
 
     async def test_different_topic_ignored(
@@ -71,7 +88,7 @@ class TestGuardWarningTopic:
         with patch("bot.handlers.topic_guard.get_group_config_for_update", return_value=group_config):
             await guard_warning_topic(mock_update, mock_context)
 
-        mock_context.bot.get_chat_member.assert_not_called()
+        mock_context.bot.get_chat_administrators.assert_not_called()
         mock_update.message.delete.assert_not_called()
 
     async def test_bot_message_allowed(self, mock_update, mock_context, group_config):
@@ -80,60 +97,51 @@ class TestGuardWarningTopic:
         with patch("bot.handlers.topic_guard.get_group_config_for_update", return_value=group_config):
             await guard_warning_topic(mock_update, mock_context)
 
-        mock_context.bot.get_chat_member.assert_not_called()
+        mock_context.bot.get_chat_administrators.assert_not_called()
         mock_update.message.delete.assert_not_called()
 
     async def test_admin_message_allowed(
         self, mock_update, mock_context, group_config
     ):
-        chat_member = MagicMock()
-        chat_member.status = "administrator"
-        mock_context.bot.get_chat_member.return_value = chat_member
+        mock_context.bot.get_chat_administrators.return_value = _admins(12345)
 
         with patch("bot.handlers.topic_guard.get_group_config_for_update", return_value=group_config):
             await guard_warning_topic(mock_update, mock_context)
 
-        mock_context.bot.get_chat_member.assert_called_once_with(
-            chat_id=-1001234567890,
-            user_id=12345,
-        )
+        mock_context.bot.get_chat_administrators.assert_called_once_with(-1001234567890)
         mock_update.message.delete.assert_not_called()
 
-    async def test_creator_message_allowed(
+    async def test_admin_list_cached_across_messages(
         self, mock_update, mock_context, group_config
     ):
-        chat_member = MagicMock()
-        chat_member.status = "creator"
-        mock_context.bot.get_chat_member.return_value = chat_member
+        mock_context.bot.get_chat_administrators.return_value = _admins(12345)
 
         with patch("bot.handlers.topic_guard.get_group_config_for_update", return_value=group_config):
             await guard_warning_topic(mock_update, mock_context)
+            await guard_warning_topic(mock_update, mock_context)
 
+        mock_context.bot.get_chat_administrators.assert_called_once()
         mock_update.message.delete.assert_not_called()
 
     async def test_regular_user_message_deleted(
         self, mock_update, mock_context, group_config
     ):
-        chat_member = MagicMock()
-        chat_member.status = "member"
-        mock_context.bot.get_chat_member.return_value = chat_member
+        mock_context.bot.get_chat_administrators.return_value = _admins(67890)
 
         with patch("bot.handlers.topic_guard.get_group_config_for_update", return_value=group_config):
             await guard_warning_topic(mock_update, mock_context)
 
         mock_update.message.delete.assert_called_once()
 
-    async def test_restricted_user_message_deleted(
+    async def test_admin_lookup_failure_keeps_message(
         self, mock_update, mock_context, group_config
     ):
-        chat_member = MagicMock()
-        chat_member.status = "restricted"
-        mock_context.bot.get_chat_member.return_value = chat_member
+        mock_context.bot.get_chat_administrators.side_effect = Exception("Bot not in group")
 
         with patch("bot.handlers.topic_guard.get_group_config_for_update", return_value=group_config):
             await guard_warning_topic(mock_update, mock_context)
 
-        mock_update.message.delete.assert_called_once()
+        mock_update.message.delete.assert_not_called()
 
 
 class TestGuardWarningTopicErrorHandling:
@@ -141,9 +149,7 @@ class TestGuardWarningTopicErrorHandling:
         self, mock_update, mock_context, group_config
     ):
         """Test when update.message.delete() raises an exception (lines 91-92)."""
-        chat_member = MagicMock()
-        chat_member.status = "member"
-        mock_context.bot.get_chat_member.return_value = chat_member
+        mock_context.bot.get_chat_administrators.return_value = _admins(67890)
         mock_update.message.delete.side_effect = Exception("test error")
 
         with patch("bot.handlers.topic_guard.get_group_config_for_update", return_value=group_config):
@@ -151,3 +157,27 @@ class TestGuardWarningTopicErrorHandling:
             await guard_warning_topic(mock_update, mock_context)
 
         mock_update.message.delete.assert_called_once()
+
+
+class TestWarningTopicFilter:
+    def _message(self, chat_id, thread_id):
+        message = MagicMock()
+        message.chat.id = chat_id
+        message.message_thread_id = thread_id
+        return message
+
+    def test_matches_warning_topic(self, group_config):
+        topic_filter = WarningTopicFilter([group_config])
+
+        assert topic_filter.filter(self._message(-1001234567890, 42)) is True
+
+    def test_rejects_other_topic(self, group_config):
+        topic_filter = WarningTopicFilter([group_config])
+
+        assert topic_filter.filter(self._message(-1001234567890, 99)) is False
+        assert topic_filter.filter(self._message(-1001234567890, None)) is False
+
+    def test_rejects_other_group_with_same_topic_id(self, group_config):
+        topic_filter = WarningTopicFilter([group_config])
+
+        assert topic_filter.filter(self._message(-1009999999999, 42)) is False
@@ -1,7 +1,23 @@
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 
-from bot.services.user_checker import ProfileCheckResult, check_user_profile
+from bot.constants import MISSING_ITEMS_SEPARATOR, MISSING_ITEMS_TEXTS
+from bot.services.user_checker import (
+    PROFILE_PHOTO_CACHE_TTL_SECONDS,
+    ProfileCheckResult,
+    _photo_confirmed_at,
+    check_user_profile,
+    clear_profile_photo_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_photo_cache():
+    clear_profile_photo_cache()
+    yield
+    clear_profile_photo_cache()
 
 
 class TestProfileCheckResult:
@@ -37,6 +53,14 @@ class TestProfileCheckResult:
         result = ProfileCheckResult(has_profile_photo=False, has_username=False)
         assert result.get_missing_items() == ["foto profil publik", "username"]
 
+    @pytest.mark.parametrize("has_photo", [True, False])
+    @pytest.mark.parametrize("has_username", [True, False])
+    def test_missing_mask_text_matches_missing_items(self, has_photo, has_username):
+        result = ProfileCheckResult(has_profile_photo=has_photo, has_username=has_username)
+        assert MISSING_ITEMS_TEXTS[result.missing_mask] == MISSING_ITEMS_SEPARATOR.join(
+            result.get_missing_items()
+        )
+
 
 class TestCheckUserProfile:
     async def test_user_with_photo_and_username(self):
@@ -194,3 +218,89 @@ class TestCheckUserProfileErrorHandling:
             bot.get_user_profile_photos.assert_called_once_with(12345, limit=1)
 
             reset_database()
+
+
+class TestProfilePhotoCache:
+    @pytest.fixture(autouse=True)
+    def temp_db(self, tmp_path):
+        from bot.database.service import init_database, reset_database
+
+        init_database(str(tmp_path / "test.db"))
+        yield
+        reset_database()
+
+    @staticmethod
+    def _bot_with_photo_count(count: int) -> AsyncMock:
+        bot = AsyncMock()
+        photos = MagicMock()
+        photos.total_count = count
+        bot.get_user_profile_photos.return_value = photos
+        return bot
+
+    @staticmethod
+    def _user() -> MagicMock:
+        user = MagicMock()
+        user.id = 12345
+        user.username = "testuser"
+        return user
+
+    async def test_confirmed_photo_is_cached(self):
+        bot = self._bot_with_photo_count(1)
+        user = self._user()
+
+        await check_user_profile(bot, user)
+        result = await check_user_profile(bot, user)
+
+        assert result.has_profile_photo is True
+        bot.get_user_profile_photos.assert_called_once()
+
+    async def test_missing_photo_is_not_cached(self):
+        bot = self._bot_with_photo_count(0)
+        user = self._user()
+
+        await check_user_profile(bot, user)
+        await check_user_profile(bot, user)
+
+        assert bot.get_user_profile_photos.call_count == 2
+
+    async def test_cached_photo_expires_after_ttl(self):
+        bot = self._bot_with_photo_count(1)
+        user = self._user()
+
+        with patch("bot.services.user_checker.time.monotonic", return_value=1000.0):
+            await check_user_profile(bot, user)
+        with patch(
+            "bot.services.user_checker.time.monotonic",
+            return_value=1000.0 + PROFILE_PHOTO_CACHE_TTL_SECONDS,
+        ):
+            await check_user_profile(bot, user)
+
+        assert bot.get_user_profile_photos.call_count == 2
+
+    async def test_expired_confirmations_are_evicted_on_insert(self):
+        bot = self._bot_with_photo_count(1)
+        first, second = self._user(), self._user()
+        second.id = 67890
+
+        with patch("bot.services.user_checker.time.monotonic", return_value=1000.0):
+            await check_user_profile(bot, first)
+        with patch(
+            "bot.services.user_checker.time.monotonic",
+            return_value=1000.0 + PROFILE_PHOTO_CACHE_TTL_SECONDS,
+        ):
+            await check_user_profile(bot, second)
+
+        assert set(_photo_confirmed_at) == {67890}
+
+    async def test_concurrent_checks_share_one_lookup(self):
+        bot = self._bot_with_photo_count(0)
+        user = self._user()
+
+        results = await asyncio.gather(
+            check_user_profile(bot, user),
+            check_user_profile(bot, user),
+            check_user_profile(bot, user),
+        )
+
+        assert all(r.has_profile_photo is False for r in results)
+        bot.get_user_profile_photos.assert_called_once()
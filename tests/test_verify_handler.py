@@ -1,3 +1,4 @@
+import asyncio
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -7,8 +8,13 @@ import pytest
 from bot.database.service import get_database, init_database, reset_database
 from bot.group_config import GroupConfig, GroupRegistry
 from bot.handlers.verify import (
+    UNVERIFY_CALLBACK_PATTERN,
+    VERIFICATION_CALLBACK_PATTERN,
+    VERIFY_CALLBACK_PATTERN,
     handle_unverify_callback,
     handle_unverify_command,
+    handle_verification_callback,
+    handle_verify_bulk_command,
     handle_verify_callback,
     handle_verify_command,
 )
@@ -311,6 +317,33 @@ class TestHandleVerifyCommand:
         assert "@verified_user" in call_kwargs["text"]
         assert call_kwargs["parse_mode"] == "Markdown"
 
+    async def test_verify_fetches_user_info_once_across_groups(
+        self, mock_update, mock_context, temp_db, monkeypatch
+    ):
+        """Test that the clearance mention reuses one user lookup for every group."""
+        groups = [
+            GroupConfig(group_id=-1001111111111, warning_topic_id=1),
+            GroupConfig(group_id=-1002222222222, warning_topic_id=2),
+        ]
+        registry = GroupRegistry()
+        for gc in groups:
+            registry.register(gc)
+        monkeypatch.setattr("bot.handlers.verify.get_group_registry", lambda: registry)
+
+        target_user_id = 78787878
+        db = get_database()
+        for gc in groups:
+            db.get_or_create_user_warning(target_user_id, gc.group_id)
+
+        mock_context.args = [str(target_user_id)]
+        await handle_verify_command(mock_update, mock_context)
+
+        assert mock_context.bot.send_message.call_count == 2
+        user_lookups = [
+            c for c in mock_context.bot.get_chat.call_args_list if c.args == (target_user_id,)
+        ]
+        assert len(user_lookups) == 1
+
     async def test_verify_handles_non_restricted_user_gracefully(
         self, mock_update, mock_context, temp_db, monkeypatch
     ):
@@ -389,6 +422,117 @@ class TestHandleVerifyCommand:
         mock_context.bot.send_message.assert_not_called()
 
 
+class TestHandleVerifyBulkCommand:
+    async def test_missing_args_shows_usage(self, mock_update, mock_context):
+        mock_context.args = []
+
+        await handle_verify_bulk_command(mock_update, mock_context)
+
+        assert "/verify_bulk" in mock_update.message.reply_text.call_args.args[0]
+
+    async def test_non_numeric_arg_rejected(self, mock_update, mock_context):
+        mock_context.args = ["123", "abc"]
+
+        await handle_verify_bulk_command(mock_update, mock_context)
+
+        assert "harus berupa angka" in mock_update.message.reply_text.call_args.args[0]
+        assert not get_database().is_user_photo_whitelisted(123)
+
+    async def test_non_admin_rejected(self, mock_update, mock_context):
+        mock_update.message.from_user.id = 99999
+        mock_context.args = ["123"]
+
+        await handle_verify_bulk_command(mock_update, mock_context)
+
+        assert "izin" in mock_update.message.reply_text.call_args.args[0]
+        assert not get_database().is_user_photo_whitelisted(123)
+
+    async def test_verifies_all_and_reports_skipped(
+        self, mock_update, mock_context, temp_db, monkeypatch
+    ):
+        gc = GroupConfig(group_id=-1001234567890, warning_topic_id=12345)
+        registry = GroupRegistry()
+        registry.register(gc)
+        monkeypatch.setattr("bot.handlers.verify.get_group_registry", lambda: registry)
+
+        db = get_database()
+        db.add_photo_verification_whitelist(user_id=333, verified_by_admin_id=1)
+        db.get_or_create_user_warning(user_id=111, group_id=gc.group_id)
+        mock_context.args = ["111", "222", "333"]
+
+        await handle_verify_bulk_command(mock_update, mock_context)
+
+        reply = mock_update.message.reply_text.call_args.args[0]
+        assert "2 user telah diverifikasi" in reply
+        assert "Sudah ada di whitelist: 333" in reply
+        assert db.is_user_photo_whitelisted(111)
+        assert db.is_user_photo_whitelisted(222)
+        # Both new users are unrestricted; only the warned one gets a notice
+        assert mock_context.bot.restrict_chat_member.call_count == 2
+        mock_context.bot.send_message.assert_called_once()
+
+    async def test_no_message(self, mock_context):
+        update = MagicMock()
+        update.message = None
+
+        await handle_verify_bulk_command(update, mock_context)
+
+        mock_context.bot.restrict_chat_member.assert_not_called()
+
+    async def test_non_private_chat_rejected(self, mock_update, mock_context):
+        mock_update.effective_chat.type = "group"
+        mock_context.args = ["123"]
+
+        await handle_verify_bulk_command(mock_update, mock_context)
+
+        assert "chat pribadi" in mock_update.message.reply_text.call_args.args[0]
+        assert not get_database().is_user_photo_whitelisted(123)
+
+    async def test_logs_successful_bulk_verification(
+        self, mock_update, mock_context, monkeypatch, caplog
+    ):
+        monkeypatch.setattr("bot.handlers.verify.get_group_registry", GroupRegistry)
+        mock_context.args = ["111", "222"]
+
+        with caplog.at_level("INFO", logger="bot.handlers.verify"):
+            await handle_verify_bulk_command(mock_update, mock_context)
+
+        assert "Admin 12345 (Admin User) bulk whitelisted 2 user(s)" in caplog.text
+
+    async def test_concurrent_verification_reports_conflict(
+        self, mock_update, mock_context, monkeypatch
+    ):
+        monkeypatch.setattr("bot.handlers.verify.get_group_registry", GroupRegistry)
+        mock_context.args = ["111"]
+
+        with patch.object(
+            get_database(),
+            "verify_users_bulk",
+            side_effect=ValueError("One or more users were already whitelisted"),
+        ):
+            await handle_verify_bulk_command(mock_update, mock_context)
+
+        reply = mock_update.message.reply_text.call_args.args[0]
+        assert "diverifikasi oleh admin lain" in reply
+
+    async def test_unexpected_error_reports_internal_error(
+        self, mock_update, mock_context, monkeypatch, caplog
+    ):
+        monkeypatch.setattr("bot.handlers.verify.get_group_registry", GroupRegistry)
+        mock_context.args = ["111"]
+
+        with (
+            patch.object(
+                get_database(), "verify_users_bulk", side_effect=RuntimeError("disk I/O error")
+            ),
+            caplog.at_level("ERROR", logger="bot.handlers.verify"),
+        ):
+            await handle_verify_bulk_command(mock_update, mock_context)
+
+        assert "kesalahan internal" in mock_update.message.reply_text.call_args.args[0]
+        assert "Error during /verify_bulk command" in caplog.text
+
+
 class TestHandleUnverifyCommand:
     async def test_no_message(self, mock_context):
         update = MagicMock()
@@ -563,6 +707,33 @@ class TestHandleVerifyCallback:
         call_args = query.edit_message_text.call_args
         assert "izin" in call_args.args[0]
 
+    async def test_answer_does_not_block_handler(self, mock_context):
+        answered = asyncio.Event()
+
+        async def slow_answer():
+            await answered.wait()
+
+        update = MagicMock()
+        query = MagicMock()
+        query.from_user.id = 99999
+        query.from_user.full_name = "Non Admin"
+        query.data = "verify:555666"
+        query.answer = AsyncMock(side_effect=slow_answer)
+        query.edit_message_text = AsyncMock()
+        update.callback_query = query
+        mock_context.bot_data = {"admin_ids": [12345]}
+
+        handler = asyncio.create_task(handle_verify_callback(update, mock_context))
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        query.edit_message_text.assert_called_once()
+        assert not handler.done()
+
+        answered.set()
+        await handler
+        query.answer.assert_awaited_once()
+
     async def test_invalid_callback_data_format(self, mock_context):
         update = MagicMock()
         query = MagicMock()
@@ -581,6 +752,29 @@ class TestHandleVerifyCallback:
         call_args = query.edit_message_text.call_args
         assert "tidak valid" in call_args.args[0]
 
+    def test_callback_patterns(self):
+        assert VERIFY_CALLBACK_PATTERN.match("verify:123")["user_id"] == "123"
+        assert UNVERIFY_CALLBACK_PATTERN.match("unverify:123")["user_id"] == "123"
+        assert VERIFY_CALLBACK_PATTERN.match("unverify:123") is None
+        assert VERIFY_CALLBACK_PATTERN.match("verify:invalid") is None
+        assert UNVERIFY_CALLBACK_PATTERN.match("unverify:123:extra") is None
+        assert VERIFICATION_CALLBACK_PATTERN.match("verify:123")
+        assert VERIFICATION_CALLBACK_PATTERN.match("unverify:123")
+        assert VERIFICATION_CALLBACK_PATTERN.match("reverify:123") is None
+
+    @pytest.mark.parametrize(
+        ("data", "target"),
+        [("verify:123", "handle_verify_callback"), ("unverify:123", "handle_unverify_callback")],
+    )
+    async def test_verification_callback_dispatches_on_verb(self, mock_context, data, target):
+        update = MagicMock()
+        update.callback_query.data = data
+
+        with patch(f"bot.handlers.verify.{target}", new_callable=AsyncMock) as handler:
+            await handle_verification_callback(update, mock_context)
+
+        handler.assert_awaited_once_with(update, mock_context)
+
     async def test_successful_verify_callback(self, temp_db, mock_context, monkeypatch):
         gc = GroupConfig(group_id=-1001234567890, warning_topic_id=12345)
         registry = GroupRegistry()
@@ -653,6 +847,29 @@ class TestHandleVerifyCallback:
         query.edit_message_text.assert_called_once()
         call_args = query.edit_message_text.call_args
         assert "Terjadi kesalahan" in call_args.args[0]
+        assert "Registry error" not in call_args.args[0]
+
+    async def test_verify_callback_error_traceback_is_throttled(self, temp_db, mock_context):
+        update = MagicMock()
+        query = MagicMock()
+        query.from_user = MagicMock()
+        query.from_user.id = 12345
+        query.from_user.full_name = "Admin User"
+        query.data = "verify:555666"
+        query.answer = AsyncMock()
+        query.edit_message_text = AsyncMock()
+        update.callback_query = query
+
+        with (
+            patch.dict("bot.handlers.verify._last_traceback_at", clear=True),
+            patch("bot.handlers.verify.get_group_registry", side_effect=RuntimeError("Registry error")),
+            patch("bot.handlers.verify.logger") as mock_logger,
+        ):
+            await handle_verify_callback(update, mock_context)
+            await handle_verify_callback(update, mock_context)
+
+        mock_logger.exception.assert_called_once()
+        mock_logger.error.assert_called_once()
 
 
 class TestHandleUnverifyCallback: